@@ -4,11 +4,19 @@ Base client module handling core HTTP interactions with ChromaDB API.
 
 import json
 import logging
+import math
 import requests
 from typing import Dict, List, Any, Optional, Union, Tuple
 from urllib.parse import urljoin
 
-from chromalens.exceptions.api import APIError, NotFoundError, AuthenticationError
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from chromalens.models._validators import _get_np
+from chromalens.exceptions._backoff import TokenBucket, bucket_key
+from chromalens.exceptions.api import RateLimitError, from_status
 from chromalens.exceptions.client import ClientError
 from chromalens.config.settings import DEFAULT_TIMEOUT, DEFAULT_CHUNK_SIZE
 from chromalens.config.constants import API_V1, API_V2
@@ -16,6 +24,50 @@ from chromalens.config.constants import API_V1, API_V2
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy arrays and scalars for the stdlib JSON encoder."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Check a JSON body for NaN or infinite floats, including inside NumPy arrays."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    dtype = getattr(obj, 'dtype', None)
+    if dtype is not None and dtype.kind == 'f':
+        return not _get_np().isfinite(obj).all()
+    return False
+
+
+def _encode_json(data: Any) -> bytes:
+    """
+    Encode a request body as JSON.
+    
+    NumPy arrays (e.g. embeddings) are accepted anywhere in the body. With
+    ``orjson`` installed they are serialized straight from their buffers, with
+    no intermediate list of Python floats.
+    
+    Raises:
+        ValueError: If the body contains NaN or infinity, which JSON cannot
+            represent (orjson would send null and the stdlib encoder NaN)
+    """
+    if _has_non_finite(data):
+        raise ValueError("Request body contains NaN or infinite values, which are not valid JSON")
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits or non-contiguous arrays
+            pass
+    return json.dumps(data, default=_json_default, allow_nan=False).encode()
+
+
 class BaseClient:
     """
     Base client for ChromaDB API handling HTTP requests, authentication, and error handling.
@@ -34,6 +86,7 @@ class BaseClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: float = DEFAULT_TIMEOUT,
         verify_ssl: bool = True,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the base client.
@@ -47,6 +100,7 @@ class BaseClient:
             headers: Additional headers to include in all requests
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            session: HTTP session to send requests through (a new one by default)
         """
         self.host = host
         self.port = port
@@ -66,6 +120,13 @@ class BaseClient:
         # Add user-provided headers
         if headers:
             self.headers.update(headers)
+        
+        # One session for all requests, so connections are kept alive and reused
+        self.session = session if session is not None else requests.Session()
+    
+    def close(self) -> None:
+        """Close the client's HTTP session and its pooled connections."""
+        self.session.close()
     
     def _validate_response(self, response: requests.Response) -> None:
         """
@@ -77,6 +138,10 @@ class BaseClient:
         Raises:
             NotFoundError: If resource doesn't exist (404)
             AuthenticationError: If authentication failed (401/403)
+            ValidationError: If the request was rejected as invalid (400/422)
+            ConflictError: If the resource already exists (409)
+            RateLimitError: If the rate limit was exceeded (429)
+            ServerError: For server errors (5xx)
             APIError: For other API errors
         """
         if response.status_code >= 400:
@@ -93,12 +158,14 @@ class BaseClient:
                     error_msg += f": {response.text}"
             
             # Raise appropriate error based on status code
-            if response.status_code == 404:
-                raise NotFoundError(error_msg)
-            elif response.status_code in (401, 403):
-                raise AuthenticationError(error_msg)
-            else:
-                raise APIError(error_msg, status_code=response.status_code)
+            exc = from_status(response.status_code, error_msg, response=response)
+            if isinstance(exc, RateLimitError):
+                # Shared per-endpoint state so repeated 429s back off progressively
+                exc.bucket = TokenBucket.observe_429(bucket_key(response), exc.retry_after)
+            raise exc
+        
+        # Let an endpoint that was rate limited recover its request rate
+        TokenBucket.observe_success(bucket_key(response))
     
     def _build_url(self, endpoint: str, api_version: str = API_V2) -> str:
         """
@@ -163,12 +230,15 @@ class BaseClient:
         
         try:
             logger.debug(f"Making {method} request to {url}")
-            response = requests.request(
+            # Encode JSON bodies ourselves so they may contain NumPy arrays
+            if data is None and json_data is not None:
+                data = _encode_json(json_data)
+            
+            response = self.session.request(
                 method=method,
                 url=url,
                 params=params,
                 data=data,
-                json=json_data,
                 headers=request_headers,
                 timeout=timeout,
                 verify=self.verify_ssl
@@ -3,6 +3,7 @@ Main ChromaLens client implementation.
 """
 
 import logging
+import requests
 from typing import Dict, List, Any, Optional, Union, Tuple
 
 from chromalens.client.base import BaseClient
@@ -61,6 +62,7 @@ class ChromaLensClient(BaseClient):
         api_key: Optional[str] = None,
         timeout: Optional[float] = None,
         verify_ssl: Optional[bool] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the ChromaLens client.
@@ -74,6 +76,7 @@ class ChromaLensClient(BaseClient):
             api_key: API key for authentication
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            session: HTTP session to send requests through (a new one by default)
         """
         # Build settings from defaults, environment, and explicit params
         settings = get_settings()
@@ -110,6 +113,7 @@ class ChromaLensClient(BaseClient):
             headers=headers,
             timeout=settings.get("timeout"),
             verify_ssl=settings.get("verify_ssl", True),
+            session=session,
         )
         
         # Test connection during initialization if verify_connection is True
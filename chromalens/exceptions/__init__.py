@@ -10,6 +10,8 @@ from chromalens.exceptions.api import (
     ServerError,
     RateLimitError,
     ConflictError,
+    STATUS_TO_EXC,
+    from_status,
 )
 
 from chromalens.exceptions.client import (
@@ -30,6 +32,8 @@ __all__ = [
     'ServerError',
     'RateLimitError',
     'ConflictError',
+    'STATUS_TO_EXC',
+    'from_status',
     
     # Client Errors
     'ClientError',
@@ -0,0 +1,146 @@
+"""
+Adaptive client-side backoff state for rate-limited ChromaLens requests.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from urllib.parse import urlsplit
+
+# Initial and bounding request rates (requests per second)
+DEFAULT_RATE = 10.0
+MIN_RATE = 0.1
+MAX_RATE = 100.0
+
+# Multiplicative decrease applied on every 429, additive increase on success
+RATE_DECREASE = 0.5
+RATE_INCREASE = 1.0
+
+# Buckets by endpoint, least recently used first; bounded so a client that
+# hits many distinct paths does not grow it forever
+_buckets: "OrderedDict[Hashable, TokenBucket]" = OrderedDict()
+_buckets_lock = threading.Lock()
+MAX_BUCKETS = 256
+
+
+def bucket_key(response: Any = None) -> Hashable:
+    """
+    Build the bucket key (host, endpoint path) for a response.
+    
+    Args:
+        response: Raw HTTP response, if available
+        
+    Returns:
+        Key identifying the rate-limited endpoint
+    """
+    url = getattr(response, 'url', None)
+    if not url:
+        return None
+    parts = urlsplit(url)
+    return (parts.netloc, parts.path)
+
+
+class TokenBucket:
+    """Token bucket whose refill rate adapts to observed rate-limit responses."""
+    
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: float = 1.0):
+        """
+        Initialize the bucket.
+        
+        Args:
+            rate: Initial refill rate in tokens per second
+            capacity: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Record a rate-limit response: drain the bucket and decay the rate.
+        
+        Args:
+            retry_after: Server-provided wait in seconds, if any
+        """
+        with self._lock:
+            self._refill()
+            self.rate = max(MIN_RATE, self.rate * RATE_DECREASE)
+            if retry_after:
+                # Never refill faster than the server asked us to wait
+                self.rate = max(MIN_RATE, min(self.rate, 1.0 / retry_after))
+            self.tokens = 0.0
+    
+    def on_success(self) -> None:
+        """Record a successful request: recover the rate additively."""
+        with self._lock:
+            self.rate = min(MAX_RATE, self.rate + RATE_INCREASE)
+    
+    def next_delay(self) -> float:
+        """
+        Get the wait until the next token is available.
+        
+        Returns:
+            Delay in seconds (0 if a token is available now)
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1.0:
+                return 0.0
+            return (1.0 - self.tokens) / self.rate
+    
+    @classmethod
+    def get(cls, key: Hashable) -> "TokenBucket":
+        """Get the shared bucket for a key, creating it if needed."""
+        with _buckets_lock:
+            bucket = _buckets.get(key)
+            if bucket is None:
+                bucket = _buckets[key] = cls()
+                if len(_buckets) > MAX_BUCKETS:
+                    _buckets.popitem(last=False)
+            else:
+                _buckets.move_to_end(key)
+            return bucket
+    
+    @classmethod
+    def observe_429(cls, key: Hashable, retry_after: Optional[float] = None) -> "TokenBucket":
+        """
+        Record a rate-limit response against the shared bucket for a key.
+        
+        Args:
+            key: Bucket key, usually from `bucket_key`
+            retry_after: Server-provided wait in seconds, if any
+            
+        Returns:
+            The updated bucket; a private one when the key is None, so
+            responses without a URL do not slow down every other endpoint
+        """
+        bucket = cls() if key is None else cls.get(key)
+        bucket.on_rate_limited(retry_after)
+        return bucket
+    
+    @classmethod
+    def observe_success(cls, key: Hashable) -> None:
+        """
+        Record a successful response against the shared bucket for a key.
+        
+        Only endpoints that have been rate limited have a bucket, so this
+        does not create one.
+        
+        Args:
+            key: Bucket key, usually from `bucket_key`
+        """
+        if key is None:
+            return
+        with _buckets_lock:
+            bucket = _buckets.get(key)
+        if bucket is not None:
+            bucket.on_success()
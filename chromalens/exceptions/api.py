@@ -2,7 +2,10 @@
 API-related exceptions for ChromaLens client.
 """
 
-from typing import Optional, Dict, Any
+import random
+from typing import Optional, Dict, Any, Type
+
+from chromalens.exceptions._backoff import TokenBucket
 
 
 class APIError(Exception):
@@ -21,11 +24,15 @@ class APIError(Exception):
         self.status_code = status_code
         self.response = response
         
+        # Formatted once here; subclasses wrap it with their own prefix
+        if status_code:
+            self._str = f"API Error (Status {status_code}): {message}"
+        else:
+            self._str = f"API Error: {message}"
+        
     def __str__(self) -> str:
         """Return string representation of the error."""
-        if self.status_code:
-            return f"API Error (Status {self.status_code}): {super().__str__()}"
-        return f"API Error: {super().__str__()}"
+        return self._str
 
 
 class NotFoundError(APIError):
@@ -34,10 +41,7 @@ class NotFoundError(APIError):
     def __init__(self, message: str, response: Any = None):
         """Initialize not found error with status code 404."""
         super().__init__(message, status_code=404, response=response)
-        
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        return f"Not Found: {super().__str__()}"
+        self._str = f"Not Found: {self._str}"
 
 
 class AuthenticationError(APIError):
@@ -46,10 +50,7 @@ class AuthenticationError(APIError):
     def __init__(self, message: str, status_code: Optional[int] = 401, response: Any = None):
         """Initialize authentication error with status code 401 or 403."""
         super().__init__(message, status_code=status_code, response=response)
-        
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        return f"Authentication Error: {super().__str__()}"
+        self._str = f"Authentication Error: {self._str}"
 
 
 class ValidationError(APIError):
@@ -71,13 +72,9 @@ class ValidationError(APIError):
         """
         super().__init__(message, status_code=status_code, response=response)
         self.validation_errors = validation_errors or {}
-        
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        base_str = f"Validation Error: {super().__str__()}"
+        self._str = f"Validation Error: {self._str}"
         if self.validation_errors:
-            return f"{base_str} - Details: {self.validation_errors}"
-        return base_str
+            self._str = f"{self._str} - Details: {self.validation_errors}"
 
 
 class ServerError(APIError):
@@ -86,10 +83,7 @@ class ServerError(APIError):
     def __init__(self, message: str, status_code: Optional[int] = 500, response: Any = None):
         """Initialize server error with status code 500."""
         super().__init__(message, status_code=status_code, response=response)
-        
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        return f"Server Error: {super().__str__()}"
+        self._str = f"Server Error: {self._str}"
 
 
 class RateLimitError(APIError):
@@ -107,15 +101,42 @@ class RateLimitError(APIError):
             response: Raw API response
             retry_after: Seconds to wait before retrying (if provided)
         """
+        if retry_after is None:
+            retry_after = _parse_retry_after(response)
         super().__init__(message, status_code=429, response=response)
         self.retry_after = retry_after
+        self._str = f"Rate Limit Exceeded: {self._str}"
+        if retry_after:
+            self._str = f"{self._str} - Retry after {retry_after} seconds"
         
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        base_str = f"Rate Limit Exceeded: {super().__str__()}"
-        if self.retry_after:
-            return f"{base_str} - Retry after {self.retry_after} seconds"
-        return base_str
+        # Adaptive backoff state for the endpoint, attached by the client that
+        # received the response; building the exception changes no shared state
+        self.bucket: Optional[TokenBucket] = None
+    
+    def next_retry_delay(self, jitter: float = 1.0) -> float:
+        """
+        Get how long to wait before retrying the rate-limited request.
+        
+        Args:
+            jitter: Upper bound in seconds of the random jitter added to the delay
+            
+        Returns:
+            Delay in seconds: the larger of retry_after and the adaptive bucket
+            delay for this endpoint (if attached), plus jitter
+        """
+        bucket_delay = self.bucket.next_delay() if self.bucket is not None else 0.0
+        delay = max(self.retry_after or 0, bucket_delay)
+        return delay + random.uniform(0, jitter)
+
+
+def _parse_retry_after(response: Any) -> Optional[int]:
+    """Read the Retry-After header (in seconds) from a response, if present."""
+    headers = getattr(response, 'headers', None)
+    value = headers.get('Retry-After') if headers else None
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
 
 
 class ConflictError(APIError):
@@ -124,7 +145,39 @@ class ConflictError(APIError):
     def __init__(self, message: str, response: Any = None):
         """Initialize conflict error with status code 409."""
         super().__init__(message, status_code=409, response=response)
+        self._str = f"Resource Conflict: {self._str}"
+
+
+# Exception class raised for each HTTP error status code
+STATUS_TO_EXC: Dict[int, Type[APIError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: AuthenticationError,
+    404: NotFoundError,
+    409: ConflictError,
+    422: ValidationError,
+    429: RateLimitError,
+}
+
+# Classes whose status code is fixed and not accepted by their constructor
+_FIXED_STATUS_EXC = (NotFoundError, ConflictError, RateLimitError)
+
+
+def from_status(status_code: int, message: str, response: Any = None) -> APIError:
+    """
+    Build the API error matching an HTTP status code.
+    
+    Args:
+        status_code: HTTP status code of the failed response
+        message: Error message
+        response: Raw API response if available
         
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        return f"Resource Conflict: {super().__str__()}"
\ No newline at end of file
+    Returns:
+        An instance of the matching APIError subclass
+    """
+    exc_class = STATUS_TO_EXC.get(status_code)
+    if exc_class is None:
+        exc_class = ServerError if status_code >= 500 else APIError
+    elif exc_class in _FIXED_STATUS_EXC:
+        return exc_class(message, response=response)
+    return exc_class(message, status_code=status_code, response=response)
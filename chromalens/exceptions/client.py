@@ -19,20 +19,23 @@ class ClientError(Exception):
         super().__init__(message)
         self.details = details or {}
         
+        # Formatted once here; subclasses wrap it with their own prefix
+        self._str = f"Client Error: {message}"
+        if self.details:
+            self._str = f"{self._str} - Details: {self.details}"
+        
     def __str__(self) -> str:
         """Return string representation of the error."""
-        base_str = f"Client Error: {super().__str__()}"
-        if self.details:
-            return f"{base_str} - Details: {self.details}"
-        return base_str
+        return self._str
 
 
 class ConfigurationError(ClientError):
     """Exception raised for client configuration errors."""
     
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        return f"Configuration Error: {super().__str__()}"
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        """Initialize configuration error."""
+        super().__init__(message, details)
+        self._str = f"Configuration Error: {self._str}"
 
 
 class ConnectionError(ClientError):
@@ -52,13 +55,9 @@ class ConnectionError(ClientError):
         super().__init__(message, details)
         self.host = host
         self.port = port
-        
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        base_str = f"Connection Error: {super().__str__()}"
-        if self.host and self.port:
-            return f"{base_str} - Failed to connect to {self.host}:{self.port}"
-        return base_str
+        self._str = f"Connection Error: {self._str}"
+        if host and port:
+            self._str = f"{self._str} - Failed to connect to {host}:{port}"
 
 
 class TimeoutError(ClientError):
@@ -76,21 +75,18 @@ class TimeoutError(ClientError):
         """
         super().__init__(message, details)
         self.timeout = timeout
-        
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        base_str = f"Timeout Error: {super().__str__()}"
-        if self.timeout:
-            return f"{base_str} - Request timed out after {self.timeout}s"
-        return base_str
+        self._str = f"Timeout Error: {self._str}"
+        if timeout:
+            self._str = f"{self._str} - Request timed out after {timeout}s"
 
 
 class DataError(ClientError):
     """Exception raised for errors in the data provided to the client."""
     
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        return f"Data Error: {super().__str__()}"
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        """Initialize data error."""
+        super().__init__(message, details)
+        self._str = f"Data Error: {self._str}"
 
 
 class UnsupportedFeatureError(ClientError):
@@ -108,10 +104,6 @@ class UnsupportedFeatureError(ClientError):
         """
         super().__init__(message, details)
         self.feature = feature
-        
-    def __str__(self) -> str:
-        """Return string representation of the error."""
-        base_str = f"Unsupported Feature: {super().__str__()}"
-        if self.feature:
-            return f"{base_str} - Feature '{self.feature}' is not supported"
-        return base_str
\ No newline at end of file
+        self._str = f"Unsupported Feature: {self._str}"
+        if feature:
+            self._str = f"{self._str} - Feature '{feature}' is not supported"
\ No newline at end of file
@@ -37,7 +37,6 @@ from chromalens.models.embedding import (
 )
 
 from chromalens.models.query import (
-    WhereFilter,
     GetRequest,
     DeleteRequest,
     QueryRequest,
@@ -56,6 +55,8 @@ from chromalens.models.metadata import (
     DocumentFilter,
 )
 
+from chromalens.models._examples import get_example
+
 __all__ = [
     # Tenant models
     'TenantCreate',
@@ -103,4 +104,7 @@ __all__ = [
     'DateFilter',
     'LogicalOperator',
     'DocumentFilter',
+    
+    # Schema examples
+    'get_example',
 ]
\ No newline at end of file
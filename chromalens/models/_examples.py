@@ -0,0 +1,57 @@
+"""
+Schema examples for ChromaLens models.
+
+Examples live in ``_examples.json`` and are only read when JSON schema
+generation asks for them, keeping them out of import time and memory.
+"""
+
+import copy
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+_EXAMPLES_PATH = Path(__file__).with_name("_examples.json")
+
+
+@lru_cache(maxsize=1)
+def _load_examples() -> Dict[str, Dict[str, Any]]:
+    """Read the examples file once."""
+    with _EXAMPLES_PATH.open(encoding="utf-8") as f:
+        examples: Dict[str, Dict[str, Any]] = json.load(f)
+    return examples
+
+
+@lru_cache(maxsize=None)
+def get_example(name: str) -> Dict[str, Any]:
+    """
+    Get the schema example for a model.
+
+    The returned dict is cached and shared; copy it before mutating.
+
+    Args:
+        name: Model class name (e.g., "Collection")
+
+    Returns:
+        Example payload for the model
+
+    Raises:
+        KeyError: If no example is defined for the model
+    """
+    return _load_examples()[name]
+
+
+def schema_example(name: str) -> Callable[[Dict[str, Any]], None]:
+    """
+    Build a ``json_schema_extra`` hook that adds a model's example lazily.
+
+    Args:
+        name: Model class name (e.g., "Collection")
+
+    Returns:
+        Callable that sets ``schema["example"]`` during schema generation
+    """
+    def _add_example(schema: Dict[str, Any]) -> None:
+        schema["example"] = copy.deepcopy(get_example(name))
+
+    return _add_example
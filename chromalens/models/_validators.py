@@ -0,0 +1,142 @@
+"""
+Shared field validators for ChromaLens models.
+"""
+
+import re
+import sys
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Dict, Optional, Tuple, Union
+
+from pydantic import AfterValidator, model_validator
+
+# numpy is imported on first use so that importing the models stays cheap
+_np = None
+
+
+def _get_np() -> Any:
+    """Import numpy on first use and cache the module."""
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+
+# 1-64 characters with at least one non-whitespace character
+_NAME_RE = re.compile(r'(?=.{1,64}\Z)\s*\S', re.DOTALL)
+
+# Strings drawn from a tiny vocabulary (tenant/database names, distance spaces,
+# configuration type tags): interning lets every parsed model share one object.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+def validate_name(v: Optional[str], label: str) -> Optional[str]:
+    """
+    Validate a tenant/database/collection name.
+    
+    Args:
+        v: Name to validate (None is passed through for optional fields)
+        label: Kind of name for the error message (e.g., "Collection")
+        
+    Returns:
+        The original name if valid
+        
+    Raises:
+        ValueError: If the name is empty or longer than 64 characters
+    """
+    if v is None or _NAME_RE.match(v):
+        return v
+    if not v.strip():
+        raise ValueError(f"{label} name cannot be empty")
+    raise ValueError(f"{label} name cannot exceed 64 characters")
+
+
+def _join_or(names: Tuple[str, ...]) -> str:
+    """Join field names for an error message ("a or b", "a, b, or c")."""
+    if len(names) <= 2:
+        return " or ".join(names)
+    return f"{', '.join(names[:-1])}, or {names[-1]}"
+
+
+def _build_length_check(
+    length_key: Optional[str],
+    length_fields: Tuple[str, ...],
+    require_any: Tuple[str, ...],
+) -> Callable[[Any], Any]:
+    """
+    Generate an unrolled after-validator for the given field layout.
+    
+    Args:
+        length_key: Field whose length every field in `length_fields` must match
+        length_fields: Optional list fields checked against `length_key`
+        require_any: Fields of which at least one must be set
+        
+    Returns:
+        Validator function taking the model instance
+    """
+    lines = ["def _check_lengths(self: Any) -> Any:"]
+    if require_any:
+        condition = " and ".join(f"self.{name} is None" for name in require_any)
+        message = f"At least one of {_join_or(require_any)} must be provided"
+        lines += [f"    if {condition}:", f"        raise ValueError({message!r})"]
+    if length_fields:
+        lines.append(f"    n = len(self.{length_key})")
+        for name in length_fields:
+            lines += [
+                f"    v = self.{name}",
+                "    if v is not None and len(v) != n:",
+                f"        raise ValueError(f'Length mismatch: {name} has {{len(v)}} items, but {length_key} has {{n}}')",
+            ]
+    lines.append("    return self")
+    
+    namespace: Dict[str, Any] = {"Any": Any}
+    exec("\n".join(lines), namespace)
+    check: Callable[[Any], Any] = namespace["_check_lengths"]
+    return check
+
+
+class LengthChecked:
+    """
+    Mixin adding a generated after-validator to request models.
+    
+    Configured through class keywords, e.g.
+    ``class AddRequest(BaseModel, LengthChecked, length_key='embeddings', length_fields=('ids',))``.
+    The validator is specialized for the declared fields at class creation,
+    so validation runs straight-line checks with no loop over field names.
+    """
+    
+    def __init_subclass__(
+        cls,
+        length_key: Optional[str] = None,
+        length_fields: Tuple[str, ...] = (),
+        require_any: Tuple[str, ...] = (),
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+        if length_fields or require_any:
+            validator = model_validator(mode='after')(
+                _build_length_check(length_key, length_fields, require_any)
+            )
+            setattr(cls, '_check_lengths', validator)
+
+
+class FastValidated:
+    """
+    Mixin exposing the model's compiled pydantic-core validator directly.
+    
+    For hot paths that validate many payloads; skips the `model_validate`
+    wrapper and, for JSON input, the intermediate `json.loads` dict.
+    """
+    
+    if TYPE_CHECKING:
+        # Set by pydantic on the BaseModel this is mixed into
+        __pydantic_validator__: Any
+    
+    @classmethod
+    def fast_validate(cls, data: Dict[str, Any]) -> Any:
+        """Validate a dict and return a model instance."""
+        return cls.__pydantic_validator__.validate_python(data)
+    
+    @classmethod
+    def fast_validate_json(cls, raw: Union[str, bytes]) -> Any:
+        """Parse and validate a JSON body in one pass and return a model instance."""
+        return cls.__pydantic_validator__.validate_json(raw)
@@ -2,14 +2,28 @@
 Collection models for ChromaLens.
 """
 
-from typing import Optional, Dict, List, Any, Union
-from pydantic import BaseModel, Field, validator, root_validator
+import sys
+from typing import Optional, Dict, List, Any, Type, TypeVar, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
+from pydantic.fields import FieldInfo
+
+from chromalens.models._examples import schema_example
+from chromalens.models._validators import InternedStr, LengthChecked, validate_name
 from uuid import UUID
 
-class HNSWConfig(BaseModel):
+# Configuration type tags shared by every parsed collection
+HNSW_CONFIG_TYPE = sys.intern("HNSWConfigurationInternal")
+COLLECTION_CONFIG_TYPE = sys.intern("CollectionConfigurationInternal")
+
+_ConfigT = TypeVar("_ConfigT", "HNSWConfig", "CollectionConfig")
+
+
+@dataclass(frozen=True, slots=True, config=ConfigDict(populate_by_name=True, serialize_by_alias=True))
+class HNSWConfig:
     """HNSW configuration for collections."""
     
-    space: str = Field("l2", description="Distance function (e.g., 'l2', 'cosine', 'ip')")
+    space: InternedStr = Field("l2", description="Distance function (e.g., 'l2', 'cosine', 'ip')")
     ef_construction: int = Field(100, description="Size of the dynamic list for ef_construction")
     ef_search: int = Field(100, description="Size of the dynamic list for ef_search")
     num_threads: int = Field(4, description="Number of threads to use during indexing")
@@ -17,14 +31,43 @@ class HNSWConfig(BaseModel):
     resize_factor: float = Field(1.2, description="Resize factor for the index")
     batch_size: int = Field(100, description="Batch size for indexing")
     sync_threshold: int = Field(1000, description="Sync threshold")
-    _type: str = Field("HNSWConfigurationInternal", description="Configuration type")
+    type_: InternedStr = Field(HNSW_CONFIG_TYPE, alias="_type", description="Configuration type")
 
 
-class CollectionConfig(BaseModel):
+@dataclass(frozen=True, slots=True, config=ConfigDict(populate_by_name=True, serialize_by_alias=True))
+class CollectionConfig:
     """Configuration for a collection."""
     
     hnsw_configuration: Optional[HNSWConfig] = Field(None, description="HNSW configuration settings")
-    _type: str = Field("CollectionConfigurationInternal", description="Configuration type")
+    type_: InternedStr = Field(COLLECTION_CONFIG_TYPE, alias="_type", description="Configuration type")
+
+
+def _construct_config(cls: Type[_ConfigT], data: Dict[str, Any]) -> _ConfigT:
+    """
+    Build a frozen config dataclass from trusted data without validation.
+    
+    Args:
+        cls: Config dataclass to build (HNSWConfig or CollectionConfig)
+        data: Server-provided config dict (keys by alias or field name)
+        
+    Returns:
+        Config instance with defaults filled in for missing fields
+    """
+    # Set on the class by the pydantic dataclass decorator
+    fields: Dict[str, FieldInfo] = getattr(cls, '__pydantic_fields__')
+    obj = object.__new__(cls)
+    for name, info in fields.items():
+        key = info.alias or name
+        if key in data:
+            value = data[key]
+        elif name in data:
+            value = data[name]
+        else:
+            value = info.get_default(call_default_factory=True)
+        if isinstance(value, str):
+            value = sys.intern(value)
+        object.__setattr__(obj, name, value)
+    return obj
 
 
 class CollectionCreate(BaseModel):
@@ -36,17 +79,14 @@ class CollectionCreate(BaseModel):
     dimension: Optional[int] = Field(None, description="Dimensionality of the embeddings")
     configuration: Optional[CollectionConfig] = Field(None, description="Optional configuration for the collection")
     
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def name_must_be_valid(cls, v):
         """Validate collection name format."""
-        if not v or not v.strip():
-            raise ValueError("Collection name cannot be empty")
-        if len(v) > 64:
-            raise ValueError("Collection name cannot exceed 64 characters")
-        # Add additional validation rules if needed
-        return v
+        return validate_name(v, "Collection")
     
-    @validator('dimension')
+    @field_validator('dimension')
+    @classmethod
     def dimension_must_be_positive(cls, v):
         """Validate dimension is positive."""
         if v is not None and v <= 0:
@@ -59,41 +99,37 @@ class Collection(BaseModel):
     
     id: str = Field(..., description="Unique ID of the collection")
     name: str = Field(..., description="Name of the collection")
-    tenant: str = Field(..., description="Tenant the collection belongs to")
-    database: str = Field(..., description="Database the collection belongs to")
+    tenant: InternedStr = Field(..., description="Tenant the collection belongs to")
+    database: InternedStr = Field(..., description="Database the collection belongs to")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Collection metadata")
     dimension: int = Field(..., description="Dimensionality of the embeddings")
     configuration_json: CollectionConfig = Field(..., description="Collection configuration")
     version: int = Field(0, description="Collection version")
     
-    class Config:
-        """Pydantic config for Collection model."""
+    model_config = ConfigDict(json_schema_extra=schema_example("Collection"))
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'Collection':
+        """
+        Build a collection from a trusted server response without running validators.
+        
+        Use this only for data returned by the ChromaDB server; parse
+        user-supplied input with `model_validate` instead.
         
-        schema_extra = {
-            "example": {
-                "id": "00000000-0000-0000-0000-000000000000",
-                "name": "sample_collection",
-                "tenant": "default_tenant",
-                "database": "default_database",
-                "metadata": None,
-                "dimension": 768,
-                "configuration_json": {
-                    "hnsw_configuration": {
-                        "space": "l2",
-                        "ef_construction": 100,
-                        "ef_search": 100,
-                        "num_threads": 4,
-                        "M": 16,
-                        "resize_factor": 1.2,
-                        "batch_size": 100,
-                        "sync_threshold": 1000,
-                        "_type": "HNSWConfigurationInternal"
-                    },
-                    "_type": "CollectionConfigurationInternal"
-                },
-                "version": 0
-            }
-        }
+        Args:
+            data: Collection dict as returned by the server
+            
+        Returns:
+            Collection instance
+        """
+        config = data['configuration_json']
+        hnsw = config.get('hnsw_configuration')
+        if hnsw is not None:
+            config = {**config, 'hnsw_configuration': _construct_config(HNSWConfig, hnsw)}
+        fields = {k: v for k, v in data.items() if k != 'configuration_json'}
+        fields['tenant'] = sys.intern(fields['tenant'])
+        fields['database'] = sys.intern(fields['database'])
+        return cls.model_construct(configuration_json=_construct_config(CollectionConfig, config), **fields)
 
 
 class CollectionsResponse(BaseModel):
@@ -101,76 +137,37 @@ class CollectionsResponse(BaseModel):
     
     collections: List[Collection] = Field(..., description="List of collections")
     
-    class Config:
-        """Pydantic config for CollectionsResponse model."""
+    model_config = ConfigDict(json_schema_extra=schema_example("CollectionsResponse"))
+    
+    @classmethod
+    def from_trusted(cls, data: List[Dict[str, Any]]) -> 'CollectionsResponse':
+        """
+        Build a collections response from a trusted server listing without validation.
         
-        schema_extra = {
-            "example": {
-                "collections": [
-                    {
-                        "id": "00000000-0000-0000-0000-000000000000",
-                        "name": "collection1",
-                        "tenant": "default_tenant",
-                        "database": "default_database",
-                        "metadata": None,
-                        "dimension": 768,
-                        "configuration_json": {
-                            "hnsw_configuration": {
-                                "space": "l2",
-                                "ef_construction": 100,
-                                "ef_search": 100,
-                                "num_threads": 4,
-                                "M": 16,
-                                "resize_factor": 1.2,
-                                "batch_size": 100,
-                                "sync_threshold": 1000,
-                                "_type": "HNSWConfigurationInternal"
-                            },
-                            "_type": "CollectionConfigurationInternal"
-                        },
-                        "version": 0
-                    }
-                ]
-            }
-        }
-
-
-class CollectionUpdateRequest(BaseModel):
+        Args:
+            data: List of collection dicts as returned by the server
+            
+        Returns:
+            CollectionsResponse instance
+        """
+        return cls.model_construct(collections=[Collection.from_trusted(item) for item in data])
+
+
+class CollectionUpdateRequest(BaseModel, LengthChecked, require_any=('new_name', 'new_metadata')):
     """Model for updating a collection."""
     
     new_name: Optional[str] = Field(None, description="New name for the collection")
     new_metadata: Optional[Dict[str, Any]] = Field(None, description="New metadata for the collection")
     
-    @validator('new_name')
+    @field_validator('new_name')
+    @classmethod
     def name_must_be_valid(cls, v):
         """Validate collection name format."""
-        if v is None:
-            return v
-        if not v or not v.strip():
-            raise ValueError("Collection name cannot be empty")
-        if len(v) > 64:
-            raise ValueError("Collection name cannot exceed 64 characters")
-        # Add additional validation rules if needed
-        return v
-    
-    @root_validator
-    def check_at_least_one_field(cls, values):
-        """Validate that at least one field is provided."""
-        if values.get('new_name') is None and values.get('new_metadata') is None:
-            raise ValueError("At least one of new_name or new_metadata must be provided")
-        return values
+        return validate_name(v, "Collection")
 
 
-class CollectionCountResponse(BaseModel):
+@dataclass(frozen=True, slots=True, config=ConfigDict(json_schema_extra=schema_example("CollectionCountResponse")))
+class CollectionCountResponse:
     """Model for a collection count response."""
     
-    count: int = Field(..., description="Number of items in the collection")
-    
-    class Config:
-        """Pydantic config for CollectionCountResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "count": 100
-            }
-        }
\ No newline at end of file
+    count: int = Field(..., description="Number of items in the collection")
\ No newline at end of file
@@ -3,7 +3,11 @@ Database models for ChromaLens.
 """
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
+
+from chromalens.models._examples import schema_example
+from chromalens.models._validators import InternedStr, validate_name
 
 
 class DatabaseCreate(BaseModel):
@@ -11,15 +15,11 @@ class DatabaseCreate(BaseModel):
     
     name: str = Field(..., description="Name of the database")
     
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def name_must_be_valid(cls, v):
         """Validate database name format."""
-        if not v or not v.strip():
-            raise ValueError("Database name cannot be empty")
-        if len(v) > 64:
-            raise ValueError("Database name cannot exceed 64 characters")
-        # Add additional validation rules if needed
-        return v
+        return validate_name(v, "Database")
 
 
 class Database(BaseModel):
@@ -27,18 +27,9 @@ class Database(BaseModel):
     
     id: str = Field(..., description="Unique ID of the database")
     name: str = Field(..., description="Name of the database")
-    tenant: str = Field(..., description="Tenant the database belongs to")
+    tenant: InternedStr = Field(..., description="Tenant the database belongs to")
     
-    class Config:
-        """Pydantic config for Database model."""
-        
-        schema_extra = {
-            "example": {
-                "id": "00000000-0000-0000-0000-000000000000",
-                "name": "default_database",
-                "tenant": "default_tenant"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("Database"))
 
 
 class DatabasesResponse(BaseModel):
@@ -46,25 +37,7 @@ class DatabasesResponse(BaseModel):
     
     databases: list[Database] = Field(..., description="List of databases")
     
-    class Config:
-        """Pydantic config for DatabasesResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "databases": [
-                    {
-                        "id": "00000000-0000-0000-0000-000000000000",
-                        "name": "default_database",
-                        "tenant": "default_tenant"
-                    },
-                    {
-                        "id": "11111111-1111-1111-1111-111111111111",
-                        "name": "custom_database",
-                        "tenant": "default_tenant"
-                    }
-                ]
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("DatabasesResponse"))
 
 
 class DatabaseUpdateRequest(BaseModel):
@@ -72,29 +45,15 @@ class DatabaseUpdateRequest(BaseModel):
     
     new_name: Optional[str] = Field(None, description="New name for the database")
     
-    @validator('new_name')
+    @field_validator('new_name')
+    @classmethod
     def name_must_be_valid(cls, v):
         """Validate database name format."""
-        if v is None:
-            return v
-        if not v or not v.strip():
-            raise ValueError("Database name cannot be empty")
-        if len(v) > 64:
-            raise ValueError("Database name cannot exceed 64 characters")
-        # Add additional validation rules if needed
-        return v
+        return validate_name(v, "Database")
 
 
-class DatabaseCountResponse(BaseModel):
+@dataclass(frozen=True, slots=True, config=ConfigDict(json_schema_extra=schema_example("DatabaseCountResponse")))
+class DatabaseCountResponse:
     """Model for a database collection count response."""
     
-    count: int = Field(..., description="Number of collections in the database")
-    
-    class Config:
-        """Pydantic config for DatabaseCountResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "count": 5
-            }
-        }
\ No newline at end of file
+    count: int = Field(..., description="Number of collections in the database")
\ No newline at end of file
@@ -2,9 +2,177 @@
 Embedding models for ChromaLens.
 """
 
-from typing import Optional, Dict, List, Any, Union
-from pydantic import BaseModel, Field, validator, root_validator
-import numpy as np
+from __future__ import annotations
+
+import json
+import struct
+from typing import TYPE_CHECKING, Annotated, Optional, Dict, List, Any, Type, TypeVar, Union
+from uuid import UUID
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    WithJsonSchema,
+    field_validator,
+)
+
+from chromalens.models._examples import schema_example
+from chromalens.models._validators import LengthChecked, _get_np
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    _NDArray = np.ndarray
+else:
+    _NDArray = Any
+
+
+def _embeddings_array(embeddings: Any, name: str = "embeddings") -> np.ndarray:
+    """
+    Convert a batch of embeddings to a 2-D float32 array, validating its shape.
+    
+    Args:
+        embeddings: Nested list (or array) of embedding vectors
+        name: Name of the field for the error message
+        
+    Returns:
+        2-D numpy array of shape (count, dimension)
+        
+    Raises:
+        ValueError: If the embeddings are empty, ragged, non-numeric or
+            outside the float32 range
+    """
+    np = _get_np()
+    # Convert without forcing a dtype first: a forced float cast would quietly
+    # turn None into NaN and accept strings of digits
+    try:
+        arr = np.asarray(embeddings)
+    except (ValueError, TypeError):
+        raise ValueError(f"All {name} must be numeric vectors with the same dimension")
+    
+    if arr.dtype.kind not in 'biuf':
+        raise ValueError(f"All {name} must be numeric vectors with the same dimension")
+    
+    source = arr
+    with np.errstate(over='ignore'):
+        arr = np.ascontiguousarray(arr, dtype=np.float32)
+    
+    # Finite values beyond the float32 range (about 3.4e38) become inf
+    if source.dtype.kind == 'f' and source.dtype.itemsize > 4:
+        overflow = ~np.isfinite(arr) & np.isfinite(source)
+        if overflow.any():
+            raise ValueError(f"{name.capitalize()} values must fit in float32 (|x| < 3.4e38)")
+    
+    if arr.ndim != 2 or arr.shape[0] == 0 or arr.shape[1] == 0:
+        if arr.size == 0:
+            raise ValueError(f"{name.capitalize()} list cannot be empty")
+        raise ValueError(f"All {name} must be numeric vectors with the same dimension")
+    
+    return arr
+
+
+# Embeddings batch stored as one contiguous (count, dimension) float32 array.
+# model_dump() hands back the array itself; JSON serialization emits nested lists.
+NDArrayEmbeddings = Annotated[
+    _NDArray,
+    PlainValidator(_embeddings_array),
+    PlainSerializer(lambda arr: arr.tolist(), when_used='json'),
+    WithJsonSchema({'type': 'array', 'items': {'type': 'array', 'items': {'type': 'number'}}}),
+]
+
+
+# Per-item fields checked against the embeddings count of an add request
+_PARALLEL_FIELDS = ('ids', 'metadatas', 'documents', 'uris')
+# Update fields, at least one required and each checked against the ids count
+_UPDATE_FIELDS = ('embeddings', 'metadatas', 'documents', 'uris')
+# Per-item fields checked against the embeddings count of an upsert request
+_UPSERT_FIELDS = ('ids', 'metadatas')
+
+
+# Binary layout: <count:uint32><dimension:uint32><uuid_ids:uint32><float32 embeddings>
+# <uuid_ids * 16 bytes of packed ids><JSON of remaining fields>
+_BINARY_HEADER = struct.Struct('<III')
+_UUID_SIZE = 16
+
+# Request models with a binary form (AddRequest, UpsertRequest)
+_RequestT = TypeVar("_RequestT", "AddRequest", "UpsertRequest")
+
+
+def _pack_uuid_ids(ids: Optional[List[str]]) -> Optional[bytes]:
+    """
+    Pack ids into one blob of 16-byte UUIDs if every id is a canonical UUID string.
+    
+    Args:
+        ids: Item IDs of the request
+        
+    Returns:
+        Concatenated UUID bytes, or None if the ids must stay as strings
+    """
+    if not ids:
+        return None
+    parts = []
+    for item_id in ids:
+        try:
+            uuid = UUID(item_id)
+        except (ValueError, TypeError, AttributeError):
+            return None
+        # Only canonical ids survive the round trip unchanged
+        if str(uuid) != item_id:
+            return None
+        parts.append(uuid.bytes)
+    return b''.join(parts)
+
+
+def _pack_request(request: Union[AddRequest, UpsertRequest], arr: np.ndarray) -> bytes:
+    """
+    Pack a request into the binary layout, writing embeddings as one raw buffer.
+    
+    UUID ids are written as a single blob of 16-byte values; any other ids
+    are kept as strings in the JSON part.
+    
+    Args:
+        request: Request model to pack
+        arr: 2-D float32 embeddings array of the request
+        
+    Returns:
+        Packed request bytes
+    """
+    id_blob = _pack_uuid_ids(request.ids)
+    exclude = {'embeddings', 'ids'} if id_blob else {'embeddings'}
+    return b''.join((
+        _BINARY_HEADER.pack(*arr.shape, len(id_blob) // _UUID_SIZE if id_blob else 0),
+        arr.astype('<f4', copy=False).tobytes(),
+        id_blob or b'',
+        request.model_dump_json(exclude=exclude, exclude_none=True).encode('utf-8'),
+    ))
+
+
+def _unpack_request(cls: Type[_RequestT], buf: bytes) -> _RequestT:
+    """
+    Rebuild a request model from bytes produced by `_pack_request`.
+    
+    Args:
+        cls: Request model class to build
+        buf: Packed request bytes
+        
+    Returns:
+        Validated request model
+    """
+    count, dimension, uuid_ids = _BINARY_HEADER.unpack_from(buf)
+    offset = _BINARY_HEADER.size
+    arr = _get_np().frombuffer(buf, dtype='<f4', count=count * dimension, offset=offset).reshape(count, dimension)
+    offset += arr.nbytes
+    
+    fields: Dict[str, Any] = {}
+    if uuid_ids:
+        view = memoryview(buf)
+        end = offset + uuid_ids * _UUID_SIZE
+        fields['ids'] = [str(UUID(bytes=bytes(view[i:i + _UUID_SIZE]))) for i in range(offset, end, _UUID_SIZE)]
+        offset = end
+    fields.update(json.loads(buf[offset:]))
+    return cls(embeddings=arr, **fields)
 
 
 class Embedding(BaseModel):
@@ -12,30 +180,32 @@ class Embedding(BaseModel):
     
     vector: List[float] = Field(..., description="Embedding vector values")
     
-    @validator('vector')
+    @field_validator('vector')
+    @classmethod
     def validate_vector(cls, v):
         """Validate vector format."""
         if not v:
             raise ValueError("Vector cannot be empty")
         return v
     
-    def as_numpy(self) -> np.ndarray:
-        """Convert to numpy array."""
-        return np.array(self.vector, dtype=np.float32)
+    def as_numpy(self, dtype: Any = 'float32') -> np.ndarray:
+        """Convert to numpy array of the given dtype (float32 by default)."""
+        return _get_np().asarray(self.vector, dtype=dtype)
+    
+    def as_fp16(self) -> np.ndarray:
+        """Convert to a half-precision numpy array."""
+        return self.as_numpy(dtype='float16')
+    
+    def to_bytes(self, dtype: Any = 'float16') -> bytes:
+        """Return the vector as raw little-endian bytes of the given dtype."""
+        return self.as_numpy(dtype=_get_np().dtype(dtype).newbyteorder('<')).tobytes()
     
     @classmethod
-    def from_numpy(cls, array: np.ndarray) -> 'Embedding':
+    def from_numpy(cls, array: np.ndarray) -> Embedding:
         """Create from numpy array."""
         return cls(vector=array.tolist())
     
-    class Config:
-        """Pydantic config for Embedding model."""
-        
-        schema_extra = {
-            "example": {
-                "vector": [0.1, 0.2, 0.3, 0.4, 0.5]
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("Embedding"))
 
 
 class ItemBase(BaseModel):
@@ -53,79 +223,69 @@ class Item(ItemBase):
     uri: Optional[str] = Field(None, description="URI reference")
 
 
-class AddRequest(BaseModel):
+class AddRequest(BaseModel, LengthChecked, length_key='embeddings', length_fields=_PARALLEL_FIELDS):
     """Model for adding items to a collection."""
     
     ids: Optional[List[str]] = Field(None, description="IDs of the items (generated if not provided)")
-    embeddings: List[List[float]] = Field(..., description="Embedding vectors")
+    embeddings: NDArrayEmbeddings = Field(..., description="Embedding vectors")
     metadatas: Optional[List[Dict[str, Any]]] = Field(None, description="Optional metadata for each item")
     documents: Optional[List[str]] = Field(None, description="Optional document text for each item")
     uris: Optional[List[str]] = Field(None, description="Optional URIs for each item")
     
-    @validator('embeddings')
-    def validate_embeddings(cls, v):
-        """Validate embeddings format."""
-        if not v:
-            raise ValueError("Embeddings list cannot be empty")
-        
-        # Ensure all embeddings have the same dimension
-        dimensions = set(len(embedding) for embedding in v)
-        if len(dimensions) > 1:
-            raise ValueError(f"All embeddings must have the same dimension, found {dimensions}")
-            
-        return v
+    def as_numpy(self) -> np.ndarray:
+        """Return the embeddings as a 2-D float32 numpy array (no copy)."""
+        return self.embeddings
     
-    @root_validator
-    def validate_lengths(cls, values):
-        """Validate that all provided lists have the same length."""
-        embeddings = values.get('embeddings')
-        if not embeddings:
-            return values
-            
-        count = len(embeddings)
-        
-        # Check other fields if provided
-        for field_name in ['ids', 'metadatas', 'documents', 'uris']:
-            field_value = values.get(field_name)
-            if field_value is not None and len(field_value) != count:
-                raise ValueError(f"Length mismatch: {field_name} has {len(field_value)} items, but embeddings has {count}")
-                
-        return values
+    def embeddings_bytes(self, dtype: Any = 'float16') -> bytes:
+        """Return all embeddings as one contiguous little-endian buffer of the given dtype."""
+        return self.embeddings.astype(_get_np().dtype(dtype).newbyteorder('<'), copy=False).tobytes()
+    
+    def to_binary(self) -> bytes:
+        """Pack the request into a compact binary form (raw float32 embeddings buffer)."""
+        return _pack_request(self, self.embeddings)
+    
+    @classmethod
+    def from_binary(cls, buf: bytes) -> 'AddRequest':
+        """Create from bytes produced by `to_binary`."""
+        return _unpack_request(cls, buf)
 
 
-class UpdateRequest(BaseModel):
+class UpdateRequest(
+    BaseModel,
+    LengthChecked,
+    length_key='ids',
+    length_fields=_UPDATE_FIELDS,
+    require_any=_UPDATE_FIELDS,
+):
     """Model for updating items in a collection."""
     
     ids: List[str] = Field(..., description="IDs of the items to update")
-    embeddings: Optional[List[List[float]]] = Field(None, description="New embedding vectors")
+    embeddings: Optional[NDArrayEmbeddings] = Field(None, description="New embedding vectors")
     metadatas: Optional[List[Dict[str, Any]]] = Field(None, description="New metadata for each item")
     documents: Optional[List[str]] = Field(None, description="New document text for each item")
     uris: Optional[List[str]] = Field(None, description="New URIs for each item")
     
-    @root_validator
-    def validate_update_fields(cls, values):
-        """Validate that at least one update field is provided."""
-        ids = values.get('ids')
-        if not ids:
+    @field_validator('ids')
+    @classmethod
+    def ids_must_not_be_empty(cls, v):
+        """Validate that at least one ID is provided."""
+        if not v:
             raise ValueError("IDs list cannot be empty")
-            
-        # Check that at least one update field is provided
-        if all(values.get(field) is None for field in ['embeddings', 'metadatas', 'documents', 'uris']):
-            raise ValueError("At least one of embeddings, metadatas, documents, or uris must be provided")
-            
-        # Check lengths of provided fields match ids length
-        count = len(ids)
-        for field_name in ['embeddings', 'metadatas', 'documents', 'uris']:
-            field_value = values.get(field_name)
-            if field_value is not None and len(field_value) != count:
-                raise ValueError(f"Length mismatch: {field_name} has {len(field_value)} items, but ids has {count}")
-                
-        return values
-
-
-class UpsertRequest(BaseModel):
+        return v
+
+
+class UpsertRequest(BaseModel, LengthChecked, length_key='embeddings', length_fields=_UPSERT_FIELDS):
     """Model for upserting items in a collection."""
     
     ids: List[str] = Field(..., description="IDs of the items to upsert")
-    embeddings: List[List[float]] = Field(..., description="Embedding vectors")
-    metadatas: Optional[List[Dict[str, Any]]] = Field(None, description="Optional metadata for each item")
\ No newline at end of file
+    embeddings: NDArrayEmbeddings = Field(..., description="Embedding vectors")
+    metadatas: Optional[List[Dict[str, Any]]] = Field(None, description="Optional metadata for each item")
+    
+    def to_binary(self) -> bytes:
+        """Pack the request into a compact binary form (raw float32 embeddings buffer)."""
+        return _pack_request(self, self.embeddings)
+    
+    @classmethod
+    def from_binary(cls, buf: bytes) -> 'UpsertRequest':
+        """Create from bytes produced by `to_binary`."""
+        return _unpack_request(cls, buf)
\ No newline at end of file
@@ -4,28 +4,29 @@ Metadata models for ChromaLens.
 
 from typing import Optional, Dict, List, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from chromalens.models._examples import schema_example
+from chromalens.models._validators import FastValidated
 
 
 class MetadataValue(BaseModel):
     """Base model for metadata values."""
     
-    class Config:
-        """Pydantic config for MetadataValue model."""
-        
-        extra = "allow"  # Allow any additional fields
+    model_config = ConfigDict(
+        extra="allow",  # Allow any additional fields
+    )
 
 
 class MetadataFilter(BaseModel):
     """Base model for metadata filters."""
     
-    class Config:
-        """Pydantic config for MetadataFilter model."""
-        
-        extra = "allow"  # Allow any additional fields
+    model_config = ConfigDict(
+        extra="allow",  # Allow any additional fields
+    )
 
 
-class TextFilter(BaseModel):
+class TextFilter(BaseModel, FastValidated):
     """Filter for text fields."""
     
     contains: Optional[str] = Field(None, alias="$contains", description="Text contains this substring")
@@ -36,14 +37,13 @@ class TextFilter(BaseModel):
     in_list: Optional[List[str]] = Field(None, alias="$in", description="Text is in this list")
     not_in_list: Optional[List[str]] = Field(None, alias="$nin", description="Text is not in this list")
     
-    class Config:
-        """Pydantic config for TextFilter model."""
-        
-        extra = "allow"  # Allow any additional fields
-        allow_population_by_field_name = True
+    model_config = ConfigDict(
+        extra="allow",  # Allow any additional fields
+        populate_by_name=True,
+    )
 
 
-class NumericFilter(BaseModel):
+class NumericFilter(BaseModel, FastValidated):
     """Filter for numeric fields."""
     
     eq: Optional[float] = Field(None, alias="$eq", description="Equals this value")
@@ -55,95 +55,66 @@ class NumericFilter(BaseModel):
     in_list: Optional[List[float]] = Field(None, alias="$in", description="In this list of values")
     not_in_list: Optional[List[float]] = Field(None, alias="$nin", description="Not in this list of values")
     
-    class Config:
-        """Pydantic config for NumericFilter model."""
-        
-        extra = "allow"  # Allow any additional fields
-        allow_population_by_field_name = True
+    model_config = ConfigDict(
+        extra="allow",  # Allow any additional fields
+        populate_by_name=True,
+    )
 
 
-class DateFilter(BaseModel):
-    """Filter for date fields."""
-    
-    eq: Optional[str] = Field(None, alias="$eq", description="Equals this date")
-    ne: Optional[str] = Field(None, alias="$ne", description="Does not equal this date")
-    gt: Optional[str] = Field(None, alias="$gt", description="Greater than this date")
-    gte: Optional[str] = Field(None, alias="$gte", description="Greater than or equal to this date")
-    lt: Optional[str] = Field(None, alias="$lt", description="Less than this date")
-    lte: Optional[str] = Field(None, alias="$lte", description="Less than or equal to this date")
+class DateFilter(BaseModel, FastValidated):
+    """Filter for date fields (ISO 8601, e.g. '2023-01-01T00:00:00Z')."""
     
-    @validator('eq', 'ne', 'gt', 'gte', 'lt', 'lte')
-    def validate_date(cls, v):
-        """Validate date string format."""
-        if v is not None:
-            try:
-                datetime.fromisoformat(v.replace('Z', '+00:00'))
-            except ValueError:
-                raise ValueError(f"Invalid date format: {v}. Use ISO format (e.g., '2023-01-01T00:00:00Z')")
-        return v
+    eq: Optional[datetime] = Field(None, alias="$eq", description="Equals this date")
+    ne: Optional[datetime] = Field(None, alias="$ne", description="Does not equal this date")
+    gt: Optional[datetime] = Field(None, alias="$gt", description="Greater than this date")
+    gte: Optional[datetime] = Field(None, alias="$gte", description="Greater than or equal to this date")
+    lt: Optional[datetime] = Field(None, alias="$lt", description="Less than this date")
+    lte: Optional[datetime] = Field(None, alias="$lte", description="Less than or equal to this date")
     
-    class Config:
-        """Pydantic config for DateFilter model."""
-        
-        extra = "allow"  # Allow any additional fields
-        allow_population_by_field_name = True
+    model_config = ConfigDict(
+        extra="allow",  # Allow any additional fields
+        populate_by_name=True,
+    )
 
 
-class LogicalOperator(BaseModel):
+class LogicalOperator(BaseModel, FastValidated):
     """Logical operators for combining filters."""
     
     and_operator: Optional[List[Dict[str, Any]]] = Field(None, alias="$and", description="AND operator")
     or_operator: Optional[List[Dict[str, Any]]] = Field(None, alias="$or", description="OR operator")
     not_operator: Optional[Dict[str, Any]] = Field(None, alias="$not", description="NOT operator")
     
-    @root_validator
-    def validate_logical_operator(cls, values):
+    @model_validator(mode='after')
+    def validate_logical_operator(self) -> 'LogicalOperator':
         """Validate that only one logical operator is used."""
-        operators = [op for op in ['and_operator', 'or_operator', 'not_operator'] if values.get(op) is not None]
-        if len(operators) > 1:
+        if (self.and_operator is not None) + (self.or_operator is not None) + (self.not_operator is not None) > 1:
+            # Only build the list of offending operators for the error message
+            operators = [op for op in ('and_operator', 'or_operator', 'not_operator') if getattr(self, op) is not None]
             raise ValueError(f"Only one logical operator can be used at a time, found: {operators}")
-        return values
+        return self
     
-    class Config:
-        """Pydantic config for LogicalOperator model."""
-        
-        extra = "allow"  # Allow any additional fields
-        allow_population_by_field_name = True
+    model_config = ConfigDict(
+        extra="allow",  # Allow any additional fields
+        populate_by_name=True,
+    )
 
 
-class WhereFilter(BaseModel):
+class WhereFilter(BaseModel, FastValidated):
     """Where filter for querying collections."""
     
-    class Config:
-        """Pydantic config for WhereFilter model."""
-        
-        extra = "allow"  # Allow any additional fields
-        
-        schema_extra = {
-            "example": {
-                "metadata_field": {"$eq": "value"},
-                "numeric_field": {"$gt": 10, "$lt": 20},
-                "$or": [
-                    {"field1": {"$eq": "value1"}},
-                    {"field2": {"$eq": "value2"}}
-                ]
-            }
-        }
-
-
-class DocumentFilter(BaseModel):
+    model_config = ConfigDict(
+        extra="allow",  # Allow any additional fields
+        json_schema_extra=schema_example("WhereFilter"),
+    )
+
+
+class DocumentFilter(BaseModel, FastValidated):
     """Document filter for querying collections."""
     
     contains: Optional[str] = Field(None, alias="$contains", description="Document contains this text")
     
-    class Config:
-        """Pydantic config for DocumentFilter model."""
-        
-        extra = "allow"  # Allow any additional fields
-        allow_population_by_field_name = True
-        
-        schema_extra = {
-            "example": {
-                "$contains": "search term"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(
+        extra="allow",  # Allow any additional fields
+        populate_by_name=True,
+        json_schema_extra=schema_example("DocumentFilter"),
+    )
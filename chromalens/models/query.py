@@ -2,117 +2,205 @@
 Query models for ChromaLens.
 """
 
-from typing import Optional, Dict, List, Any, Union
-from pydantic import BaseModel, Field, validator, root_validator
+from itertools import islice, repeat
+from typing import TYPE_CHECKING, Annotated, Optional, Dict, List, Any, Union
+from pydantic import (
+    BaseModel,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    WithJsonSchema,
+    field_validator,
+    model_validator,
+)
 
+from chromalens.models._validators import FastValidated, _get_np
+# Re-exported so existing `from chromalens.models.query import WhereFilter` keeps working
+from chromalens.models.metadata import WhereFilter
 
-class WhereFilter(BaseModel):
-    """Base model for where filter conditions."""
-    
-    class Config:
-        """Pydantic config for WhereFilter model."""
-        
-        extra = "allow"  # Allow additional fields
+if TYPE_CHECKING:
+    import numpy as np
+
+    _NDArray = Union[np.ndarray, List[np.ndarray]]
+else:
+    _NDArray = Any
 
+# Fields that can be requested through `include`
+_GET_VALID_INCLUDE = frozenset({'metadatas', 'documents', 'embeddings', 'uris'})
+_QUERY_VALID_INCLUDE = frozenset({'metadatas', 'documents', 'distances', 'embeddings', 'uris'})
 
-class GetRequest(BaseModel):
+
+class GetRequest(BaseModel, FastValidated):
     """Model for retrieving items from a collection."""
     
     ids: Optional[List[str]] = Field(None, description="IDs of the items to retrieve")
     where: Optional[Dict[str, Any]] = Field(None, description="Filter conditions on metadata")
     where_document: Optional[Dict[str, Any]] = Field(None, description="Filter conditions on documents")
-    limit: Optional[int] = Field(None, description="Maximum number of results to return")
-    offset: Optional[int] = Field(None, description="Offset for pagination")
+    limit: Optional[int] = Field(None, gt=0, description="Maximum number of results to return")
+    offset: Optional[int] = Field(None, ge=0, description="Offset for pagination")
     include: Optional[List[str]] = Field(None, description="Fields to include in the response")
     
-    @validator('limit')
-    def validate_limit(cls, v):
-        """Validate limit is positive."""
-        if v is not None and v <= 0:
-            raise ValueError("Limit must be positive")
-        return v
-    
-    @validator('offset')
-    def validate_offset(cls, v):
-        """Validate offset is non-negative."""
-        if v is not None and v < 0:
-            raise ValueError("Offset cannot be negative")
-        return v
-    
-    @validator('include')
-    def validate_include(cls, v):
+    @field_validator('include')
+    @classmethod
+    def validate_include(cls, v: Optional[List[str]]) -> Optional[List[str]]:
         """Validate include fields."""
-        if v is not None:
-            valid_include = {'metadatas', 'documents', 'embeddings', 'uris'}
-            for field in v:
-                if field not in valid_include:
-                    raise ValueError(f"Invalid include field: {field}. Valid fields are: {valid_include}")
+        if v is not None and not _GET_VALID_INCLUDE.issuperset(v):
+            field = next(field for field in v if field not in _GET_VALID_INCLUDE)
+            raise ValueError(f"Invalid include field: {field}. Valid fields are: {set(_GET_VALID_INCLUDE)}")
         return v
     
-    @root_validator
-    def validate_at_least_one_filter(cls, values):
+    @model_validator(mode='after')
+    def validate_at_least_one_filter(self) -> 'GetRequest':
         """Validate that at least one filter is provided."""
-        if values.get('ids') is None and values.get('where') is None and values.get('where_document') is None:
+        if self.ids is None and self.where is None and self.where_document is None:
             # It's valid to have no filters, which means "get everything"
             pass
-        return values
+        return self
 
 
-class DeleteRequest(BaseModel):
+class DeleteRequest(BaseModel, FastValidated):
     """Model for deleting items from a collection."""
     
     ids: Optional[List[str]] = Field(None, description="IDs of the items to delete")
     where: Optional[Dict[str, Any]] = Field(None, description="Filter conditions on metadata")
     where_document: Optional[Dict[str, Any]] = Field(None, description="Filter conditions on documents")
     
-    @root_validator
-    def validate_at_least_one_filter(cls, values):
+    @model_validator(mode='after')
+    def validate_at_least_one_filter(self) -> 'DeleteRequest':
         """Validate that at least one filter is provided."""
-        if values.get('ids') is None and values.get('where') is None and values.get('where_document') is None:
+        if self.ids is None and self.where is None and self.where_document is None:
             raise ValueError("At least one of ids, where, or where_document must be provided")
-        return values
+        return self
 
 
-class QueryRequest(BaseModel):
+class QueryRequest(BaseModel, FastValidated):
     """Model for querying a collection."""
     
     query_embeddings: List[List[float]] = Field(..., description="Query embedding vectors")
-    n_results: int = Field(10, description="Number of results to return per query")
+    n_results: int = Field(10, gt=0, description="Number of results to return per query")
     where: Optional[Dict[str, Any]] = Field(None, description="Filter conditions on metadata")
     where_document: Optional[Dict[str, Any]] = Field(None, description="Filter conditions on documents")
     include: Optional[List[str]] = Field(None, description="Fields to include in the response")
     
-    @validator('query_embeddings')
-    def validate_query_embeddings(cls, v):
+    @field_validator('query_embeddings')
+    @classmethod
+    def validate_query_embeddings(cls, v: List[List[float]]) -> List[List[float]]:
         """Validate query embeddings format."""
         if not v:
             raise ValueError("Query embeddings list cannot be empty")
         
-        # Ensure all embeddings have the same dimension
-        dimensions = set(len(embedding) for embedding in v)
-        if len(dimensions) > 1:
-            raise ValueError(f"All query embeddings must have the same dimension, found {dimensions}")
+        # Ensure all embeddings have the same dimension as the first, stopping at the first mismatch
+        dimension = len(v[0])
+        for embedding in islice(v, 1, None):
+            if len(embedding) != dimension:
+                raise ValueError(f"All query embeddings must have the same dimension, expected {dimension}, got {len(embedding)}")
             
         return v
     
-    @validator('n_results')
-    def validate_n_results(cls, v):
-        """Validate n_results is positive."""
-        if v <= 0:
-            raise ValueError("n_results must be positive")
-        return v
-    
-    @validator('include')
-    def validate_include(cls, v):
+    @field_validator('include')
+    @classmethod
+    def validate_include(cls, v: Optional[List[str]]) -> Optional[List[str]]:
         """Validate include fields."""
-        if v is not None:
-            valid_include = {'metadatas', 'documents', 'distances', 'embeddings', 'uris'}
-            for field in v:
-                if field not in valid_include:
-                    raise ValueError(f"Invalid include field: {field}. Valid fields are: {valid_include}")
+        if v is not None and not _QUERY_VALID_INCLUDE.issuperset(v):
+            field = next(field for field in v if field not in _QUERY_VALID_INCLUDE)
+            raise ValueError(f"Invalid include field: {field}. Valid fields are: {set(_QUERY_VALID_INCLUDE)}")
         return v
 
 
+def _float_array(value: Any, ndim: int, name: str) -> Any:
+    """
+    Convert nested numbers to a float64 array with exactly `ndim` dimensions.
+    
+    Empty inputs (queries without results) are padded to `ndim` dimensions.
+    
+    Raises:
+        ValueError: If the input is ragged, not numeric, or has the wrong shape
+    """
+    np = _get_np()
+    try:
+        arr = np.asarray(value)
+    except (ValueError, TypeError):
+        raise ValueError(f"{name} must be a {ndim}-D array of numbers")
+    
+    # Checked before casting: a float cast would turn None into NaN
+    if arr.dtype.kind not in 'biuf':
+        raise ValueError(f"{name} must contain only numbers")
+    if arr.size == 0 and 0 < arr.ndim < ndim:
+        arr = arr.reshape(arr.shape + (0,) * (ndim - arr.ndim))
+    if arr.ndim != ndim:
+        raise ValueError(f"{name} must be a {ndim}-D array of numbers")
+    return arr.astype(np.float64, copy=False)
+
+
+def _results_array(value: Any, ndim: int, name: str) -> Any:
+    """
+    Convert per-query result rows to float64 numpy storage in one call.
+    
+    Args:
+        value: Nested list with one row of results per query
+        ndim: Number of dimensions, including the leading query axis
+        name: Name of the field for the error message
+        
+    Returns:
+        One array with a leading query axis, or a list of per-query arrays
+        when queries returned different numbers of results
+        
+    Raises:
+        ValueError: If the value is not numeric or has the wrong shape
+    """
+    np = _get_np()
+    try:
+        np.asarray(value)
+    except (ValueError, TypeError):
+        # Ragged: queries returned different numbers of results
+        if not isinstance(value, list):
+            raise ValueError(f"{name} must be a {ndim}-D array of numbers")
+        return [_float_array(row, ndim - 1, name) for row in value]
+    return _float_array(value, ndim, name)
+
+
+def _distances_array(value: Any) -> Any:
+    """Validate distances: queries x results."""
+    return _results_array(value, 2, "distances")
+
+
+def _result_embeddings_array(value: Any) -> Any:
+    """Validate result embeddings: queries x results x dimension."""
+    return _results_array(value, 3, "embeddings")
+
+
+def _results_tolist(value: Any) -> Any:
+    """Convert result arrays back to nested lists for JSON output."""
+    if isinstance(value, list):
+        return [row.tolist() for row in value]
+    return value.tolist()
+
+
+def _results_schema(depth: int) -> Dict[str, Any]:
+    """JSON schema of `depth` nested number arrays."""
+    schema: Dict[str, Any] = {'type': 'number'}
+    for _ in range(depth):
+        schema = {'type': 'array', 'items': schema}
+    return schema
+
+
+# Distances (queries x results) and embeddings (queries x results x dimension)
+# are stored as float64 arrays instead of validating every float. float64
+# holds every JSON number exactly, so values read back as the server sent them.
+ResultDistances = Annotated[
+    _NDArray,
+    PlainValidator(_distances_array),
+    PlainSerializer(_results_tolist, when_used='json'),
+    WithJsonSchema(_results_schema(2)),
+]
+ResultEmbeddings = Annotated[
+    _NDArray,
+    PlainValidator(_result_embeddings_array),
+    PlainSerializer(_results_tolist, when_used='json'),
+    WithJsonSchema(_results_schema(3)),
+]
+
+
 class QueryResult(BaseModel):
     """Model for a single query result."""
     
@@ -128,10 +216,10 @@ class QueryResponse(BaseModel):
     """Model for a query response."""
     
     ids: List[List[str]] = Field(..., description="IDs for each query result")
-    distances: Optional[List[List[float]]] = Field(None, description="Distances for each query result")
+    distances: Optional[ResultDistances] = Field(None, description="Distances for each query result")
     metadatas: Optional[List[List[Dict[str, Any]]]] = Field(None, description="Metadata for each query result")
     documents: Optional[List[List[str]]] = Field(None, description="Documents for each query result")
-    embeddings: Optional[List[List[List[float]]]] = Field(None, description="Embeddings for each query result")
+    embeddings: Optional[ResultEmbeddings] = Field(None, description="Embeddings for each query result")
     uris: Optional[List[List[str]]] = Field(None, description="URIs for each query result")
     
     def get_results(self, query_idx: int = 0) -> List[QueryResult]:
@@ -143,31 +231,38 @@ class QueryResponse(BaseModel):
             
         Returns:
             List of QueryResult objects
+            
+        Raises:
+            IndexError: If the query index is out of range
+            ValueError: If a result column has a different length than the IDs
         """
         if query_idx >= len(self.ids):
             raise IndexError(f"Query index {query_idx} out of range (0-{len(self.ids)-1})")
             
-        results = []
+        # Results come from the server, so build them without validation; each
+        # optional column is either this query's list or an endless run of None
+        ids = self.ids[query_idx]
+        distances = self.distances[query_idx].tolist() if self.distances is not None else repeat(None)
+        metadatas = self.metadatas[query_idx] if self.metadatas is not None else repeat(None)
+        documents = self.documents[query_idx] if self.documents is not None else repeat(None)
+        embeddings = self.embeddings[query_idx].tolist() if self.embeddings is not None else repeat(None)
+        uris = self.uris[query_idx] if self.uris is not None else repeat(None)
+        
+        # zip would silently drop results past the end of a short column
+        columns = (("distances", distances), ("metadatas", metadatas), ("documents", documents),
+                   ("embeddings", embeddings), ("uris", uris))
+        for name, column in columns:
+            if not isinstance(column, repeat) and len(column) != len(ids):
+                raise ValueError(
+                    f"Query {query_idx} has {len(ids)} ids but {len(column)} {name}"
+                )
+        
+        construct = QueryResult.model_construct
+        results = [
+            construct(id=item_id, distance=distance, metadata=metadata,
+                      document=document, embedding=embedding, uri=uri)
+            for item_id, distance, metadata, document, embedding, uri
+            in zip(ids, distances, metadatas, documents, embeddings, uris)
+        ]
         
-        for i, item_id in enumerate(self.ids[query_idx]):
-            result = QueryResult(id=item_id)
-            
-            # Add optional fields if available
-            if self.distances is not None:
-                result.distance = self.distances[query_idx][i]
-                
-            if self.metadatas is not None:
-                result.metadata = self.metadatas[query_idx][i]
-                
-            if self.documents is not None:
-                result.document = self.documents[query_idx][i]
-                
-            if self.embeddings is not None:
-                result.embedding = self.embeddings[query_idx][i]
-                
-            if self.uris is not None:
-                result.uri = self.uris[query_idx][i]
-                
-            results.append(result)
-            
         return results
\ No newline at end of file
@@ -3,8 +3,9 @@ Response models for ChromaLens.
 """
 
 from typing import Optional, Dict, List, Any, Generic, TypeVar, Union
-from pydantic import BaseModel, Field
-from pydantic.generics import GenericModel
+from pydantic import BaseModel, ConfigDict, Field
+
+from chromalens.models._examples import schema_example
 
 T = TypeVar('T')
 
@@ -22,37 +23,16 @@ class ErrorResponse(BaseModel):
     
     detail: Union[str, List[ErrorDetail]] = Field(..., description="Error details")
     
-    class Config:
-        """Pydantic config for ErrorResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "detail": [
-                    {
-                        "loc": ["body", "name"],
-                        "msg": "field required",
-                        "type": "value_error.missing"
-                    }
-                ]
-            }
-        }
-
-
-class SuccessResponse(GenericModel, Generic[T]):
+    model_config = ConfigDict(json_schema_extra=schema_example("ErrorResponse"))
+
+
+class SuccessResponse(BaseModel, Generic[T]):
     """Generic model for successful API responses."""
     
     data: T = Field(..., description="Response data")
     status: str = Field("success", description="Response status")
     
-    class Config:
-        """Pydantic config for SuccessResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "data": {},
-                "status": "success"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("SuccessResponse"))
 
 
 class HeartbeatResponse(BaseModel):
@@ -60,14 +40,7 @@ class HeartbeatResponse(BaseModel):
     
     nanosecond_time: int = Field(..., description="Server time in nanoseconds")
     
-    class Config:
-        """Pydantic config for HeartbeatResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "nanosecond_time": 1631234567890123456
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("HeartbeatResponse"))
 
 
 class VersionResponse(BaseModel):
@@ -75,14 +48,7 @@ class VersionResponse(BaseModel):
     
     version: str = Field(..., description="Server version")
     
-    class Config:
-        """Pydantic config for VersionResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "version": "0.4.0"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("VersionResponse"))
 
 
 class ResetResponse(BaseModel):
@@ -90,14 +56,7 @@ class ResetResponse(BaseModel):
     
     success: bool = Field(..., description="Whether the reset was successful")
     
-    class Config:
-        """Pydantic config for ResetResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "success": True
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("ResetResponse"))
 
 
 class PreFlightCheckResponse(BaseModel):
@@ -105,74 +64,28 @@ class PreFlightCheckResponse(BaseModel):
     
     results: Dict[str, Any] = Field(..., description="Pre-flight check results")
     
-    class Config:
-        """Pydantic config for PreFlightCheckResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "results": {
-                    "check1": True,
-                    "check2": "OK"
-                }
-            }
-        }
-
-
-class AddResponse(BaseModel):
-    """Model for the add response."""
+    model_config = ConfigDict(json_schema_extra=schema_example("PreFlightCheckResponse"))
+
+
+class _BoolSuccessResponse(BaseModel):
+    """Shared shape of responses that only report success."""
     
     success: bool = Field(True, description="Whether the operation was successful")
     
-    class Config:
-        """Pydantic config for AddResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "success": True
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("_BoolSuccessResponse"))
+
+
+class AddResponse(_BoolSuccessResponse):
+    """Model for the add response."""
 
 
-class UpdateResponse(BaseModel):
+class UpdateResponse(_BoolSuccessResponse):
     """Model for the update response."""
-    
-    success: bool = Field(True, description="Whether the operation was successful")
-    
-    class Config:
-        """Pydantic config for UpdateResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "success": True
-            }
-        }
 
 
-class UpsertResponse(BaseModel):
+class UpsertResponse(_BoolSuccessResponse):
     """Model for the upsert response."""
-    
-    success: bool = Field(True, description="Whether the operation was successful")
-    
-    class Config:
-        """Pydantic config for UpsertResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "success": True
-            }
-        }
 
 
-class DeleteResponse(BaseModel):
+class DeleteResponse(_BoolSuccessResponse):
     """Model for the delete response."""
-    
-    success: bool = Field(True, description="Whether the operation was successful")
-    
-    class Config:
-        """Pydantic config for DeleteResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "success": True
-            }
-        }
\ No newline at end of file
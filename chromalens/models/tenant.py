@@ -3,7 +3,10 @@ Tenant models for ChromaLens.
 """
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from chromalens.models._examples import schema_example
+from chromalens.models._validators import validate_name
 
 
 class TenantCreate(BaseModel):
@@ -11,15 +14,11 @@ class TenantCreate(BaseModel):
     
     name: str = Field(..., description="Name of the tenant")
     
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def name_must_be_valid(cls, v):
         """Validate tenant name format."""
-        if not v or not v.strip():
-            raise ValueError("Tenant name cannot be empty")
-        if len(v) > 64:
-            raise ValueError("Tenant name cannot exceed 64 characters")
-        # Add additional validation rules if needed
-        return v
+        return validate_name(v, "Tenant")
 
 
 class Tenant(BaseModel):
@@ -28,15 +27,7 @@ class Tenant(BaseModel):
     id: str = Field(..., description="Unique ID of the tenant")
     name: str = Field(..., description="Name of the tenant")
     
-    class Config:
-        """Pydantic config for Tenant model."""
-        
-        schema_extra = {
-            "example": {
-                "id": "00000000-0000-0000-0000-000000000000",
-                "name": "default_tenant"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("Tenant"))
 
 
 class TenantsResponse(BaseModel):
@@ -44,23 +35,7 @@ class TenantsResponse(BaseModel):
     
     tenants: list[Tenant] = Field(..., description="List of tenants")
     
-    class Config:
-        """Pydantic config for TenantsResponse model."""
-        
-        schema_extra = {
-            "example": {
-                "tenants": [
-                    {
-                        "id": "00000000-0000-0000-0000-000000000000",
-                        "name": "default_tenant"
-                    },
-                    {
-                        "id": "11111111-1111-1111-1111-111111111111",
-                        "name": "custom_tenant"
-                    }
-                ]
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=schema_example("TenantsResponse"))
 
 
 class TenantUpdateRequest(BaseModel):
@@ -68,14 +43,8 @@ class TenantUpdateRequest(BaseModel):
     
     new_name: Optional[str] = Field(None, description="New name for the tenant")
     
-    @validator('new_name')
+    @field_validator('new_name')
+    @classmethod
     def name_must_be_valid(cls, v):
         """Validate tenant name format."""
-        if v is None:
-            return v
-        if not v or not v.strip():
-            raise ValueError("Tenant name cannot be empty")
-        if len(v) > 64:
-            raise ValueError("Tenant name cannot exceed 64 characters")
-        # Add additional validation rules if needed
-        return v
\ No newline at end of file
+        return validate_name(v, "Tenant")
@@ -1,52 +1,118 @@
 """
 Utility modules for ChromaLens.
+
+Names are imported lazily on first access (PEP 562), so importing one helper
+does not load every utility module and its dependencies.
 """
 
-from chromalens.utils.validators import (
-    validate_not_empty,
-    validate_uuid,
-    validate_name,
-    validate_embeddings,
-    validate_ids,
-    validate_lists_same_length,
-    validate_metadata,
-    validate_documents,
-    validate_where_clause,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from chromalens.utils.validators import (
+        validate_not_empty,
+        validate_uuid,
+        validate_name,
+        validate_embeddings,
+        validate_ids,
+        validate_lists_same_length,
+        validate_metadata,
+        validate_documents,
+        validate_where_clause,
+        validate_add_payload,
+        make_schema_validator,
+        NAME_ALLOWED_CHARS,
+    )
 
-from chromalens.utils.formatters import (
-    format_json,
-    format_timestamp,
-    format_size,
-    format_duration,
-    format_list,
-    format_metadata,
-    format_document,
-    format_collection_info,
-    format_table,
-    format_query_results,
-)
+    from chromalens.utils.formatters import (
+        format_json,
+        format_timestamp,
+        format_size,
+        format_duration,
+        format_list,
+        format_metadata,
+        format_document,
+        format_collection_info,
+        format_table,
+        format_query_results,
+    )
 
-from chromalens.utils.embedding_functions import (
-    EmbeddingFunction,
-    DefaultEmbeddingFunction,
-    OpenAIEmbeddingFunction,
-    HuggingFaceEmbeddingFunction,
-    CohereEmbeddingFunction,
-    get_embedding_function,
-    text_to_embeddings,
-    cosine_similarity,
-    euclidean_distance,
-)
+    from chromalens.utils.embedding_functions import (
+        EmbeddingFunction,
+        DefaultEmbeddingFunction,
+        OpenAIEmbeddingFunction,
+        HuggingFaceEmbeddingFunction,
+        CohereEmbeddingFunction,
+        get_embedding_function,
+        clear_embedding_function_cache,
+        text_to_embeddings,
+        cosine_similarity,
+        euclidean_distance,
+        cosine_similarity_batch,
+        euclidean_distance_batch,
+    )
 
-from chromalens.utils.auth import (
-    get_api_key,
-    get_auth_headers,
-    decode_jwt_token,
-    is_token_expired,
-    get_token_expiration_time,
-    get_token_user_info,
-)
+    from chromalens.utils.auth import (
+        get_api_key,
+        get_auth_headers,
+        clear_auth_cache,
+        decode_jwt_token,
+        is_token_expired,
+        get_token_expiration_time,
+        get_token_user_info,
+    )
+
+# Public name -> module that defines it
+_LAZY = {
+    # Validators
+    'validate_not_empty': 'chromalens.utils.validators',
+    'validate_uuid': 'chromalens.utils.validators',
+    'validate_name': 'chromalens.utils.validators',
+    'validate_embeddings': 'chromalens.utils.validators',
+    'validate_ids': 'chromalens.utils.validators',
+    'validate_lists_same_length': 'chromalens.utils.validators',
+    'validate_metadata': 'chromalens.utils.validators',
+    'validate_documents': 'chromalens.utils.validators',
+    'validate_where_clause': 'chromalens.utils.validators',
+    'validate_add_payload': 'chromalens.utils.validators',
+    'make_schema_validator': 'chromalens.utils.validators',
+    'NAME_ALLOWED_CHARS': 'chromalens.utils.validators',
+    
+    # Formatters
+    'format_json': 'chromalens.utils.formatters',
+    'format_timestamp': 'chromalens.utils.formatters',
+    'format_size': 'chromalens.utils.formatters',
+    'format_duration': 'chromalens.utils.formatters',
+    'format_list': 'chromalens.utils.formatters',
+    'format_metadata': 'chromalens.utils.formatters',
+    'format_document': 'chromalens.utils.formatters',
+    'format_collection_info': 'chromalens.utils.formatters',
+    'format_table': 'chromalens.utils.formatters',
+    'format_query_results': 'chromalens.utils.formatters',
+    
+    # Embedding Functions
+    'EmbeddingFunction': 'chromalens.utils.embedding_functions',
+    'DefaultEmbeddingFunction': 'chromalens.utils.embedding_functions',
+    'OpenAIEmbeddingFunction': 'chromalens.utils.embedding_functions',
+    'HuggingFaceEmbeddingFunction': 'chromalens.utils.embedding_functions',
+    'CohereEmbeddingFunction': 'chromalens.utils.embedding_functions',
+    'get_embedding_function': 'chromalens.utils.embedding_functions',
+    'clear_embedding_function_cache': 'chromalens.utils.embedding_functions',
+    'text_to_embeddings': 'chromalens.utils.embedding_functions',
+    'cosine_similarity': 'chromalens.utils.embedding_functions',
+    'euclidean_distance': 'chromalens.utils.embedding_functions',
+    'cosine_similarity_batch': 'chromalens.utils.embedding_functions',
+    'euclidean_distance_batch': 'chromalens.utils.embedding_functions',
+    
+    # Auth
+    'get_api_key': 'chromalens.utils.auth',
+    'get_auth_headers': 'chromalens.utils.auth',
+    'clear_auth_cache': 'chromalens.utils.auth',
+    'decode_jwt_token': 'chromalens.utils.auth',
+    'is_token_expired': 'chromalens.utils.auth',
+    'get_token_expiration_time': 'chromalens.utils.auth',
+    'get_token_user_info': 'chromalens.utils.auth',
+}
 
 __all__ = [
     # Validators
@@ -59,6 +125,9 @@ __all__ = [
     'validate_metadata',
     'validate_documents',
     'validate_where_clause',
+    'validate_add_payload',
+    'make_schema_validator',
+    'NAME_ALLOWED_CHARS',
     
     # Formatters
     'format_json',
@@ -79,15 +148,34 @@ __all__ = [
     'HuggingFaceEmbeddingFunction',
     'CohereEmbeddingFunction',
     'get_embedding_function',
+    'clear_embedding_function_cache',
     'text_to_embeddings',
     'cosine_similarity',
     'euclidean_distance',
+    'cosine_similarity_batch',
+    'euclidean_distance_batch',
     
     # Auth
     'get_api_key',
     'get_auth_headers',
+    'clear_auth_cache',
     'decode_jwt_token',
     'is_token_expired',
     'get_token_expiration_time',
     'get_token_user_info',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access and cache it."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the public names, including ones not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,14 +5,45 @@ This module provides functions for handling authentication with ChromaDB.
 """
 
 import os
+import re
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 import base64
 import json
 import time
 
 logger = logging.getLogger(__name__)
 
+_BEARER_PREFIX = "Bearer "
+
+# header.payload.signature in the base64url alphabet (the signature may be empty)
+_JWT_SHAPE = re.compile(r'[A-Za-z0-9_-]+=*\.[A-Za-z0-9_-]+=*\.[A-Za-z0-9_-]*=*').fullmatch
+
+
+@lru_cache(maxsize=1)
+def _env_api_key() -> Optional[str]:
+    """Read the API key from the environment once."""
+    return os.environ.get("CHROMADB_API_KEY") or os.environ.get("CHROMA_API_KEY")
+
+
+@lru_cache(maxsize=32)
+def _auth_headers(api_key: Optional[str]) -> Dict[str, str]:
+    """Build the headers dict for a resolved API key once (never hand it out directly)."""
+    if api_key:
+        return {"Authorization": _BEARER_PREFIX + api_key}
+    return {}
+
+
+def clear_auth_cache() -> None:
+    """
+    Forget the cached environment API key and auth headers.
+    
+    Call this after changing CHROMADB_API_KEY or CHROMA_API_KEY at runtime.
+    """
+    _env_api_key.cache_clear()
+    _auth_headers.cache_clear()
+
 
 def get_api_key(api_key: Optional[str] = None) -> Optional[str]:
     """
@@ -27,27 +58,24 @@ def get_api_key(api_key: Optional[str] = None) -> Optional[str]:
     if api_key:
         return api_key
     
-    # Try to get from environment variables
-    return os.environ.get("CHROMADB_API_KEY") or os.environ.get("CHROMA_API_KEY")
+    # Try to get from environment variables (cached, see clear_auth_cache)
+    return _env_api_key()
 
 
 def get_auth_headers(api_key: Optional[str] = None) -> Dict[str, str]:
     """
     Get authentication headers for API requests.
     
+    The headers are built once per key; each call returns a fresh copy, so
+    callers may modify it.
+    
     Args:
         api_key: API key to use
         
     Returns:
         Dictionary of headers
     """
-    headers = {}
-    
-    api_key = get_api_key(api_key)
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
-    
-    return headers
+    return dict(_auth_headers(get_api_key(api_key)))
 
 
 def decode_jwt_token(token: str, verify: bool = False) -> Dict:
@@ -73,22 +101,38 @@ def decode_jwt_token(token: str, verify: bool = False) -> Dict:
     
     # Manual decode without verification
     if not verify:
-        parts = token.split('.')
-        if len(parts) != 3:
+        if not _JWT_SHAPE(token):
             raise ValueError("Invalid JWT token format")
         
-        # Decode the payload (middle part)
-        payload_b64 = parts[1]
-        # Add padding if needed
-        payload_b64 = payload_b64 + '=' * (4 - len(payload_b64) % 4) if len(payload_b64) % 4 else payload_b64
+        # Locate the two separators instead of splitting into a list
+        i = token.find('.')
+        j = token.find('.', i + 1)
+        
+        # Decode the payload (middle part); JWTs use unpadded URL-safe base64
+        payload_b64 = token[i + 1:j]
         
         try:
-            payload_bytes = base64.b64decode(payload_b64)
-            return json.loads(payload_bytes.decode('utf-8'))
+            payload_bytes = base64.urlsafe_b64decode(payload_b64 + '=' * (-len(payload_b64) & 3))
+            return json.loads(payload_bytes)
         except Exception as e:
             raise ValueError(f"Failed to decode JWT token: {e}")
 
 
+@lru_cache(maxsize=1024)
+def _decode_jwt_cached(token: str) -> Tuple[Dict, Any]:
+    """
+    Decode a JWT payload once per distinct token.
+    
+    Returns the shared payload dict (do not mutate) and the `exp` claim,
+    converted to an int once here when it is numeric.
+    """
+    payload = decode_jwt_token(token, verify=False)
+    exp = payload.get('exp')
+    if isinstance(exp, float):
+        exp = int(exp)
+    return payload, exp
+
+
 def is_token_expired(token: str) -> bool:
     """
     Check if a JWT token is expired.
@@ -100,8 +144,7 @@ def is_token_expired(token: str) -> bool:
         True if the token is expired, False otherwise
     """
     try:
-        payload = decode_jwt_token(token)
-        exp = payload.get('exp')
+        _, exp = _decode_jwt_cached(token)
         
         if not exp:
             # No expiration time in the token
@@ -127,7 +170,7 @@ def get_token_expiration_time(token: str) -> Optional[float]:
         Expiration time in seconds since epoch, or None if not available
     """
     try:
-        payload = decode_jwt_token(token)
+        payload, _ = _decode_jwt_cached(token)
         return payload.get('exp')
     
     except Exception as e:
@@ -146,7 +189,7 @@ def get_token_user_info(token: str) -> Dict:
         Dictionary of user information
     """
     try:
-        payload = decode_jwt_token(token)
+        payload, _ = _decode_jwt_cached(token)
         # Common fields in JWT tokens for user info
         user_info = {
             'user_id': payload.get('sub'),
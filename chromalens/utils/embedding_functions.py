@@ -4,20 +4,216 @@ Embedding function utilities for ChromaLens.
 This module provides helper functions and classes for generating embeddings.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import math
+import queue
+import sqlite3
+import threading
+import time
 import importlib
-from typing import Any, Callable, Dict, List, Optional, Union, Tuple, Type
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, singledispatch
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, Tuple, Type
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+Vector = Union[List[float], np.ndarray]
+Matrix = Union[List[List[float]], np.ndarray]
+
+# Output precisions and inference backends supported by HuggingFaceEmbeddingFunction
+_PRECISIONS = ("float32", "float16", "int8")
+_BACKENDS = ("torch", "onnx", "openvino")
+
+# Maximum number of elements in the difference block of euclidean_distance_batch
+_DISTANCE_BLOCK_SIZE = 1 << 20
+
+
+def _quantize_int8(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize embeddings to int8 with one symmetric scale per row.
+    
+    Args:
+        embeddings: Float matrix of shape (N, D)
+        
+    Returns:
+        Tuple of (int8 matrix, float32 per-row scales); ``q / scale``
+        approximately recovers the input
+    """
+    max_abs = np.abs(embeddings).max(axis=1, keepdims=True)
+    scales = np.divide(
+        127.0, max_abs, out=np.ones_like(max_abs, dtype=np.float32), where=max_abs != 0
+    ).astype(np.float32)
+    quantized = np.rint(embeddings * scales).astype(np.int8)
+    return quantized, scales[:, 0]
+
+
+def _require(module: str, label: str, install: str) -> None:
+    """
+    Check that an optional package is installed without importing it.
+    
+    Args:
+        module: Top-level module name to look for
+        label: Package name used in the error message
+        install: Name to pass to ``pip install``
+        
+    Raises:
+        ImportError: If the package is not installed
+    """
+    if importlib.util.find_spec(module) is None:
+        raise ImportError(
+            f"The {label} package is not installed. "
+            f"Please install it with `pip install {install}`."
+        )
+
+
+def _map_batches(
+    fn: Callable[[List[str]], List[List[float]]],
+    texts: List[str],
+    batch_size: int,
+    max_concurrency: int,
+) -> List[List[float]]:
+    """
+    Embed texts in batches, with up to ``max_concurrency`` batches in flight.
+    
+    Args:
+        fn: Function that embeds one batch of texts
+        texts: List of texts to embed
+        batch_size: Maximum number of texts per batch
+        max_concurrency: Maximum number of batches sent at once
+        
+    Returns:
+        List of embedding vectors, in the order of ``texts``
+    """
+    it = iter(texts)
+    batches = list(iter(lambda: list(islice(it, batch_size)), []))
+    
+    results: Iterable[List[List[float]]]
+    if max_concurrency <= 1 or len(batches) <= 1:
+        results = map(fn, batches)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as pool:
+            results = list(pool.map(fn, batches))
+    
+    all_embeddings = []
+    for batch_embeddings in results:
+        all_embeddings.extend(batch_embeddings)
+    return all_embeddings
+
+
+class _DiskCache:
+    """SQLite store of float32 embeddings keyed by content hash."""
+    
+    # Stay under SQLite's limit on bound parameters per statement
+    _CHUNK = 500
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Path to the SQLite file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key BLOB PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.commit()
+    
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        """
+        Look up cached vectors.
+        
+        Args:
+            keys: Cache keys to look up
+            
+        Returns:
+            Dictionary of the keys that were found and their vectors
+        """
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), self._CHUNK):
+                chunk = keys[start:start + self._CHUNK]
+                rows = self._conn.execute(
+                    "SELECT key, vector FROM embeddings WHERE key IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+    
+    def put_many(self, vectors: Dict[bytes, List[float]]) -> None:
+        """
+        Store vectors, replacing any existing entries.
+        
+        Args:
+            vectors: Dictionary of cache keys to vectors
+        """
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in vectors.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+            )
+
 
 class EmbeddingFunction:
-    """Base class for embedding functions."""
+    """
+    Base class for embedding functions.
     
-    def __call__(self, texts: List[str]) -> List[List[float]]:
+    Subclasses implement ``_embed``. ``__call__`` keeps a per-instance LRU
+    cache of recent results so repeated texts skip the provider entirely,
+    optionally backed by a persistent on-disk cache. Cached vectors are
+    stored as tuples and every call returns fresh lists, so callers may
+    mutate what they get back.
+    """
+    
+    cache_size: int = 0
+    _disk_cache: Optional[_DiskCache] = None
+    
+    def __init__(self, cache_size: int = 256, disk_cache: Optional[Union[str, Path]] = None):
         """
-        Generate embeddings for a list of texts.
+        Initialize the embedding cache.
+        
+        Args:
+            cache_size: Maximum number of cached embeddings (0 disables caching)
+            disk_cache: Path to a SQLite file that keeps embeddings across runs
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, Tuple[float, ...]]" = OrderedDict()
+        # Guards the LRU; __call__ runs from acall threads and shared instances
+        self._cache_lock = threading.Lock()
+        self._disk_cache = _DiskCache(disk_cache) if disk_cache is not None else None
+    
+    def _cache_prefix(self) -> str:
+        """Settings that change the embedding of a text, for cache keys."""
+        return (
+            f"{getattr(self, 'model_name', '')}|"
+            f"{getattr(self, 'dimensions', '')}|"
+            f"{getattr(self, 'input_type', '')}|"
+        )
+    
+    def clear_cache(self) -> None:
+        """Drop all embeddings cached in memory (the disk cache is kept)."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for a non-empty list of texts, bypassing the cache.
         
         Args:
             texts: List of texts to embed
@@ -28,7 +224,105 @@ class EmbeddingFunction:
         Raises:
             NotImplementedError: This method must be implemented by subclasses
         """
-        raise NotImplementedError("Subclasses must implement __call__")
+        raise NotImplementedError("Subclasses must implement _embed")
+    
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for a list of texts.
+        
+        Texts seen recently are served from the cache (then the disk cache,
+        if any), and only the distinct misses are passed to ``_embed``.
+        Every returned vector is a new list, even for repeated texts.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            List of embedding vectors
+        """
+        if not texts:
+            return []
+        disk_cache = self._disk_cache
+        if self.cache_size <= 0 and disk_cache is None:
+            unique = list(dict.fromkeys(texts))
+            if len(unique) == len(texts):
+                return self._embed(texts)
+            by_text = dict(zip(unique, self._embed(unique)))
+            return [list(by_text[text]) for text in texts]
+        
+        cache = self._cache
+        prefix = self._cache_prefix()
+        keys = [
+            hashlib.blake2b((prefix + text).encode(), digest_size=16).digest()
+            for text in texts
+        ]
+        
+        # None until filled from the cache or the provider
+        results: List[Any] = [None] * len(texts)
+        misses: Dict[bytes, str] = {}
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                vector = cache.get(key)
+                if vector is None:
+                    misses.setdefault(key, texts[i])
+                else:
+                    cache.move_to_end(key)
+                    results[i] = vector
+        
+        if misses:
+            embedded = disk_cache.get_many(list(misses)) if disk_cache is not None else {}
+            for key in embedded:
+                del misses[key]
+            
+            if misses:
+                fresh = dict(zip(misses, self._embed(list(misses.values()))))
+                if disk_cache is not None:
+                    disk_cache.put_many(fresh)
+                embedded.update(fresh)
+            
+            for i, vector in enumerate(results):
+                if vector is None:
+                    results[i] = embedded[keys[i]]
+            
+            if self.cache_size > 0:
+                frozen = {key: tuple(vector) for key, vector in embedded.items()}
+                with self._cache_lock:
+                    cache.update(frozen)
+                    while len(cache) > self.cache_size:
+                        cache.popitem(last=False)
+        
+        # Copies, so mutating one result cannot touch the cache or a duplicate
+        return [list(vector) for vector in results]
+    
+    def encode_matrix(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings as a single NumPy matrix.
+        
+        Use this when the result goes straight into a vector store or
+        distance kernel; providers that compute arrays natively override it
+        to skip building Python lists.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            Matrix of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.asarray(self(texts), dtype=np.float32)
+    
+    async def acall(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings without blocking the event loop.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            List of embedding vectors
+        """
+        return await asyncio.to_thread(self, texts)
 
 
 class DefaultEmbeddingFunction(EmbeddingFunction):
@@ -45,11 +339,12 @@ class DefaultEmbeddingFunction(EmbeddingFunction):
         Args:
             dimension: Dimensionality of the embeddings
         """
+        super().__init__(cache_size=0)
         self.dimension = dimension
     
     def __call__(self, texts: List[str]) -> List[List[float]]:
         """
-        Generate all-zeros embeddings.
+        Generate all-zeros embeddings, one new list per text.
         
         Args:
             texts: List of texts to embed
@@ -72,6 +367,12 @@ class OpenAIEmbeddingFunction(EmbeddingFunction):
         model_name: str = "text-embedding-ada-002",
         dimensions: Optional[int] = None,
         batch_size: int = 100,
+        cache_size: int = 256,
+        disk_cache: Optional[Union[str, Path]] = None,
+        max_concurrency: int = 1,
+        use_batch_api: bool = False,
+        batch_poll_interval: float = 30.0,
+        batch_timeout: Optional[float] = None,
     ):
         """
         Initialize the OpenAI embedding function.
@@ -81,26 +382,65 @@ class OpenAIEmbeddingFunction(EmbeddingFunction):
             model_name: Name of the OpenAI embedding model to use
             dimensions: Output dimensionality (if supported by the model)
             batch_size: Batch size for API calls
+            cache_size: Maximum number of cached embeddings (0 disables caching)
+            disk_cache: Path to a SQLite file that keeps embeddings across runs
+            max_concurrency: Maximum number of batches sent at once (1 sends
+                them one after another; raise it only within your rate limits)
+            use_batch_api: Submit texts through the OpenAI Batch API (half the
+                price, but results can take up to 24 hours)
+            batch_poll_interval: Seconds between Batch API status checks
+            batch_timeout: Seconds to wait for a Batch API job before
+                cancelling it (None waits for the job's completion window)
+            
+        Raises:
+            ImportError: If the openai package is not installed
+            ValueError: If batch_size is not positive
         """
-        try:
-            import openai
-        except ImportError:
-            raise ImportError(
-                "The OpenAI package is not installed. "
-                "Please install it with `pip install openai`."
-            )
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
         
-        self.openai_client = None
-        if hasattr(openai, "OpenAI"):  # OpenAI v1+
-            self.openai_client = openai.OpenAI(api_key=api_key)
-            self._call_fn = self._call_v1
-        else:  # Legacy OpenAI
-            openai.api_key = api_key
-            self._call_fn = self._call_legacy
+        super().__init__(cache_size=cache_size, disk_cache=disk_cache)
+        
+        # The SDK itself is imported on first use
+        _require("openai", "OpenAI", "openai")
+        
+        self.openai_client: Any = None
+        self._api_key = api_key
+        self._call_fn: Optional[Callable[[List[str]], List[List[float]]]] = None
+        self._client_lock = threading.Lock()
         
         self.model_name = model_name
         self.dimensions = dimensions
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.use_batch_api = use_batch_api
+        self.batch_poll_interval = batch_poll_interval
+        self.batch_timeout = batch_timeout
+    
+    def _ensure_client(self) -> None:
+        """
+        Import the OpenAI SDK and set up the client on first use.
+        
+        Raises:
+            ValueError: If the Batch API is requested with a pre-1.0 client
+        """
+        if self._call_fn is not None:
+            return
+        
+        with self._client_lock:
+            if self._call_fn is not None:
+                return
+            
+            import openai
+            
+            if hasattr(openai, "OpenAI"):  # OpenAI v1+
+                self.openai_client = openai.OpenAI(api_key=self._api_key)
+                self._call_fn = self._call_v1
+            else:  # Legacy OpenAI
+                if self.use_batch_api:
+                    raise ValueError("The OpenAI Batch API requires openai>=1.0")
+                openai.api_key = self._api_key
+                self._call_fn = self._call_legacy
     
     def _call_legacy(self, texts: List[str]) -> List[List[float]]:
         """
@@ -114,7 +454,7 @@ class OpenAIEmbeddingFunction(EmbeddingFunction):
         """
         import openai
         
-        kwargs = {"engine": self.model_name, "input": texts}
+        kwargs: Dict[str, Any] = {"engine": self.model_name, "input": texts}
         if self.dimensions is not None:
             kwargs["dimensions"] = self.dimensions
         
@@ -131,14 +471,14 @@ class OpenAIEmbeddingFunction(EmbeddingFunction):
         Returns:
             List of embedding vectors
         """
-        kwargs = {"model": self.model_name, "input": texts}
+        kwargs: Dict[str, Any] = {"model": self.model_name, "input": texts}
         if self.dimensions is not None:
             kwargs["dimensions"] = self.dimensions
         
         response = self.openai_client.embeddings.create(**kwargs)
         return [data.embedding for data in response.data]
     
-    def __call__(self, texts: List[str]) -> List[List[float]]:
+    def _embed(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings using the OpenAI API.
         
@@ -148,17 +488,121 @@ class OpenAIEmbeddingFunction(EmbeddingFunction):
         Returns:
             List of embedding vectors
         """
-        if not texts:
-            return []
+        self._ensure_client()
+        
+        if self.use_batch_api:
+            return self._call_batch_api(texts)
         
         # Process in batches to avoid hitting API limits
-        all_embeddings = []
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i:i+self.batch_size]
-            batch_embeddings = self._call_fn(batch_texts)
-            all_embeddings.extend(batch_embeddings)
+        assert self._call_fn is not None  # set by _ensure_client
+        return _map_batches(self._call_fn, texts, self.batch_size, self.max_concurrency)
+    
+    def _call_batch_api(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts through the OpenAI Batch API and wait for the results.
+        
+        Each chunk of ``batch_size`` texts becomes one request line, tagged
+        with its chunk number so the output can be put back in order. The
+        uploaded input file is deleted once the batch has finished.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            List of embedding vectors
+            
+        Raises:
+            RuntimeError: If the batch or any of its requests fails
+            TimeoutError: If the batch does not finish within ``batch_timeout``
+        """
+        client = self.openai_client
+        
+        lines = []
+        it = iter(texts)
+        for n, chunk in enumerate(iter(lambda: list(islice(it, self.batch_size)), [])):
+            body: Dict[str, Any] = {"model": self.model_name, "input": chunk}
+            if self.dimensions is not None:
+                body["dimensions"] = self.dimensions
+            lines.append(json.dumps({
+                "custom_id": str(n),
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": body,
+            }))
+        
+        input_file = client.files.create(
+            file=("embeddings.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        try:
+            batch = self._wait_for_batch(input_file.id)
+        finally:
+            try:
+                client.files.delete(input_file.id)
+            except Exception as e:
+                # Leave the original error (if any) to propagate
+                logger.warning(f"Failed to delete OpenAI batch input file {input_file.id}: {e}")
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+        
+        chunks: Dict[int, List[List[float]]] = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                raise RuntimeError(
+                    f"OpenAI batch {batch.id} request {record.get('custom_id')} failed: "
+                    f"{record.get('error') or response.get('body')}"
+                )
+            data = sorted(response["body"]["data"], key=lambda item: item["index"])
+            chunks[int(record["custom_id"])] = [item["embedding"] for item in data]
+        
+        if len(chunks) != len(lines):
+            raise RuntimeError(
+                f"OpenAI batch {batch.id} returned {len(chunks)} of {len(lines)} results"
+            )
+        
+        return [vector for n in range(len(lines)) for vector in chunks[n]]
+    
+    def _wait_for_batch(self, input_file_id: str) -> Any:
+        """
+        Start a Batch API job for an uploaded input file and poll until it ends.
+        
+        Args:
+            input_file_id: ID of the uploaded request file
+            
+        Returns:
+            The finished batch
+            
+        Raises:
+            TimeoutError: If the batch does not finish within ``batch_timeout``;
+                the batch is cancelled first
+        """
+        client = self.openai_client
+        batch = client.batches.create(
+            input_file_id=input_file_id,
+            endpoint="/v1/embeddings",
+            completion_window="24h",
+        )
         
-        return all_embeddings
+        deadline = None if self.batch_timeout is None else time.monotonic() + self.batch_timeout
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            delay = self.batch_poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    client.batches.cancel(batch.id)
+                    raise TimeoutError(
+                        f"OpenAI batch {batch.id} did not finish within {self.batch_timeout} seconds"
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            batch = client.batches.retrieve(batch.id)
+        
+        return batch
 
 
 class HuggingFaceEmbeddingFunction(EmbeddingFunction):
@@ -171,6 +615,11 @@ class HuggingFaceEmbeddingFunction(EmbeddingFunction):
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
         batch_size: int = 32,
         device: Optional[str] = None,
+        cache_size: int = 256,
+        disk_cache: Optional[Union[str, Path]] = None,
+        precision: str = "float32",
+        max_wait_ms: float = 20.0,
+        backend: str = "torch",
     ):
         """
         Initialize the Hugging Face embedding function.
@@ -179,44 +628,241 @@ class HuggingFaceEmbeddingFunction(EmbeddingFunction):
             model_name: Name of the Hugging Face model to use
             batch_size: Batch size for model inference
             device: Device to use for model inference (e.g., "cpu", "cuda")
+            cache_size: Maximum number of cached embeddings (0 disables caching)
+            disk_cache: Path to a SQLite file that keeps embeddings across runs
+            precision: Dtype of the matrices from `encode_matrix` ("float32",
+                "float16", or "int8"); int8 rows are scaled without their
+                scales, which preserves cosine similarity only (use
+                `encode_int8` to get the scales back). Lists returned by
+                calling the function always hold the model's float values
+            max_wait_ms: How long `submit` waits to fill a batch before encoding
+            backend: Inference backend ("torch", "onnx", or "openvino"); the
+                ONNX backend exports the model on first load and runs it with
+                ONNX Runtime (install with `pip install chromalens[onnx]`)
+                
+        Raises:
+            ImportError: If the sentence-transformers package is not installed
+            ValueError: If batch_size is not positive, or the precision or
+                backend is not supported
         """
-        try:
-            from sentence_transformers import SentenceTransformer
-        except ImportError:
-            raise ImportError(
-                "The sentence-transformers package is not installed. "
-                "Please install it with `pip install sentence-transformers`."
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if precision not in _PRECISIONS:
+            raise ValueError(
+                f"Unsupported precision: {precision}. "
+                f"Must be one of: {', '.join(_PRECISIONS)}"
             )
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Unsupported backend: {backend}. "
+                f"Must be one of: {', '.join(_BACKENDS)}"
+            )
+        
+        super().__init__(cache_size=cache_size, disk_cache=disk_cache)
+        
+        # The package itself is imported when the model is first needed
+        _require("sentence_transformers", "sentence-transformers", "sentence-transformers")
         
         self.model_name = model_name
         self.batch_size = batch_size
+        self.precision = precision
+        self.max_wait_ms = max_wait_ms
+        self.backend = backend
+        self.device = device
+        self._model = None
+        self._model_lock = threading.Lock()
         
-        # Load model
-        self.model = SentenceTransformer(model_name, device=device)
+        # Micro-batching state, started on the first `submit`
+        self._pending: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._batcher: Optional[threading.Thread] = None
+        self._batcher_lock = threading.Lock()
     
-    def __call__(self, texts: List[str]) -> List[List[float]]:
+    @property
+    def model(self) -> Any:
+        """The SentenceTransformer model, loaded on first use."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = self._load_model()
+        return self._model
+    
+    def _load_model(self) -> Any:
         """
-        Generate embeddings using the Hugging Face model.
+        Import sentence-transformers and load the model.
+        
+        Returns:
+            Loaded SentenceTransformer model
+        """
+        from sentence_transformers import SentenceTransformer
+        
+        # Only pass backend when needed, for older sentence-transformers
+        if self.backend == "torch":
+            model = SentenceTransformer(self.model_name, device=self.device)
+        else:
+            model = SentenceTransformer(self.model_name, device=self.device, backend=self.backend)
+        
+        # Half-precision weights only pay off on accelerators
+        if self.precision == "float16" and self.backend == "torch" and model.device.type != "cpu":
+            model.half()
+        
+        return model
+    
+    def _encode_raw(self, texts: List[str]) -> np.ndarray:
+        """
+        Run the model without applying the output precision.
         
         Args:
             texts: List of texts to embed
             
         Returns:
-            List of embedding vectors
+            Embedding matrix as returned by the model
         """
-        if not texts:
-            return []
-        
-        # Generate embeddings
-        embeddings = self.model.encode(
+        return self.model.encode(
             texts,
             batch_size=self.batch_size,
             show_progress_bar=False,
             convert_to_numpy=True,
         )
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Run the model and apply the output precision.
         
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            Embedding matrix
+        """
+        embeddings = self._encode_raw(texts)
+        
+        if self.precision == "int8":
+            embeddings, _ = _quantize_int8(embeddings)
+        else:
+            embeddings = embeddings.astype(self.precision, copy=False)
+        
+        return embeddings
+    
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings using the Hugging Face model.
+        
+        Python lists gain nothing from a smaller dtype, so the output
+        precision is only applied by `encode_matrix`.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            List of embedding vectors
+        """
         # Convert from numpy to list
-        return embeddings.tolist()
+        return self._encode_raw(texts).tolist()
+    
+    def encode_matrix(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings as the model's NumPy matrix, without list conversion.
+        
+        This bypasses the embedding caches.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            Matrix of shape (len(texts), dimension), with the configured
+            precision as its dtype
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=self.precision)
+        return self._encode(texts)
+    
+    def encode_int8(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate int8 embeddings together with their per-row scales.
+        
+        ``q / scales[:, None]`` approximately recovers the float embeddings,
+        so inner products and Euclidean distances can be computed from the
+        quantized matrix. This bypasses the embedding caches and ignores the
+        configured precision.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            Tuple of (int8 matrix of shape (len(texts), dimension),
+            float32 scales of shape (len(texts),))
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.int8), np.empty((0,), dtype=np.float32)
+        return _quantize_int8(self._encode_raw(texts))
+    
+    def submit(self, text: str) -> Future:
+        """
+        Queue one text for embedding together with other pending texts.
+        
+        Texts submitted within ``max_wait_ms`` of each other (up to
+        ``batch_size``) are encoded in a single model call, so many small
+        concurrent requests share the cost of one batch.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Future resolving to the embedding vector
+        """
+        if self._batcher is None:
+            with self._batcher_lock:
+                if self._batcher is None:
+                    self._batcher = threading.Thread(
+                        target=self._run_batcher, name="chromalens-embed-batcher", daemon=True
+                    )
+                    self._batcher.start()
+        
+        future: Future = Future()
+        self._pending.put((text, future))
+        return future
+    
+    async def encode_async(self, text: str) -> List[float]:
+        """
+        Embed one text through the micro-batcher without blocking the event loop.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector
+        """
+        return await asyncio.wrap_future(self.submit(text))
+    
+    def _run_batcher(self) -> None:
+        """Collect submitted texts into batches and encode them, forever."""
+        pending = self._pending
+        while True:
+            batch = [pending.get()]
+            deadline = time.monotonic() + self.max_wait_ms / 1000
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(pending.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            # Drop requests whose callers have already given up
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            
+            try:
+                vectors = self([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
 
 
 class CohereEmbeddingFunction(EmbeddingFunction):
@@ -230,6 +876,9 @@ class CohereEmbeddingFunction(EmbeddingFunction):
         model_name: str = "embed-english-v3.0",
         batch_size: int = 96,
         input_type: str = "search_document",
+        cache_size: int = 256,
+        disk_cache: Optional[Union[str, Path]] = None,
+        max_concurrency: int = 1,
     ):
         """
         Initialize the Cohere embedding function.
@@ -239,23 +888,45 @@ class CohereEmbeddingFunction(EmbeddingFunction):
             model_name: Name of the Cohere embedding model to use
             batch_size: Batch size for API calls
             input_type: Type of input ("search_document", "search_query", etc.)
+            cache_size: Maximum number of cached embeddings (0 disables caching)
+            disk_cache: Path to a SQLite file that keeps embeddings across runs
+            max_concurrency: Maximum number of batches sent at once (1 sends
+                them one after another; raise it only within your rate limits)
+            
+        Raises:
+            ImportError: If the cohere package is not installed
+            ValueError: If batch_size is not positive
         """
-        try:
-            import cohere
-        except ImportError:
-            raise ImportError(
-                "The cohere package is not installed. "
-                "Please install it with `pip install cohere`."
-            )
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        
+        super().__init__(cache_size=cache_size, disk_cache=disk_cache)
+        
+        # The SDK itself is imported on first use
+        _require("cohere", "cohere", "cohere")
         
-        self.client = cohere.Client(api_key)
+        self._api_key = api_key
+        self._client = None
+        self._client_lock = threading.Lock()
         self.model_name = model_name
         self.batch_size = batch_size
         self.input_type = input_type
+        self.max_concurrency = max_concurrency
     
-    def __call__(self, texts: List[str]) -> List[List[float]]:
+    @property
+    def client(self) -> Any:
+        """The Cohere client, created on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import cohere
+                    
+                    self._client = cohere.Client(self._api_key)
+        return self._client
+    
+    def _call_batch(self, texts: List[str]) -> List[List[float]]:
         """
-        Generate embeddings using the Cohere API.
+        Call the Cohere API for one batch.
         
         Args:
             texts: List of texts to embed
@@ -263,32 +934,82 @@ class CohereEmbeddingFunction(EmbeddingFunction):
         Returns:
             List of embedding vectors
         """
-        if not texts:
-            return []
+        response = self.client.embed(
+            texts=texts,
+            model=self.model_name,
+            input_type=self.input_type,
+        )
+        return response.embeddings
+    
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings using the Cohere API.
         
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            List of embedding vectors
+        """
         # Process in batches to avoid hitting API limits
-        all_embeddings = []
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i:i+self.batch_size]
-            response = self.client.embed(
-                texts=batch_texts,
-                model=self.model_name,
-                input_type=self.input_type,
-            )
-            all_embeddings.extend(response.embeddings)
-        
-        return all_embeddings
+        return _map_batches(self._call_batch, texts, self.batch_size, self.max_concurrency)
+
+
+def _create_embedding_function(
+    provider: str,
+    api_key: Optional[str],
+    model_name: Optional[str],
+    **kwargs: Any
+) -> EmbeddingFunction:
+    """Construct a new embedding function for a lower-cased provider name."""
+    if provider == "openai":
+        model = model_name or "text-embedding-ada-002"
+        return OpenAIEmbeddingFunction(api_key=api_key, model_name=model, **kwargs)
+    
+    elif provider == "huggingface" or provider == "hf":
+        model = model_name or "sentence-transformers/all-MiniLM-L6-v2"
+        return HuggingFaceEmbeddingFunction(model_name=model, **kwargs)
+    
+    elif provider == "cohere":
+        model = model_name or "embed-english-v3.0"
+        return CohereEmbeddingFunction(api_key=api_key, model_name=model, **kwargs)
+    
+    elif provider == "default":
+        dimension = kwargs.get("dimension", 768)
+        return DefaultEmbeddingFunction(dimension=dimension)
+    
+    else:
+        raise ValueError(f"Unsupported embedding provider: {provider}")
+
+
+@lru_cache(maxsize=32)
+def _cached_embedding_function(
+    provider: str,
+    api_key: Optional[str],
+    model_name: Optional[str],
+    kwargs_key: frozenset,
+) -> EmbeddingFunction:
+    """Construct an embedding function once per distinct set of arguments."""
+    return _create_embedding_function(provider, api_key, model_name, **dict(kwargs_key))
+
+
+def clear_embedding_function_cache() -> None:
+    """Drop the embedding functions cached by `get_embedding_function`."""
+    _cached_embedding_function.cache_clear()
 
 
 def get_embedding_function(
     provider: str,
     api_key: Optional[str] = None,
     model_name: Optional[str] = None,
-    **kwargs
+    **kwargs: Any
 ) -> EmbeddingFunction:
     """
     Get an embedding function by provider name.
     
+    Instances are cached by their arguments, so repeated calls reuse the
+    same client or loaded model instead of building a new one.
+    
     Args:
         provider: Name of the embedding provider (openai, huggingface, cohere, etc.)
         api_key: API key for the provider (if required)
@@ -303,24 +1024,13 @@ def get_embedding_function(
     """
     provider = provider.lower()
     
-    if provider == "openai":
-        model = model_name or "text-embedding-ada-002"
-        return OpenAIEmbeddingFunction(api_key=api_key, model_name=model, **kwargs)
-    
-    elif provider == "huggingface" or provider == "hf":
-        model = model_name or "sentence-transformers/all-MiniLM-L6-v2"
-        return HuggingFaceEmbeddingFunction(model_name=model, **kwargs)
-    
-    elif provider == "cohere":
-        model = model_name or "embed-english-v3.0"
-        return CohereEmbeddingFunction(api_key=api_key, model_name=model, **kwargs)
-    
-    elif provider == "default":
-        dimension = kwargs.get("dimension", 768)
-        return DefaultEmbeddingFunction(dimension=dimension)
+    try:
+        kwargs_key = frozenset(kwargs.items())
+    except TypeError:
+        # Unhashable arguments cannot be part of the cache key
+        return _create_embedding_function(provider, api_key, model_name, **kwargs)
     
-    else:
-        raise ValueError(f"Unsupported embedding provider: {provider}")
+    return _cached_embedding_function(provider, api_key, model_name, kwargs_key)
 
 
 def text_to_embeddings(
@@ -329,8 +1039,9 @@ def text_to_embeddings(
     api_key: Optional[str] = None,
     model_name: Optional[str] = None,
     dimension: int = 768,
-    **kwargs
-) -> List[List[float]]:
+    as_array: bool = False,
+    **kwargs: Any
+) -> Union[List[List[float]], np.ndarray]:
     """
     Convert texts to embeddings using the specified provider.
     
@@ -340,13 +1051,14 @@ def text_to_embeddings(
         api_key: API key for the provider (if required)
         model_name: Name of the model to use
         dimension: Dimensionality for the default embedding function
+        as_array: Return a NumPy matrix (via ``encode_matrix``) instead of lists
         **kwargs: Additional arguments for the embedding function
         
     Returns:
-        List of embedding vectors
+        List of embedding vectors, or a matrix if ``as_array`` is set
     """
     if not texts:
-        return []
+        return np.empty((0, 0), dtype=np.float32) if as_array else []
     
     # Get the embedding function
     embedding_fn = get_embedding_function(
@@ -358,50 +1070,220 @@ def text_to_embeddings(
     )
     
     # Generate embeddings
+    if as_array:
+        return embedding_fn.encode_matrix(texts)
     return embedding_fn(texts)
 
 
-def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+@lru_cache(maxsize=None)
+def _numba_kernels() -> Optional[Tuple[Callable, Callable]]:
+    """
+    Import numba and define the compiled kernels on first use.
+    
+    Importing numba loads LLVM, so it is deferred until a vector function
+    is first called with array inputs.
+    
+    Returns:
+        Tuple of (cosine kernel, euclidean kernel), or None if numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    
+    @numba.njit(cache=True, fastmath=True)
+    def cosine_kernel(a: np.ndarray, b: np.ndarray) -> float:  # pragma: no cover - compiled
+        """Fused dot product and norms, on values rescaled by their max-abs."""
+        scale_a = 0.0
+        scale_b = 0.0
+        for i in range(a.shape[0]):
+            scale_a = max(scale_a, abs(float(a[i])))
+            scale_b = max(scale_b, abs(float(b[i])))
+        if scale_a == 0.0 or scale_b == 0.0:
+            return 0.0
+        dot = 0.0
+        norm_a = 0.0
+        norm_b = 0.0
+        for i in range(a.shape[0]):
+            x = float(a[i]) / scale_a
+            y = float(b[i]) / scale_b
+            dot += x * y
+            norm_a += x * x
+            norm_b += y * y
+        return dot / math.sqrt(norm_a * norm_b)
+    
+    @numba.njit(cache=True, fastmath=True)
+    def euclidean_kernel(a: np.ndarray, b: np.ndarray) -> float:  # pragma: no cover - compiled
+        """Euclidean distance without a temporary difference array."""
+        total = 0.0
+        for i in range(a.shape[0]):
+            # Accumulate in float64 even for float32 inputs
+            diff = float(a[i]) - float(b[i])
+            total += diff * diff
+        return math.sqrt(total)
+    
+    return cosine_kernel, euclidean_kernel
+
+
+@singledispatch
+def _as_float(vec: Any) -> np.ndarray:
+    """
+    View a vector or matrix as a floating-point NumPy array, copying only if needed.
+    
+    float32 and float64 arrays are used as they are; everything else
+    (lists, integer arrays, ...) becomes float64, so integers up to 2**53
+    stay exact.
+    
+    Args:
+        vec: List, tuple, NumPy array or array-like (e.g., a torch tensor)
+        
+    Returns:
+        float32 or float64 array
+    """
+    # Duck-type torch tensors so torch is never imported here
+    if hasattr(vec, "detach"):
+        return _as_float(vec.detach().cpu().numpy())
+    return np.asarray(vec, dtype=np.float64)
+
+
+@_as_float.register
+def _(vec: np.ndarray) -> np.ndarray:
+    return vec if vec.dtype in (np.float32, np.float64) else vec.astype(np.float64)
+
+
+def _use_kernel(vec1: Vector, vec2: Vector, a: np.ndarray, b: np.ndarray) -> bool:
+    """Whether two array inputs can go through the compiled kernels."""
+    return (
+        isinstance(vec1, np.ndarray)
+        and isinstance(vec2, np.ndarray)
+        and a.ndim == 1
+        and a.shape == b.shape
+    )
+
+
+def cosine_similarity(vec1: Vector, vec2: Vector) -> float:
     """
     Calculate cosine similarity between two vectors.
     
+    When ``numba`` is installed, NumPy array inputs use a compiled kernel.
+    
     Args:
-        vec1: First vector
-        vec2: Second vector
+        vec1: First vector (list, array, or tensor; float arrays are not copied)
+        vec2: Second vector (list, array, or tensor; float arrays are not copied)
         
     Returns:
         Cosine similarity (between -1 and 1)
     """
-    # Convert to numpy arrays
-    a = np.array(vec1)
-    b = np.array(vec2)
+    a = _as_float(vec1)
+    b = _as_float(vec2)
     
-    # Calculate cosine similarity
-    dot_product = np.dot(a, b)
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
+    if _use_kernel(vec1, vec2, a, b):
+        kernels = _numba_kernels()
+        if kernels is not None:
+            return float(kernels[0](a, b))
     
     # Handle zero vectors
-    if norm_a == 0 or norm_b == 0:
+    scale_a = float(np.max(np.abs(a))) if a.size else 0.0
+    scale_b = float(np.max(np.abs(b))) if b.size else 0.0
+    if scale_a == 0 or scale_b == 0:
         return 0.0
     
-    return dot_product / (norm_a * norm_b)
+    # Cosine ignores scale, so bring both vectors to max-abs 1 first; the
+    # squared norms can then neither underflow nor overflow
+    a = a / scale_a
+    b = b / scale_b
+    
+    # Squared norms as dot products, so each vector is read once per product
+    return float(a @ b) / math.sqrt(float(a @ a) * float(b @ b))
 
 
-def euclidean_distance(vec1: List[float], vec2: List[float]) -> float:
+def euclidean_distance(vec1: Vector, vec2: Vector) -> float:
     """
     Calculate Euclidean distance between two vectors.
     
+    When ``numba`` is installed, NumPy array inputs use a compiled kernel.
+    
     Args:
-        vec1: First vector
-        vec2: Second vector
+        vec1: First vector (list, array, or tensor; float arrays are not copied)
+        vec2: Second vector (list, array, or tensor; float arrays are not copied)
         
     Returns:
         Euclidean distance
     """
-    # Convert to numpy arrays
-    a = np.array(vec1)
-    b = np.array(vec2)
+    a = _as_float(vec1)
+    b = _as_float(vec2)
+    
+    if _use_kernel(vec1, vec2, a, b):
+        kernels = _numba_kernels()
+        if kernels is not None:
+            return float(kernels[1](a, b))
     
     # Calculate Euclidean distance
-    return np.linalg.norm(a - b)
\ No newline at end of file
+    return float(np.linalg.norm(a - b))
+
+
+def _unit_rows(m: np.ndarray) -> np.ndarray:
+    """
+    Scale each row of a matrix to unit length, in float64.
+    
+    Rows are first divided by their max-abs value, so the squared norms can
+    neither underflow nor overflow. Zero rows are returned as zeros.
+    
+    Args:
+        m: Matrix of shape (N, D)
+        
+    Returns:
+        float64 matrix of shape (N, D)
+    """
+    m = np.asarray(m, dtype=np.float64)
+    scale = np.abs(m).max(axis=1, keepdims=True) if m.shape[1] else np.zeros((m.shape[0], 1))
+    nonzero = scale != 0
+    m = np.divide(m, scale, out=np.zeros_like(m), where=nonzero)
+    norm = np.sqrt(np.einsum('ij,ij->i', m, m))[:, None]
+    return np.divide(m, norm, out=np.zeros_like(m), where=nonzero)
+
+
+def cosine_similarity_batch(vecs1: Matrix, vecs2: Matrix) -> np.ndarray:
+    """
+    Calculate cosine similarity between every pair of rows in two matrices.
+    
+    Args:
+        vecs1: First set of vectors, shape (N, D)
+        vecs2: Second set of vectors, shape (M, D)
+        
+    Returns:
+        Similarity matrix of shape (N, M), float32 only if both inputs are
+        float32; rows that are zero vectors score 0
+    """
+    a = _as_float(vecs1)
+    b = _as_float(vecs2)
+    dtype = np.result_type(a, b)
+    
+    # Normalize rows in float64 (zero rows stay zero), then one matrix product
+    result = _unit_rows(a) @ _unit_rows(b).T
+    return result.astype(dtype, copy=False)
+
+
+def euclidean_distance_batch(vecs1: Matrix, vecs2: Matrix) -> np.ndarray:
+    """
+    Calculate Euclidean distance between every pair of rows in two matrices.
+    
+    Args:
+        vecs1: First set of vectors, shape (N, D)
+        vecs2: Second set of vectors, shape (M, D)
+        
+    Returns:
+        Distance matrix of shape (N, M), float32 only if both inputs are float32
+    """
+    a = _as_float(vecs1)
+    b = _as_float(vecs2)
+    
+    # Differences are taken directly: the ||a||^2 + ||b||^2 - 2 a.b expansion
+    # cancels catastrophically for nearby vectors. Rows of `a` are processed
+    # in blocks so the (rows, M, D) difference array stays bounded.
+    out = np.empty((a.shape[0], b.shape[0]), dtype=np.result_type(a, b))
+    rows = max(1, _DISTANCE_BLOCK_SIZE // max(1, b.size))
+    for start in range(0, a.shape[0], rows):
+        diff = a[start:start + rows, None, :] - b[None, :, :]
+        np.sqrt(np.einsum('ijk,ijk->ij', diff, diff), out=out[start:start + rows])
+    return out
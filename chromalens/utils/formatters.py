@@ -5,15 +5,52 @@ This module provides functions for formatting data in user-friendly ways.
 """
 
 import json
+import math
+import time
+from bisect import bisect_right
 from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
 import textwrap
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Datetimes pass through to ``default=str`` so both encoders format them alike
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None else 0
+)
+
+# Largest plausible timestamp (exclusive) in seconds, ms and µs; anything
+# larger is taken as ns. 1e11 seconds is the year 5138.
+_TIMESTAMP_LIMITS = (1e11, 1e14, 1e17)
+_TIMESTAMP_DIVISORS = (1, 1e3, 1e6, 1e9)
+
+# (unit, divisor) per power of 1024, indexed by bit length
+_SIZE_UNITS = (("B", 1), ("KB", 1 << 10), ("MB", 1 << 20), ("GB", 1 << 30), ("TB", 1 << 40))
+
+# Upper bounds (exclusive) of each duration format below, in seconds
+_DURATION_THRESHOLDS = (0.001, 1, 60, 3600)
+_DURATION_FORMATS = (
+    lambda s: f"{s * 1000000:.2f} µs",
+    lambda s: f"{s * 1000:.2f} ms",
+    lambda s: f"{s:.2f} s",
+    lambda s: f"{int(s // 60)}m {int(s % 60)}s",
+    lambda s: f"{int(s // 3600)}h {int(s % 3600 // 60)}m",
+)
+
 
 def format_json(data: Any, indent: int = 2) -> str:
     """
     Format data as a pretty-printed JSON string.
     
+    Uses ``orjson`` when it is installed and ``indent`` is 2 (the only
+    indentation it supports), which also serializes NumPy arrays natively.
+    
     Args:
         data: Data to format
         indent: Number of spaces for indentation
@@ -21,6 +58,13 @@ def format_json(data: Any, indent: int = 2) -> str:
     Returns:
         Formatted JSON string
     """
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles these
+            pass
+    
     return json.dumps(data, indent=indent, ensure_ascii=False, default=str)
 
 
@@ -29,23 +73,20 @@ def format_timestamp(timestamp: Optional[int] = None) -> str:
     Format a timestamp as a human-readable date string.
     
     Args:
-        timestamp: Unix timestamp in seconds or None for current time
+        timestamp: Unix timestamp in seconds (milliseconds, microseconds and
+            nanoseconds are detected by magnitude) or None for current time
         
     Returns:
         Formatted date string
     """
     if timestamp is None:
-        dt = datetime.now()
+        timestamp = time.time()
     else:
-        # Handle timestamps in milliseconds or nanoseconds
-        if timestamp > 1e12:  # Nanoseconds
-            timestamp = timestamp / 1e9
-        elif timestamp > 1e9:  # Milliseconds
-            timestamp = timestamp / 1e3
-            
-        dt = datetime.fromtimestamp(timestamp)
+        divisor = _TIMESTAMP_DIVISORS[bisect_right(_TIMESTAMP_LIMITS, abs(timestamp))]
+        if divisor != 1:
+            timestamp = timestamp / divisor
     
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(math.floor(timestamp)))
 
 
 def format_size(size_bytes: int) -> str:
@@ -60,12 +101,11 @@ def format_size(size_bytes: int) -> str:
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.2f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+    
+    # Every 10 bits is one step up in units
+    idx = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    unit, divisor = _SIZE_UNITS[idx]
+    return f"{size_bytes / divisor:.2f} {unit}"
 
 
 def format_duration(seconds: float) -> str:
@@ -78,20 +118,7 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted duration string
     """
-    if seconds < 0.001:
-        return f"{seconds * 1000000:.2f} µs"
-    elif seconds < 1:
-        return f"{seconds * 1000:.2f} ms"
-    elif seconds < 60:
-        return f"{seconds:.2f} s"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        remaining_seconds = seconds % 60
-        return f"{int(minutes)}m {int(remaining_seconds)}s"
-    else:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        return f"{int(hours)}h {int(minutes)}m"
+    return _DURATION_FORMATS[bisect_right(_DURATION_THRESHOLDS, seconds)](seconds)
 
 
 def format_list(items: List[Any], max_items: int = 10) -> str:
@@ -211,28 +238,28 @@ def format_table(data: List[Dict[str, Any]], columns: Optional[List[str]] = None
     if columns is None:
         columns = list(data[0].keys())
     
+    # Stringify and truncate every cell once, for both the width and render passes
+    def _cell(value: Any) -> str:
+        text = str(value)
+        return text if len(text) <= max_width else text[:max_width-3] + "..."
+    
+    grid = [[_cell(row.get(col, "")) for col in columns] for row in data]
+    
     # Calculate column widths
-    col_widths = {col: len(col) for col in columns}
-    for row in data:
-        for col in columns:
-            if col in row:
-                col_widths[col] = max(col_widths[col], min(len(str(row[col])), max_width))
+    col_widths = [
+        max(len(col), min(max(map(len, texts)), max_width))
+        for col, texts in zip(columns, zip(*grid))
+    ]
     
     # Create header row
-    header = " | ".join(f"{col:{col_widths[col]}s}" for col in columns)
+    header = " | ".join(f"{col:{width}s}" for col, width in zip(columns, col_widths))
     separator = "-" * len(header)
     
     # Create data rows
-    rows = []
-    for row in data:
-        formatted_row = []
-        for col in columns:
-            value = row.get(col, "")
-            str_value = str(value)
-            if len(str_value) > max_width:
-                str_value = str_value[:max_width-3] + "..."
-            formatted_row.append(f"{str_value:{col_widths[col]}s}")
-        rows.append(" | ".join(formatted_row))
+    rows = [
+        " | ".join(f"{text:{width}s}" for text, width in zip(cells, col_widths))
+        for cells in grid
+    ]
     
     # Combine all parts
     return "\n".join([header, separator] + rows)
@@ -264,10 +291,17 @@ def format_query_results(results: Dict[str, Any], max_results: int = 5) -> str:
     query_count = len(ids)
     lines = []
     
-    for q_idx in range(query_count):
-        q_ids = ids[q_idx]
+    for q_idx, q_ids in enumerate(ids):
         result_count = len(q_ids)
         
+        # Look up this query's columns once rather than per result
+        q_distances = (distances[q_idx] if distances and len(distances) > q_idx else None) or ()
+        q_metadatas = (metadatas[q_idx] if metadatas and len(metadatas) > q_idx else None) or ()
+        q_documents = (documents[q_idx] if documents and len(documents) > q_idx else None) or ()
+        n_distances = len(q_distances)
+        n_metadatas = len(q_metadatas)
+        n_documents = len(q_documents)
+        
         if query_count > 1:
             lines.append(f"\nQuery {q_idx+1} Results:")
         
@@ -280,24 +314,19 @@ def format_query_results(results: Dict[str, Any], max_results: int = 5) -> str:
         
         # Display each result
         for i, item_id in enumerate(q_ids):
-            lines.append(f"\nResult {i+1}:")
-            lines.append(f"  ID: {item_id}")
+            lines += (f"\nResult {i+1}:", f"  ID: {item_id}")
             
-            if distances and len(distances) > q_idx and len(distances[q_idx]) > i:
-                lines.append(f"  Distance: {distances[q_idx][i]:.6f}")
+            if i < n_distances:
+                lines.append(f"  Distance: {q_distances[i]:.6f}")
             
-            if metadatas and len(metadatas) > q_idx and len(metadatas[q_idx]) > i:
-                md = metadatas[q_idx][i]
-                if md:
-                    lines.append("  Metadata:")
-                    for k, v in md.items():
-                        lines.append(f"    {k}: {v}")
+            md = q_metadatas[i] if i < n_metadatas else None
+            if md:
+                lines.append("  Metadata:")
+                lines += [f"    {k}: {v}" for k, v in md.items()]
             
-            if documents and len(documents) > q_idx and len(documents[q_idx]) > i:
-                doc = documents[q_idx][i]
-                if doc:
-                    lines.append("  Document:")
-                    doc_preview = textwrap.shorten(doc, width=80, placeholder="...")
-                    lines.append(f"    {doc_preview}")
+            doc = q_documents[i] if i < n_documents else None
+            if doc:
+                doc_preview = textwrap.shorten(doc, width=80, placeholder="...")
+                lines += ("  Document:", f"    {doc_preview}")
     
     return "\n".join(lines)
\ No newline at end of file
@@ -4,9 +4,47 @@ Validation utilities for ChromaLens.
 This module provides functions for validating inputs before making API calls.
 """
 
-import re
+import string
+import threading
 import uuid
-from typing import Any, Dict, List, Optional, Union, Tuple
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Set, Sized, Union, Tuple
+
+import numpy as np
+
+# Characters allowed in names checked by validate_name
+NAME_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+_LOWER_HEX_DIGITS = frozenset(string.digits + 'abcdef')
+
+# Where-clause keys that combine conditions rather than name a field
+_LOGICAL_OPS = frozenset(("$and", "$or", "$not"))
+
+# NumPy dtype kinds accepted as embedding values: bool, signed, unsigned, float
+_NUMERIC_KINDS = "biuf"
+
+# Exact types of numeric embedding values; subclasses (e.g. NumPy scalars)
+# still pass through the slower isinstance check
+_NUMERIC = (int, float, bool)
+
+_STR_TYPE = frozenset((str,))
+
+# Containers whose emptiness validate_not_empty rejects; the frozenset catches
+# the exact types with one hash lookup, the tuple catches their subclasses
+_EMPTY_CHECKABLE_TYPES = (str, list, dict, set, tuple)
+_EMPTY_CHECKABLE = frozenset(_EMPTY_CHECKABLE_TYPES)
+
+# Embedding payloads already validated with cache=True: id -> (ref, rows, dimension).
+# NumPy arrays are held by weak reference; lists cannot be, so they are held
+# strongly and up to _VALIDATED_EMBEDDINGS_SIZE whole payloads stay alive.
+# Either way the entry is only used while it still refers to the same object.
+_VALIDATED_EMBEDDINGS: "OrderedDict[int, Tuple[Any, int, int]]" = OrderedDict()
+_VALIDATED_EMBEDDINGS_SIZE = 16
+_validated_embeddings_lock = threading.Lock()
 
 
 def validate_not_empty(value: Any, name: str) -> Any:
@@ -26,12 +64,28 @@ def validate_not_empty(value: Any, name: str) -> Any:
     if value is None:
         raise ValueError(f"{name} cannot be None")
     
-    if isinstance(value, (str, list, dict, set, tuple)) and len(value) == 0:
+    if (type(value) in _EMPTY_CHECKABLE or isinstance(value, _EMPTY_CHECKABLE_TYPES)) and len(value) == 0:
         raise ValueError(f"{name} cannot be empty")
     
     return value
 
 
+@lru_cache(maxsize=4096)
+def _canonical_uuid(value: str) -> str:
+    """Parse a UUID string into its canonical form, memoizing repeated IDs."""
+    # Fast path: the usual 8-4-4-4-12 hex form is canonical once lower-cased
+    if len(value) == 36 and value[8] == value[13] == value[18] == value[23] == '-':
+        hex_part = value.replace('-', '')
+        if len(hex_part) == 32:
+            if _LOWER_HEX_DIGITS.issuperset(hex_part):
+                return value
+            if _HEX_DIGITS.issuperset(hex_part):
+                return value.lower()
+    
+    # Braced, URN and undashed forms (and errors) go through the uuid module
+    return str(uuid.UUID(value))
+
+
 def validate_uuid(value: str, name: str) -> str:
     """
     Validate that a string is a valid UUID.
@@ -46,11 +100,17 @@ def validate_uuid(value: str, name: str) -> str:
     Raises:
         ValueError: If the string is not a valid UUID
     """
+    # Non-strings are never valid UUIDs, and must not reach the cache
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a valid UUID")
+    
     try:
-        uuid_obj = uuid.UUID(value)
-        return str(uuid_obj)
-    except (ValueError, AttributeError, TypeError):
+        canonical = _canonical_uuid(value)
+    except ValueError:
         raise ValueError(f"{name} must be a valid UUID")
+    
+    # Hand back the caller's own string when it is already canonical
+    return value if canonical == value else canonical
 
 
 def validate_name(value: str, name: str, max_length: int = 64) -> str:
@@ -80,23 +140,62 @@ def validate_name(value: str, name: str, max_length: int = 64) -> str:
         raise ValueError(f"{name} cannot exceed {max_length} characters")
     
     # Check if the value contains only allowed characters
-    if not re.match(r'^[a-zA-Z0-9_-]+$', value):
+    if not NAME_ALLOWED_CHARS.issuperset(value):
         raise ValueError(f"{name} can only contain letters, numbers, underscores, and hyphens")
     
     return value
 
 
-def validate_embeddings(embeddings: List[List[float]], name: str = "embeddings", dimension: Optional[int] = None) -> List[List[float]]:
+def _is_numeric_row(emb: List[Any]) -> bool:
+    """Check that one embedding holds only numeric values."""
+    # One NumPy conversion checks a whole well-formed row in C
+    try:
+        row = np.asarray(emb)
+    except (ValueError, TypeError):
+        row = None
+    if row is not None and row.ndim == 1 and row.dtype.kind in _NUMERIC_KINDS:
+        return True
+    
+    # type() identity is one pointer compare per value; isinstance only
+    # runs for values that are not plain ints, floats or bools
+    return all(type(val) in _NUMERIC or isinstance(val, (int, float)) for val in emb)
+
+
+def _walk_embeddings(embeddings: List[List[Any]], name: str) -> int:
     """
-    Validate a list of embedding vectors.
+    Check list embeddings value by value, reporting the first problem found.
     
     Args:
-        embeddings: List of embedding vectors to validate
+        embeddings: Non-empty list of embedding lists
         name: Name of the value for the error message
-        dimension: Optional expected dimension for the embeddings
         
     Returns:
-        The original embeddings if valid
+        The dimension shared by all embeddings
+        
+    Raises:
+        ValueError: If a value is not numeric or the dimensions differ
+    """
+    # One pass over the rows, stopping at the first bad value or dimension
+    expected = len(embeddings[0])
+    for i, emb in enumerate(embeddings):
+        if not _is_numeric_row(emb):
+            raise ValueError(f"{name}[{i}] must contain only numeric values")
+        if len(emb) != expected:
+            raise ValueError(f"{name}[{i}] has dimension {len(emb)}, expected {expected}")
+    
+    return expected
+
+
+def _embedding_dimension(embeddings: Union[List[List[float]], np.ndarray], name: str) -> int:
+    """
+    Check the structure and values of embeddings.
+    
+    Args:
+        embeddings: List of embedding vectors (or 2-D NumPy array) to check
+        name: Name of the value for the error message
+        
+    Returns:
+        The dimension shared by all embeddings
         
     Raises:
         ValueError: If the embeddings are invalid
@@ -104,33 +203,119 @@ def validate_embeddings(embeddings: List[List[float]], name: str = "embeddings",
     # Check if the embeddings are not empty
     validate_not_empty(embeddings, name)
     
+    if isinstance(embeddings, np.ndarray):
+        if embeddings.ndim != 2 or embeddings.dtype.kind not in _NUMERIC_KINDS:
+            raise ValueError(f"{name} must be a 2-D numeric array")
+        if len(embeddings) == 0:
+            raise ValueError(f"{name} cannot be empty")
+        return int(embeddings.shape[1])
+    
     # Check if the embeddings are a list
     if not isinstance(embeddings, list):
         raise ValueError(f"{name} must be a list")
     
     # Check if the embeddings are a list of lists
-    if not all(isinstance(emb, list) for emb in embeddings):
+    if not all(type(emb) is list or isinstance(emb, list) for emb in embeddings):
         raise ValueError(f"{name} must be a list of lists")
     
-    # Check if the embeddings are a list of lists of floats
-    for i, emb in enumerate(embeddings):
-        if not all(isinstance(val, (int, float)) for val in emb):
-            raise ValueError(f"{name}[{i}] must contain only numeric values")
+    # One NumPy conversion checks the values are numeric and the shape rectangular
+    try:
+        arr = np.asarray(embeddings)
+    except (ValueError, TypeError):
+        arr = None
     
-    # Check if all embeddings have the same dimension
-    dimensions = set(len(emb) for emb in embeddings)
-    if len(dimensions) > 1:
-        raise ValueError(f"{name} must all have the same dimension, found dimensions: {dimensions}")
+    if arr is not None and arr.ndim == 2 and arr.dtype.kind in _NUMERIC_KINDS:
+        return int(arr.shape[1])
+    
+    # Walk the values to report exactly what is wrong (or to accept
+    # values NumPy cannot hold, like integers beyond 64 bits)
+    return _walk_embeddings(embeddings, name)
+
+
+def _cached_payload(ref: Any) -> Any:
+    """Get the payload of a validated-embeddings entry (None once collected)."""
+    return ref() if isinstance(ref, weakref.ref) else ref
+
+
+def validate_embeddings(embeddings: Union[List[List[float]], np.ndarray], name: str = "embeddings", dimension: Optional[int] = None, cache: bool = False) -> Union[List[List[float]], np.ndarray]:
+    """
+    Validate a list (or 2-D NumPy array) of embedding vectors.
+    
+    With ``cache=True`` the result is remembered for the payload object, and
+    validating the same object again only checks its length and dimension.
+    Only use it for payloads that are not mutated between calls. The cache
+    keeps the most recent list payloads alive; NumPy arrays are not kept.
+    
+    Args:
+        embeddings: List of embedding vectors to validate
+        name: Name of the value for the error message
+        dimension: Optional expected dimension for the embeddings
+        cache: Whether to reuse the result of an earlier validation of the same object
+        
+    Returns:
+        The original embeddings if valid
+        
+    Raises:
+        ValueError: If the embeddings are invalid
+    """
+    if not cache:
+        actual_dimension = _embedding_dimension(embeddings, name)
+    else:
+        key = id(embeddings)
+        with _validated_embeddings_lock:
+            entry = _VALIDATED_EMBEDDINGS.get(key)
+            if entry is not None:
+                _VALIDATED_EMBEDDINGS.move_to_end(key)
+        
+        if entry is not None and _cached_payload(entry[0]) is embeddings and entry[1] == len(embeddings):
+            actual_dimension = entry[2]
+        else:
+            actual_dimension = _embedding_dimension(embeddings, name)
+            ref = weakref.ref(embeddings) if isinstance(embeddings, np.ndarray) else embeddings
+            with _validated_embeddings_lock:
+                _VALIDATED_EMBEDDINGS[key] = (ref, len(embeddings), actual_dimension)
+                _VALIDATED_EMBEDDINGS.move_to_end(key)
+                if len(_VALIDATED_EMBEDDINGS) > _VALIDATED_EMBEDDINGS_SIZE:
+                    _VALIDATED_EMBEDDINGS.popitem(last=False)
     
     # Check if the embeddings have the expected dimension
-    if dimension is not None:
-        actual_dimension = next(iter(dimensions)) if dimensions else 0
-        if actual_dimension != dimension:
-            raise ValueError(f"{name} must have dimension {dimension}, found {actual_dimension}")
+    if dimension is not None and actual_dimension != dimension:
+        raise ValueError(f"{name} must have dimension {dimension}, found {actual_dimension}")
     
     return embeddings
 
 
+def _check_id_values(ids: List[Any], name: str) -> None:
+    """
+    Check that IDs are unique strings.
+    
+    Args:
+        ids: List of IDs to check
+        name: Name of the value for the error message
+        
+    Raises:
+        ValueError: If an ID is not a string or is repeated
+    """
+    # Common case: building the set and scanning the types both run in C;
+    # str subclasses (e.g. numpy.str_, str enums) fall through to the loop
+    try:
+        if len(set(ids)) == len(ids) and _STR_TYPE.issuperset(map(type, ids)):
+            return
+    except TypeError:
+        # Unhashable entries; the loop below reports them
+        pass
+    
+    # Check that the IDs are strings and unique in one pass, stopping at the first problem
+    seen: Set[str] = set()
+    add = seen.add
+    for i, id_ in enumerate(ids):
+        if type(id_) is not str and not isinstance(id_, str):
+            raise ValueError(f"{name} must contain only strings, found {type(id_).__name__} at index {i}")
+        if id_ in seen:
+            raise ValueError(f"{name} must contain unique values, found duplicate {id_!r} at index {i}")
+        add(id_)
+
+
 def validate_ids(ids: List[str], name: str = "ids") -> List[str]:
     """
     Validate a list of IDs.
@@ -152,41 +337,32 @@ def validate_ids(ids: List[str], name: str = "ids") -> List[str]:
     if not isinstance(ids, list):
         raise ValueError(f"{name} must be a list")
     
-    # Check if the IDs are a list of strings
-    if not all(isinstance(id_, str) for id_ in ids):
-        raise ValueError(f"{name} must contain only strings")
-    
-    # Check if the IDs are unique
-    if len(ids) != len(set(ids)):
-        raise ValueError(f"{name} must contain unique values")
+    _check_id_values(ids, name)
     
     return ids
 
 
-def validate_lists_same_length(*lists_with_names: Tuple[List[Any], str]) -> None:
+def validate_lists_same_length(*lists_with_names: Tuple[Optional[Sized], str]) -> None:
     """
     Validate that multiple lists have the same length.
     
     Args:
-        *lists_with_names: Tuples of (list, name) to validate
+        *lists_with_names: Tuples of (list, name) to validate; None lists are skipped
         
     Raises:
         ValueError: If the lists have different lengths
     """
-    # Filter out None values
-    non_none_lists = [(lst, name) for lst, name in lists_with_names if lst is not None]
-    
-    if len(non_none_lists) <= 1:
-        return
-    
-    # Get the length of the first list
-    first_list, first_name = non_none_lists[0]
-    expected_length = len(first_list)
-    
-    # Check if all other lists have the same length
-    for lst, name in non_none_lists[1:]:
-        if len(lst) != expected_length:
-            raise ValueError(f"{name} has length {len(lst)}, but {first_name} has length {expected_length}")
+    # Compare each list against the first one that is not None, in one pass
+    expected_length = None
+    first_name = None
+    for lst, name in lists_with_names:
+        if lst is None:
+            continue
+        length = len(lst)
+        if expected_length is None:
+            expected_length, first_name = length, name
+        elif length != expected_length:
+            raise ValueError(f"{name} has length {length}, but {first_name} has length {expected_length}")
 
 
 def validate_metadata(metadata: Union[Dict[str, Any], List[Dict[str, Any]]], name: str = "metadata") -> Union[Dict[str, Any], List[Dict[str, Any]]]:
@@ -210,19 +386,20 @@ def validate_metadata(metadata: Union[Dict[str, Any], List[Dict[str, Any]]], nam
     # Handle single dictionary case
     if isinstance(metadata, dict):
         # Validate keys are strings
-        if not all(isinstance(k, str) for k in metadata.keys()):
-            raise ValueError(f"All keys in {name} must be strings")
+        for k in metadata:
+            if type(k) is not str and not isinstance(k, str):
+                raise ValueError(f"All keys in {name} must be strings")
         return metadata
     
     # Handle list of dictionaries case
     if isinstance(metadata, list):
-        if not all(isinstance(m, dict) for m in metadata):
-            raise ValueError(f"{name} must be a list of dictionaries")
-        
-        # Validate keys in all dictionaries are strings
+        # Validate each entry is a dictionary with string keys, in one pass
         for i, m in enumerate(metadata):
-            if not all(isinstance(k, str) for k in m.keys()):
-                raise ValueError(f"All keys in {name}[{i}] must be strings")
+            if type(m) is not dict and not isinstance(m, dict):
+                raise ValueError(f"{name}[{i}] must be a dictionary")
+            for k in m:
+                if type(k) is not str and not isinstance(k, str):
+                    raise ValueError(f"All keys in {name}[{i}] must be strings")
         
         return metadata
     
@@ -251,7 +428,7 @@ def validate_documents(documents: List[str], name: str = "documents") -> List[st
         raise ValueError(f"{name} must be a list")
     
     # Check if the documents are a list of strings
-    if not all(isinstance(doc, str) for doc in documents):
+    if not all(type(doc) is str or isinstance(doc, str) for doc in documents):
         raise ValueError(f"{name} must contain only strings")
     
     return documents
@@ -271,35 +448,168 @@ def validate_where_clause(where: Dict[str, Any], name: str = "where") -> Dict[st
     Raises:
         ValueError: If the where clause is invalid
     """
-    if not isinstance(where, dict):
-        raise ValueError(f"{name} must be a dictionary")
-    
-    # Check for logical operators
-    logical_operators = ["$and", "$or", "$not"]
-    for op in logical_operators:
-        if op in where:
-            if op in ["$and", "$or"]:
-                if not isinstance(where[op], list):
-                    raise ValueError(f"{name}.{op} must be a list")
-                
-                # Recursively validate each condition in the list
-                for i, condition in enumerate(where[op]):
-                    validate_where_clause(condition, f"{name}.{op}[{i}]")
+    # Walk nested conditions with an explicit stack instead of recursion, so
+    # deeply nested filters cost no extra frames and hit no recursion limit
+    stack = [(where, name)]
+    while stack:
+        node, path = stack.pop()
+        if not isinstance(node, dict):
+            raise ValueError(f"{path} must be a dictionary")
+        
+        for field, condition in node.items():
+            if field in _LOGICAL_OPS:
+                if field == "$not":
+                    if not isinstance(condition, dict):
+                        raise ValueError(f"{path}.{field} must be a dictionary")
+                    
+                    stack.append((condition, f"{path}.{field}"))
+                else:
+                    if not isinstance(condition, list):
+                        raise ValueError(f"{path}.{field} must be a list")
+                    
+                    # Push in reverse so conditions are checked in order
+                    stack.extend(
+                        (condition[i], f"{path}.{field}[{i}]") for i in range(len(condition) - 1, -1, -1)
+                    )
             
-            elif op == "$not":
-                if not isinstance(where[op], dict):
-                    raise ValueError(f"{name}.{op} must be a dictionary")
-                
-                # Recursively validate the negated condition
-                validate_where_clause(where[op], f"{name}.{op}")
-    
-    # Check for field conditions (anything not a logical operator)
-    for field, condition in where.items():
-        if field not in logical_operators:
-            if isinstance(condition, dict):
+            elif isinstance(condition, dict):
                 # Validate operators
-                for op, value in condition.items():
-                    if not op.startswith("$"):
-                        raise ValueError(f"Invalid operator {op} in {name}.{field}")
+                for op in condition:
+                    if op[:1] != "$":
+                        raise ValueError(f"Invalid operator {op} in {path}.{field}")
+    
+    return where
+
+
+def validate_add_payload(
+    ids: List[str],
+    embeddings: Optional[Union[List[List[float]], np.ndarray]] = None,
+    documents: Optional[List[str]] = None,
+    metadatas: Optional[List[Dict[str, Any]]] = None,
+    dimension: Optional[int] = None,
+) -> None:
+    """
+    Validate the lists of an add/upsert payload together.
     
-    return where
\ No newline at end of file
+    Equivalent to calling validate_ids, validate_embeddings, validate_documents,
+    validate_metadata and validate_lists_same_length, but the per-item checks on
+    documents and metadatas share a single loop.
+    
+    Args:
+        ids: List of IDs
+        embeddings: Optional list of embedding vectors (or 2-D NumPy array)
+        documents: Optional list of document strings
+        metadatas: Optional list of metadata dictionaries
+        dimension: Optional expected dimension for the embeddings
+        
+    Raises:
+        ValueError: If any of the lists is invalid or their lengths differ
+    """
+    # Check if the IDs are not empty
+    validate_not_empty(ids, "ids")
+    
+    # Check if the lists are lists
+    for value, name in ((ids, "ids"), (documents, "documents"), (metadatas, "metadatas")):
+        if value is not None and not isinstance(value, list):
+            raise ValueError(f"{name} must be a list")
+    
+    # Check the lengths up front, so the loop below can index in lockstep
+    validate_lists_same_length(
+        (ids, "ids"), (embeddings, "embeddings"), (documents, "documents"), (metadatas, "metadatas")
+    )
+    
+    # Embeddings are checked as a whole by one NumPy conversion
+    if embeddings is not None:
+        validate_embeddings(embeddings, dimension=dimension)
+    
+    _check_id_values(ids, "ids")
+    
+    if documents is None and metadatas is None:
+        return
+    
+    check_documents = documents is not None
+    check_metadatas = metadatas is not None
+    items = zip(
+        documents if documents is not None else repeat(None),
+        metadatas if metadatas is not None else repeat(None),
+    )
+    for i, (doc, meta) in enumerate(items):
+        if check_documents and type(doc) is not str and not isinstance(doc, str):
+            raise ValueError(f"documents[{i}] must be a string")
+        
+        if check_metadatas:
+            if type(meta) is not dict and not isinstance(meta, dict):
+                raise ValueError(f"metadatas[{i}] must be a dictionary")
+            for k in meta:
+                if type(k) is not str and not isinstance(k, str):
+                    raise ValueError(f"All keys in metadatas[{i}] must be strings")
+
+
+@lru_cache(maxsize=None)
+def make_schema_validator(dimension: int, meta_keys: Optional[Tuple[str, ...]] = None) -> Callable[..., None]:
+    """
+    Build a payload validator specialized for one collection schema.
+    
+    The returned function ``validator(ids, embeddings, metadatas=None)`` checks
+    the same things as validate_add_payload for those lists, but is generated
+    with the dimension and the required metadata keys written into its code,
+    so it runs no loops or branches for them. Validators are cached per schema.
+    
+    Args:
+        dimension: Dimension every embedding must have
+        meta_keys: Keys every metadata dictionary must contain
+        
+    Returns:
+        Validator function raising ValueError for an invalid payload
+        
+    Raises:
+        ValueError: If the dimension or the metadata keys are invalid
+    """
+    if type(dimension) is not int or dimension <= 0:
+        raise ValueError("dimension must be a positive integer")
+    if meta_keys is not None and not all(isinstance(k, str) for k in meta_keys):
+        raise ValueError("meta_keys must contain only strings")
+    
+    lines = [
+        "def _validate_schema(ids, embeddings, metadatas=None):",
+        "    validate_not_empty(ids, 'ids')",
+        "    n = len(ids)",
+        "    if len(embeddings) != n:",
+        "        raise ValueError(f'embeddings has length {len(embeddings)}, but ids has length {n}')",
+        "    _check_id_values(ids, 'ids')",
+        # One NumPy conversion checks values and shape; the generic validator
+        # only runs to report what is wrong (or accept what NumPy cannot hold)
+        "    try:",
+        "        arr = np.asarray(embeddings)",
+        "    except (ValueError, TypeError):",
+        "        arr = None",
+        f"    if arr is None or arr.shape != (n, {dimension}) or arr.dtype.kind not in {_NUMERIC_KINDS!r}:",
+        f"        validate_embeddings(embeddings, dimension={dimension})",
+        "    if metadatas is None:",
+        "        return",
+        "    if len(metadatas) != n:",
+        "        raise ValueError(f'metadatas has length {len(metadatas)}, but ids has length {n}')",
+        "    for i, m in enumerate(metadatas):",
+        "        if type(m) is not dict and not isinstance(m, dict):",
+        "            raise ValueError(f'metadatas[{i}] must be a dictionary')",
+    ]
+    for key in meta_keys or ():
+        lines += [
+            f"        if {key!r} not in m:",
+            f"            raise ValueError(f'metadatas[{{i}}] is missing required key ' + {repr(repr(key))})",
+        ]
+    lines += [
+        "        for k in m:",
+        "            if type(k) is not str and not isinstance(k, str):",
+        "                raise ValueError(f'All keys in metadatas[{i}] must be strings')",
+    ]
+    
+    namespace: Dict[str, Any] = {
+        "np": np,
+        "validate_not_empty": validate_not_empty,
+        "validate_embeddings": validate_embeddings,
+        "_check_id_values": _check_id_values,
+    }
+    exec("\n".join(lines), namespace)
+    validator: Callable[..., None] = namespace["_validate_schema"]
+    return validator
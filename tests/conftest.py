@@ -13,6 +13,31 @@ try:
 except ImportError:
     ChromaLensClient = MagicMock()
 
+def pytest_addoption(parser):
+    """Add the --run-integration and --chroma-mode flags"""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run integration tests against a real ChromaDB server",
+    )
+    parser.addoption(
+        "--chroma-mode",
+        choices=("http", "ephemeral"),
+        default="http",
+        help="run integration tests against a ChromaDB server over HTTP, or an "
+             "in-process in-memory one (ephemeral; implies --run-integration)",
+    )
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked `integration` unless --run-integration or --chroma-mode=ephemeral is given"""
+    if config.getoption("--run-integration") or config.getoption("--chroma-mode") == "ephemeral":
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
 @pytest.fixture(scope="session")
 def temp_dir():
     """Create a temporary directory for test data"""
@@ -0,0 +1,45 @@
+"""
+Bulk data helpers for the integration tests.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+def bulk_add(
+    client,
+    collection_id: str,
+    embeddings: List[List[float]],
+    documents: Optional[List[str]] = None,
+    metadatas: Optional[List[Dict[str, Any]]] = None,
+    ids: Optional[List[str]] = None,
+    batch_size: int = 500,
+    **kwargs: Any,
+) -> List[Any]:
+    """
+    Add items in batches, one add request per batch rather than per item.
+
+    Args:
+        client: ChromaLensClient to add the items with
+        collection_id: ID of the collection
+        embeddings: List of embedding vectors
+        documents: Optional list of document strings
+        metadatas: Optional list of metadata dictionaries
+        ids: Optional list of IDs
+        batch_size: Maximum number of items per request
+        **kwargs: Passed through to `add_items` (e.g., tenant, database)
+
+    Returns:
+        The response of each add request
+    """
+    results = []
+    for start in range(0, len(embeddings), batch_size):
+        end = start + batch_size
+        results.append(client.add_items(
+            collection_id=collection_id,
+            embeddings=embeddings[start:end],
+            documents=documents[start:end] if documents is not None else None,
+            metadatas=metadatas[start:end] if metadatas is not None else None,
+            ids=ids[start:end] if ids is not None else None,
+            **kwargs
+        ))
+    return results
@@ -0,0 +1,64 @@
+"""
+In-process ChromaDB server for the integration tests.
+
+With ``--chroma-mode=ephemeral`` the client's requests are handed straight to
+an in-memory ChromaDB FastAPI app instead of going over a socket. Requires the
+``chromadb`` package (which brings FastAPI and its test client).
+"""
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class ASGIAdapter(BaseAdapter):
+    """requests transport adapter that sends requests to an in-process ASGI app."""
+
+    def __init__(self, app):
+        super().__init__()
+        from fastapi.testclient import TestClient
+        self._client = TestClient(app)
+
+    def send(self, request, **kwargs):
+        """Send a prepared request to the app and wrap its reply as a requests.Response."""
+        reply = self._client.request(
+            request.method,
+            request.url,
+            content=request.body,
+            headers=dict(request.headers),
+        )
+
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response._content = reply.content
+        response.encoding = reply.encoding
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        """Shut down the app's test client."""
+        self._client.close()
+
+
+def make_ephemeral_session() -> requests.Session:
+    """
+    Build a requests session served by an in-memory ChromaDB server.
+
+    Returns:
+        Session to pass to ChromaLensClient(session=...)
+
+    Raises:
+        ImportError: If chromadb is not installed
+    """
+    from chromadb.config import Settings
+    from chromadb.server.fastapi import FastAPI
+
+    server = FastAPI(Settings(is_persistent=False, allow_reset=True))
+    adapter = ASGIAdapter(server.app())
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -7,18 +7,31 @@ that the client works correctly in real-world scenarios.
 To run these tests:
 1. Ensure you have a ChromaDB server running
 2. Update the connection details below
-3. Run with: pytest -xvs tests/integration/test_real_client.py
+3. Run with: pytest --run-integration -xvs tests/integration/test_client_api.py
+   (or in parallel with pytest-xdist: pytest --run-integration -n auto tests/integration/test_client_api.py)
+
+Without --run-integration these tests are skipped. Use --log-cli-level=INFO to
+see the progress logs.
+
+To run them without a server, against an in-process in-memory ChromaDB
+(requires the chromadb package): pytest --chroma-mode=ephemeral tests/integration/test_client_api.py
 """
 
 import pytest
 import uuid
 import time
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from chromalens.client.client import ChromaLensClient
+from chromalens.exceptions.api import APIError
+from tests.integration._bulk import bulk_add
+from tests.integration._ephemeral import make_ephemeral_session
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Configure these variables with your ChromaDB connection details
@@ -44,32 +57,77 @@ SAMPLE_METADATA = [
     {"source": "test", "category": "description", "id": 5}
 ]
 
+
+@pytest.fixture(scope="session")
+def sample_embeddings():
+    """Random 384-dimension embeddings, generated once per session"""
+    import numpy as np
+    rng = np.random.default_rng(42)  # For reproducibility
+    # Kept as a float32 array: the client serializes arrays without a Python list detour
+    return rng.random((16, 384), dtype=np.float32)
+
+
+def _wait_for(predicate, timeout=2.0, initial=0.02):
+    """
+    Poll until `predicate()` is true, backing off exponentially up to 0.2s.
+    
+    Returns as soon as the expected state is visible instead of sleeping for a
+    fixed time; returns False if it is still not visible after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    for i in itertools.count():
+        if predicate():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(min(initial * 2 ** i, 0.2))
+
+
+@pytest.mark.integration
 class TestChromaLensClient:
     """Integration tests for ChromaLensClient with a real ChromaDB server"""
     
-    @pytest.fixture(scope="class")
-    def client(self):
+    @pytest.fixture(scope="session")
+    def client(self, request):
         """Create a real ChromaLensClient connected to a ChromaDB server"""
+        ephemeral = request.config.getoption("--chroma-mode") == "ephemeral"
         try:
+            if ephemeral:
+                # In-process, in-memory server: no sockets, and writes are
+                # visible immediately, so _wait_for returns on its first poll
+                session = make_ephemeral_session()
+            else:
+                # Keep one pool of connections alive for the whole session
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["Connection"] = "keep-alive"
+            
             client = ChromaLensClient(
                 host=CHROMA_HOST,
                 port=CHROMA_PORT,
                 ssl=USE_SSL,
-                api_key=API_KEY
+                api_key=API_KEY,
+                session=session
             )
-            # Test connection
-            heartbeat = client.heartbeat()
-            logger.info(f"Connected to ChromaDB server: {CHROMA_HOST}:{CHROMA_PORT}")
-            logger.info(f"Server heartbeat: {heartbeat}")
             
-            return client
+            # Test connection; the result is kept for test_heartbeat_and_version
+            client._initial_heartbeat = client.heartbeat()
+            logger.info(f"Connected to ChromaDB server: {CHROMA_HOST}:{CHROMA_PORT}")
+            logger.info(f"Server heartbeat: {client._initial_heartbeat}")
         except Exception as e:
             pytest.skip(f"Could not connect to ChromaDB server: {e}")
+        
+        yield client
+        client.close()
     
-    @pytest.fixture(scope="class")
-    def test_tenant(self, client):
-        """Create a temporary test tenant"""
-        tenant_name = f"test_tenant_{uuid.uuid4().hex[:8]}"
+    @pytest.fixture(scope="session")
+    def test_tenant(self, client, request):
+        """Create a temporary test tenant (one per pytest-xdist worker)"""
+        # Under `pytest -n auto` each worker gets its own tenant, database and collection
+        worker_id = getattr(request.config, "workerinput", {}).get("workerid", "master")
+        tenant_name = f"test_tenant_{worker_id}_{uuid.uuid4().hex[:8]}"
         logger.info(f"Creating test tenant: {tenant_name}")
         
         try:
@@ -85,7 +143,7 @@ class TestChromaLensClient:
             logger.error(f"Error creating test tenant: {e}")
             pytest.skip(f"Could not create test tenant: {e}")
     
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def test_database(self, client, test_tenant):
         """Create a temporary test database"""
         database_name = f"test_db_{uuid.uuid4().hex[:8]}"
@@ -107,9 +165,9 @@ class TestChromaLensClient:
             logger.error(f"Error creating test database: {e}")
             pytest.skip(f"Could not create test database: {e}")
     
-    @pytest.fixture(scope="function")
+    @pytest.fixture(scope="session")
     def test_collection(self, client, test_tenant, test_database):
-        """Create a temporary test collection for each test"""
+        """Create one temporary test collection shared by all tests"""
         collection_name = f"test_collection_{uuid.uuid4().hex[:8]}"
         logger.info(f"Creating test collection: {collection_name}")
         
@@ -135,12 +193,56 @@ class TestChromaLensClient:
             logger.error(f"Error creating test collection: {e}")
             pytest.skip(f"Could not create test collection: {e}")
     
+    @pytest.fixture(scope="session")
+    def sample_ids(self, client, test_tenant, test_database, test_collection, sample_embeddings):
+        """Add the sample documents to the shared collection once and return their IDs"""
+        ids = [f"doc_{i+1}" for i in range(len(SAMPLE_DOCUMENTS))]
+        
+        logger.info(f"Adding {len(ids)} documents to collection {test_collection}")
+        result = bulk_add(
+            client,
+            collection_id=test_collection,
+            # Random embeddings; in a real scenario, you would use proper embedding models
+            embeddings=sample_embeddings[:len(ids)],
+            documents=SAMPLE_DOCUMENTS,
+            metadatas=SAMPLE_METADATA,
+            ids=ids,
+            tenant=test_tenant,
+            database=test_database
+        )
+        logger.info(f"Add result: {result}")
+        
+        # Wait for documents to be indexed
+        _wait_for(lambda: len(client.get_items(
+            collection_id=test_collection,
+            ids=ids,
+            tenant=test_tenant,
+            database=test_database
+        )["ids"]) == len(ids))
+        return ids
+    
+    @pytest.fixture(scope="function")
+    def created_ids(self, client, test_tenant, test_database, test_collection):
+        """Track IDs a test adds to the shared collection and delete them afterwards"""
+        ids = []
+        yield ids
+        
+        if ids:
+            logger.info(f"Removing {len(ids)} test documents from {test_collection}")
+            try:
+                client.delete_items(
+                    collection_id=test_collection,
+                    ids=ids,
+                    tenant=test_tenant,
+                    database=test_database
+                )
+            except Exception as e:
+                logger.error(f"Error removing test documents: {e}")
+    
     def test_heartbeat_and_version(self, client):
         """Test basic server connection"""
-        # Test heartbeat
-        heartbeat = client.heartbeat()
-        assert heartbeat is not None
-        logger.info(f"Server heartbeat: {heartbeat}")
+        # Test heartbeat (already fetched by the client fixture)
+        assert client._initial_heartbeat is not None
         
         # Test version
         version = client.version()
@@ -161,76 +263,88 @@ class TestChromaLensClient:
         assert isinstance(initial_databases, list)
         logger.info(f"Initially found {len(initial_databases)} databases in tenant {test_tenant}")
         
-        # Create a new test database
-        new_db_name = f"test_db_created_{uuid.uuid4().hex[:8]}"
-        logger.info(f"Creating new test database: {new_db_name}")
-        
-        try:
-            # Create database - API returns 200 OK but no content
-            create_response = client.create_database(new_db_name, tenant=test_tenant)
-            # For APIs that return nothing or just a success status, this might be None, {} or True
-            logger.info(f"Database creation response: {create_response}")
+        # Count collections in the default database in the background; the count
+        # is independent of the database operations below. Leaving the block
+        # joins the worker, so nothing outlives the test.
+        default_db = client.database or "default_database"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            count_future = executor.submit(client.count_collections, database=default_db, tenant=test_tenant)
             
-            # Give the server a moment to process (if needed)
-            time.sleep(0.5)
+            # Create a new test database
+            new_db_name = f"test_db_created_{uuid.uuid4().hex[:8]}"
+            logger.info(f"Creating new test database: {new_db_name}")
             
-            # List databases again to confirm addition
-            updated_databases = client.list_databases(tenant=test_tenant)
+            def database_exists():
+                """Probe for the new database with one get instead of listing them all"""
+                try:
+                    client.get_database(new_db_name, tenant=test_tenant)
+                    return True
+                except APIError:
+                    return False
             
-            # Verify our new database exists in the list
-            updated_db_names = [d.get('name') for d in updated_databases]
-            assert new_db_name in updated_db_names, f"Newly created database {new_db_name} not found in listing"
-            logger.info(f"Confirmed new database exists in listing: {new_db_name}")
-            
-            # Get database info (if supported by the API)
             try:
+                # Create database - API returns 200 OK but no content
+                create_response = client.create_database(new_db_name, tenant=test_tenant)
+                # For APIs that return nothing or just a success status, this might be None, {} or True
+                logger.info(f"Database creation response: {create_response}")
+                
+                # Wait until the server has the new database
+                _wait_for(database_exists)
+                
+                # List databases again to confirm addition
+                updated_databases = client.list_databases(tenant=test_tenant)
+                updated_db_names = [d.get('name') for d in updated_databases]
+                assert new_db_name in updated_db_names, f"Newly created database {new_db_name} not found in listing"
+                logger.info(f"Confirmed new database exists in listing: {new_db_name}")
+                
+                # Get database info to confirm addition
                 database_info = client.get_database(new_db_name, tenant=test_tenant)
                 assert database_info is not None, "get_database returned None"
                 assert database_info.get('name') == new_db_name, "Database name in response doesn't match"
                 logger.info(f"Retrieved database info: {database_info}")
-            except Exception as e:
-                logger.warning(f"Could not get database info (this might be expected if the API doesn't support it): {e}")
-            
-            # Now delete the database
-            logger.info(f"Deleting test database: {new_db_name}")
-            delete_response = client.delete_database(new_db_name, tenant=test_tenant)
-            # For APIs that return nothing or just a success status
-            logger.info(f"Database deletion response: {delete_response}")
-            
-            # Give the server a moment to process (if needed)
-            time.sleep(0.5)
-            
-            # Verify deletion
-            final_databases = client.list_databases(tenant=test_tenant)
-            final_db_names = [d.get('name') for d in final_databases]
-            assert new_db_name not in final_db_names, f"Database {new_db_name} still exists after deletion"
-            logger.info(f"Confirmed database was deleted: {new_db_name}")
-                    # Count collections in the default database
-            try:
-                default_db = client.database or "default_database"
-                collection_count = client.count_collections(database=default_db, tenant=test_tenant)
-                logger.info(f"Number of collections in '{default_db}': {collection_count}")
                 
-                # Verify the count is a number
-                assert isinstance(collection_count, (int, float)), "Collection count should be a number"
+                # Now delete the database
+                logger.info(f"Deleting test database: {new_db_name}")
+                delete_response = client.delete_database(new_db_name, tenant=test_tenant)
+                # For APIs that return nothing or just a success status
+                logger.info(f"Database deletion response: {delete_response}")
+                
+                # Wait until the server no longer has the database
+                _wait_for(lambda: not database_exists())
                 
-                # If there are collections, try listing them
-                if collection_count > 0:
-                    collections = client.list_collections(database=default_db, tenant=test_tenant)
-                    logger.info(f"Found {len(collections)} collections in '{default_db}'")
-                    # Verify the list length matches the count
-                    assert len(collections) == collection_count, "Collection count doesn't match list length"
+                # Verify deletion
+                with pytest.raises(APIError):
+                    client.get_database(new_db_name, tenant=test_tenant)
+                final_databases = client.list_databases(tenant=test_tenant)
+                final_db_names = [d.get('name') for d in final_databases]
+                assert new_db_name not in final_db_names, f"Database {new_db_name} still exists after deletion"
+                logger.info(f"Confirmed database was deleted: {new_db_name}")
                 
+                # Count collections in the default database
+                try:
+                    collection_count = count_future.result()
+                    logger.info(f"Number of collections in '{default_db}': {collection_count}")
+                    
+                    # Verify the count is a number
+                    assert isinstance(collection_count, (int, float)), "Collection count should be a number"
+                    
+                    # If there are collections, try listing them
+                    if collection_count > 0:
+                        collections = client.list_collections(database=default_db, tenant=test_tenant)
+                        logger.info(f"Found {len(collections)} collections in '{default_db}'")
+                        # Verify the list length matches the count
+                        assert len(collections) == collection_count, "Collection count doesn't match list length"
+                    
+                except Exception as e:
+                    logger.warning(f"Error counting collections: {e}")
             except Exception as e:
-                logger.warning(f"Error counting collections: {e}")
-        except Exception as e:
-            logger.error(f"Error in database operations test: {e}")
-            # Try to clean up if something failed
-            try:
-                client.delete_database(new_db_name, tenant=test_tenant)
-            except:
-                pass
-            raise
+                logger.error(f"Error in database operations test: {e}")
+                # Try to clean up if something failed
+                try:
+                    client.delete_database(new_db_name, tenant=test_tenant)
+                except:
+                    pass
+                raise
 
     def test_collection_operations(self, client, test_tenant, test_database, test_collection):
         """Test collection operations"""
@@ -260,113 +374,74 @@ class TestChromaLensClient:
             except Exception as e:
                 logger.warning(f"Could not get collection by ID: {e}")
     
-    def test_add_and_query_documents(self, client, test_tenant, test_database, test_collection):
+    def test_add_and_query_documents(self, client, test_tenant, test_database, test_collection, sample_ids, sample_embeddings):
         """Test adding and querying documents"""
-        # Generate test data
-        documents = SAMPLE_DOCUMENTS
-        metadatas = SAMPLE_METADATA
-        ids = [f"doc_{i+1}" for i in range(len(documents))]
-        
-        # Create some sample embeddings (random for testing)
-        # In a real scenario, you would use proper embedding models
-        import numpy as np
-        np.random.seed(42)  # For reproducibility
-        dimension = 384
-        embeddings = [np.random.rand(dimension).tolist() for _ in range(len(documents))]
+        ids = sample_ids
+        embeddings = sample_embeddings[:len(ids)]
         
-        # Add documents
-        logger.info(f"Adding {len(documents)} documents to collection {test_collection}")
-        result = client.add(
+        # The add succeeded once all IDs are visible
+        items = client.get_items(
             collection_id=test_collection,
-            embeddings=embeddings,
-            documents=documents,
-            metadatas=metadatas,
             ids=ids,
             tenant=test_tenant,
             database=test_database
         )
-        logger.info(f"Add result: {result}")
-        
-        # Wait for documents to be indexed
-        time.sleep(1)
+        assert sorted(items["ids"]) == sorted(ids), "Added documents were not found"
+        logger.info("Successfully added all documents")
         
-        # Get all documents
-        logger.info(f"Retrieving documents from collection {test_collection}")
-        items = client.get(
-            collection_id=test_collection,
-            tenant=test_tenant,
-            database=test_database,
-            include=["documents", "metadatas", "embeddings"]
-        )
-        
-        # Verify documents were added correctly
-        assert "ids" in items
-        assert len(items["ids"]) == len(ids)
-        assert set(items["ids"]) == set(ids)
-        assert "documents" in items
-        assert len(items["documents"]) == len(documents)
-        logger.info("Successfully retrieved all documents")
-        
-        # Query for similar documents
-        logger.info("Testing vector query")
-        query_results = client.query(
-            collection_id=test_collection,
-            query_embeddings=[embeddings[0]],  # Query with the first embedding
-            n_results=3,
-            tenant=test_tenant,
-            database=test_database,
-            include=["documents", "metadatas", "distances"]
-        )
+        # Query for similar documents, with and without a filter; the two queries
+        # are independent, so they share the connection pool concurrently
+        logger.info("Testing vector query and filtered query")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            query_future = executor.submit(
+                client.query,
+                collection_id=test_collection,
+                query_embeddings=[embeddings[0]],  # Query with the first embedding
+                n_results=3,
+                tenant=test_tenant,
+                database=test_database,
+                include=["documents", "metadatas", "distances"]
+            )
+            filtered_future = executor.submit(
+                client.query,
+                collection_id=test_collection,
+                query_embeddings=[embeddings[0]],
+                n_results=3,
+                where={"category": "definition"},
+                tenant=test_tenant,
+                database=test_database,
+                include=["documents", "metadatas", "distances"]
+            )
+        query_results = query_future.result()
+        filtered_results = filtered_future.result()
         
         # Verify query results
         assert "ids" in query_results
         assert len(query_results["ids"]) == 1  # One query
         assert len(query_results["ids"][0]) <= 3  # Up to 3 results
+        assert query_results["ids"][0][0] == ids[0]  # The query embedding's own document
         assert "documents" in query_results
         assert "distances" in query_results
         logger.info(f"Query returned {len(query_results['ids'][0])} results")
         
-        # Test filter query
-        logger.info("Testing filtered query")
-        filtered_results = client.query(
-            collection_id=test_collection,
-            query_embeddings=[embeddings[0]],
-            n_results=3,
-            where={"category": "definition"},
-            tenant=test_tenant,
-            database=test_database,
-            include=["documents", "metadatas", "distances"]
-        )
-        
         # Verify filtered results
         assert "ids" in filtered_results
-        if filtered_results["ids"][0]:
-            logger.info(f"Filtered query returned {len(filtered_results['ids'][0])} results")
-            # Verify filter was applied
-            for i, doc_id in enumerate(filtered_results["ids"][0]):
-                metadata = filtered_results["metadatas"][0][i]
-                assert metadata["category"] == "definition"
-        else:
-            logger.info("Filtered query returned no results")
+        assert all(m["category"] == "definition" for m in filtered_results["metadatas"][0])
+        logger.info(f"Filtered query returned {len(filtered_results['ids'][0])} results")
     
-    def test_update_and_delete(self, client, test_tenant, test_database, test_collection):
+    def test_update_and_delete(self, client, test_tenant, test_database, test_collection, created_ids, sample_embeddings):
         """Test updating and deleting documents"""
-        # Add a document
+        # Add a document of this test's own, so the shared sample documents stay untouched
         document = "This is a test document to update"
         metadata = {"source": "test", "status": "new"}
         doc_id = "update_test_doc"
         
-        # Create a sample embedding (random for testing)
-        import numpy as np
-        np.random.seed(42)
-        dimension = 384
-        embedding = np.random.rand(dimension).tolist()
-        
-        # Add document
-        logger.info(f"Adding document for update test")
-        client.add(
+        logger.info("Adding document for update test")
+        created_ids.append(doc_id)
+        bulk_add(
+            client,
             collection_id=test_collection,
-            embeddings=[embedding],
+            embeddings=sample_embeddings[len(SAMPLE_DOCUMENTS):len(SAMPLE_DOCUMENTS) + 1],
             documents=[document],
             metadatas=[metadata],
             ids=[doc_id],
@@ -375,15 +450,20 @@ class TestChromaLensClient:
         )
         
         # Wait for document to be indexed
-        time.sleep(1)
+        _wait_for(lambda: len(client.get_items(
+            collection_id=test_collection,
+            ids=[doc_id],
+            tenant=test_tenant,
+            database=test_database
+        )["ids"]) == 1)
         
         # Update document
         updated_document = "This is an updated test document"
         updated_metadata = {"source": "test", "status": "updated"}
-        updated_embedding = np.random.rand(dimension).tolist()
+        updated_embedding = sample_embeddings[len(SAMPLE_DOCUMENTS) + 1]
         
         logger.info(f"Updating document")
-        client.update(
+        client.update_items(
             collection_id=test_collection,
             embeddings=[updated_embedding],
             documents=[updated_document],
@@ -394,10 +474,16 @@ class TestChromaLensClient:
         )
         
         # Wait for update to be processed
-        time.sleep(1)
+        _wait_for(lambda: client.get_items(
+            collection_id=test_collection,
+            ids=[doc_id],
+            tenant=test_tenant,
+            database=test_database,
+            include=["metadatas"]
+        )["metadatas"][0].get("status") == "updated")
         
         # Get updated document
-        updated_item = client.get(
+        updated_item = client.get_items(
             collection_id=test_collection,
             ids=[doc_id],
             tenant=test_tenant,
@@ -412,7 +498,7 @@ class TestChromaLensClient:
         
         # Delete document
         logger.info("Testing document deletion")
-        client.delete(
+        client.delete_items(
             collection_id=test_collection,
             ids=[doc_id],
             tenant=test_tenant,
@@ -420,10 +506,15 @@ class TestChromaLensClient:
         )
         
         # Wait for deletion to be processed
-        time.sleep(1)
+        _wait_for(lambda: len(client.get_items(
+            collection_id=test_collection,
+            ids=[doc_id],
+            tenant=test_tenant,
+            database=test_database
+        )["ids"]) == 0)
         
         # Verify deletion
-        deleted_check = client.get(
+        deleted_check = client.get_items(
             collection_id=test_collection,
             ids=[doc_id],
             tenant=test_tenant,
@@ -0,0 +1,134 @@
+"""
+Unit tests for the base client.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from chromalens.client import base
+from chromalens.client.base import BaseClient, _encode_json
+from chromalens.exceptions import _backoff
+from chromalens.exceptions._backoff import MAX_BUCKETS, TokenBucket
+from chromalens.exceptions.api import (
+    APIError,
+    AuthenticationError,
+    ConflictError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+    from_status,
+)
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code, url="http://localhost:8008/api/v2/heartbeat", headers=None):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers or {}
+        self.text = ""
+
+    def json(self):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def clear_buckets():
+    """Start every test with no shared backoff state"""
+    _backoff._buckets.clear()
+    yield
+    _backoff._buckets.clear()
+
+
+class TestFromStatus:
+    """Test suite for the status code to exception mapping"""
+
+    @pytest.mark.parametrize("status, exc_class", [
+        (400, ValidationError),
+        (401, AuthenticationError),
+        (403, AuthenticationError),
+        (404, NotFoundError),
+        (409, ConflictError),
+        (422, ValidationError),
+        (429, RateLimitError),
+        (500, ServerError),
+        (503, ServerError),
+        (418, APIError),
+    ])
+    def test_mapping(self, status, exc_class):
+        """Test that each status builds its exception class with that status"""
+        exc = from_status(status, "failed")
+
+        assert type(exc) is exc_class
+        assert exc.status_code == status
+
+    def test_client_raises_mapped_error(self):
+        """Test that the client raises the mapped error with the detail message"""
+        response = _FakeResponse(404)
+        response.json = lambda: {"detail": "no such collection"}
+
+        with pytest.raises(NotFoundError, match="no such collection"):
+            BaseClient()._validate_response(response)
+
+
+class TestRateLimitHandling:
+    """Test suite for the adaptive backoff on 429 responses"""
+
+    def test_exception_leaves_shared_state_alone(self):
+        """Test that building a RateLimitError records nothing"""
+        exc = RateLimitError("slow down", response=_FakeResponse(429))
+
+        assert exc.bucket is None
+        assert len(_backoff._buckets) == 0
+
+    def test_client_attaches_bucket(self):
+        """Test that a 429 seen by the client is recorded for its endpoint"""
+        client = BaseClient()
+
+        with pytest.raises(RateLimitError) as info:
+            client._validate_response(_FakeResponse(429, headers={'Retry-After': '2'}))
+
+        assert info.value.bucket is TokenBucket.get(("localhost:8008", "/api/v2/heartbeat"))
+        assert info.value.next_retry_delay(jitter=0) >= 2
+
+    def test_bucket_map_is_bounded(self):
+        """Test that the least recently used endpoints are evicted"""
+        for i in range(MAX_BUCKETS + 10):
+            TokenBucket.observe_429(("localhost", f"/path/{i}"))
+
+        assert len(_backoff._buckets) == MAX_BUCKETS
+        assert ("localhost", "/path/0") not in _backoff._buckets
+
+
+class TestEncodeJson:
+    """Test suite for request body encoding"""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def encoder(self, request, monkeypatch):
+        """Run each test with and without orjson"""
+        if request.param == "stdlib":
+            monkeypatch.setattr(base, "orjson", None)
+        elif base.orjson is None:
+            pytest.skip("orjson is not installed")
+        return request.param
+
+    def test_numpy_arrays(self, encoder):
+        """Test that NumPy arrays encode like the equivalent lists"""
+        body = {"embeddings": np.array([[0.5, 1.0]], dtype=np.float32), "ids": ["a"]}
+
+        assert json.loads(_encode_json(body)) == {"embeddings": [[0.5, 1.0]], "ids": ["a"]}
+
+    @pytest.mark.parametrize("value", [
+        float("nan"),
+        [[1.0, float("inf")]],
+        np.array([1.0, np.nan]),
+        np.array([[-np.inf]], dtype=np.float32),
+    ])
+    def test_non_finite_rejected(self, encoder, value):
+        """Test that NaN and infinity are rejected by both encoders"""
+        with pytest.raises(ValueError, match="NaN or infinite"):
+            _encode_json({"embeddings": value})
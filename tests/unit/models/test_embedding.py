@@ -0,0 +1,79 @@
+"""
+Unit tests for the embedding request models.
+"""
+
+import uuid
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from chromalens.models.embedding import AddRequest, UpsertRequest
+
+
+class TestAddRequestEmbeddings:
+    """Test suite for AddRequest embeddings validation"""
+
+    def test_stored_as_float32_array(self):
+        """Test that embeddings become one contiguous float32 array"""
+        request = AddRequest(ids=["a", "b"], embeddings=[[1, 2], [3.5, 4]])
+
+        assert request.embeddings.dtype == np.float32
+        assert request.embeddings.flags['C_CONTIGUOUS']
+        assert request.embeddings.tolist() == [[1.0, 2.0], [3.5, 4.0]]
+
+    def test_float32_overflow_rejected(self):
+        """Test that finite values beyond the float32 range are rejected, not sent as inf"""
+        with pytest.raises(ValidationError, match="must fit in float32"):
+            AddRequest(ids=["a"], embeddings=[[1e300, 1.0]])
+
+    @pytest.mark.parametrize("embeddings", [[[None, 1.0]], [["1", "2"]], [[1.0], [1.0, 2.0]], []])
+    def test_invalid_embeddings(self, embeddings):
+        """Test that None, strings, ragged and empty embeddings are rejected"""
+        with pytest.raises(ValidationError):
+            AddRequest(ids=["a"], embeddings=embeddings)
+
+
+class TestBinaryRoundTrip:
+    """Test suite for the to_binary/from_binary packing"""
+
+    def test_uuid_ids(self):
+        """Test that canonical UUID ids are packed as bytes and read back unchanged"""
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        request = AddRequest(
+            ids=ids,
+            embeddings=np.arange(6, dtype=np.float32).reshape(3, 2),
+            documents=["a", "b", "c"],
+        )
+
+        buf = request.to_binary()
+        restored = AddRequest.from_binary(buf)
+
+        assert ids[0].encode() not in buf
+        assert restored.ids == ids
+        assert restored.documents == ["a", "b", "c"]
+        np.testing.assert_array_equal(restored.embeddings, request.embeddings)
+
+    @pytest.mark.parametrize("ids", [
+        ["doc-1", "doc-2"],
+        [str(uuid.uuid4()), "doc-2"],
+        [str(uuid.uuid4()).upper(), str(uuid.uuid4())],
+    ])
+    def test_other_ids_stay_strings(self, ids):
+        """Test that plain, mixed and non-canonical UUID ids round-trip exactly"""
+        request = UpsertRequest(ids=ids, embeddings=[[0.5, 1.5], [2.5, 3.5]], metadatas=[{"k": 1}, {}])
+
+        restored = UpsertRequest.from_binary(request.to_binary())
+
+        assert restored.ids == ids
+        assert restored.metadatas == [{"k": 1}, {}]
+        np.testing.assert_array_equal(restored.embeddings, request.embeddings)
+
+    def test_without_ids(self):
+        """Test a request whose ids are left for the server to generate"""
+        request = AddRequest(embeddings=[[1.0, 2.0, 3.0]])
+
+        restored = AddRequest.from_binary(request.to_binary())
+
+        assert restored.ids is None
+        assert restored.embeddings.shape == (1, 3)
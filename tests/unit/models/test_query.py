@@ -0,0 +1,46 @@
+"""
+Unit tests for the query models.
+"""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from chromalens.models.query import QueryResponse
+
+
+class TestQueryResponse:
+    """Test suite for QueryResponse"""
+
+    def test_distances_round_trip_exactly(self):
+        """Test that server distances read back and serialize unchanged"""
+        response = QueryResponse(ids=[["a", "b"]], distances=[[0.1, 0.3]])
+
+        assert response.distances.dtype == np.float64
+        assert [r.distance for r in response.get_results()] == [0.1, 0.3]
+        assert '"distances":[[0.1,0.3]]' in response.model_dump_json()
+
+    def test_embeddings_round_trip_exactly(self):
+        """Test that returned embeddings keep their values"""
+        response = QueryResponse(ids=[["a"]], embeddings=[[[0.1, 0.2]]])
+
+        assert response.get_results()[0].embedding == [0.1, 0.2]
+
+    def test_ragged_results(self):
+        """Test queries that returned different numbers of results"""
+        response = QueryResponse(ids=[["a"], ["b", "c"]], distances=[[0.5], [0.1, 0.2]])
+
+        assert [r.distance for r in response.get_results(1)] == [0.1, 0.2]
+
+    @pytest.mark.parametrize("distances", [5, [[None]], {"a": 1}, [["x"]], [[[1.0]]]])
+    def test_invalid_distances(self, distances):
+        """Test that scalars, None, non-numbers and wrong shapes are rejected"""
+        with pytest.raises(ValidationError):
+            QueryResponse(ids=[["a"]], distances=distances)
+
+    def test_short_column(self):
+        """Test that a column shorter than the IDs is reported, not truncated"""
+        response = QueryResponse(ids=[["a", "b"]], documents=[["only one"]])
+
+        with pytest.raises(ValueError):
+            response.get_results()
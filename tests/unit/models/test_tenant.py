@@ -0,0 +1,35 @@
+"""
+Unit tests for the tenant models.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from chromalens.models.tenant import TenantCreate, TenantUpdateRequest
+
+
+class TestTenantCreate:
+    """Test suite for TenantCreate"""
+
+    def test_name_is_not_rewritten(self):
+        """Test that surrounding whitespace is kept, as for database and collection names"""
+        assert TenantCreate(name=" t1 ").name == " t1 "
+
+    @pytest.mark.parametrize("name", ["", "   ", "x" * 65])
+    def test_invalid_name(self, name):
+        """Test that empty, blank and overlong names are rejected"""
+        with pytest.raises(ValidationError):
+            TenantCreate(name=name)
+
+
+class TestTenantUpdateRequest:
+    """Test suite for TenantUpdateRequest"""
+
+    def test_name_is_optional(self):
+        """Test that the new name may be omitted"""
+        assert TenantUpdateRequest().new_name is None
+
+    def test_blank_name(self):
+        """Test that a blank new name is rejected"""
+        with pytest.raises(ValidationError, match="Tenant name cannot be empty"):
+            TenantUpdateRequest(new_name="  ")
@@ -0,0 +1,233 @@
+"""
+Unit tests for the embedding function utilities.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from chromalens.utils import embedding_functions
+from chromalens.utils.embedding_functions import (
+    DefaultEmbeddingFunction,
+    EmbeddingFunction,
+    HuggingFaceEmbeddingFunction,
+    _map_batches,
+    cosine_similarity,
+    cosine_similarity_batch,
+    euclidean_distance,
+    euclidean_distance_batch,
+)
+
+
+class _CountingEmbeddingFunction(EmbeddingFunction):
+    """Embeds a text as [len(text), call number] and records each batch"""
+
+    def __init__(self, cache_size=256):
+        super().__init__(cache_size=cache_size)
+        self.batches = []
+
+    def _embed(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), float(len(self.batches))] for text in texts]
+
+
+class TestEmbeddingFunctionCache:
+    """Test suite for the EmbeddingFunction cache and de-duplication"""
+
+    def test_cache_hit_skips_provider(self):
+        """Test that repeated texts are embedded once across calls"""
+        fn = _CountingEmbeddingFunction()
+
+        first = fn(["a", "bb"])
+        second = fn(["bb", "a", "ccc"])
+
+        assert fn.batches == [["a", "bb"], ["ccc"]]
+        assert second[:2] == [first[1], first[0]]
+
+    def test_mutating_result_does_not_corrupt_cache(self):
+        """Test that results are copies of the cached vectors"""
+        fn = _CountingEmbeddingFunction()
+
+        first = fn(["a", "a"])
+        first[0][0] = 99.0
+
+        assert first[1] == [1.0, 1.0]
+        assert fn(["a"]) == [[1.0, 1.0]]
+
+    def test_duplicates_without_cache_are_distinct(self):
+        """Test that duplicate texts get separate lists with caching disabled"""
+        fn = _CountingEmbeddingFunction(cache_size=0)
+
+        result = fn(["a", "a"])
+        result[0].append(0.0)
+
+        assert fn.batches == [["a"]]
+        assert result[1] == [1.0, 1.0]
+
+
+class TestMapBatches:
+    """Test suite for the batch dispatcher"""
+
+    def test_sequential_by_default(self):
+        """Test that concurrency 1 sends every batch from the calling thread"""
+        threads = set()
+
+        def embed(batch):
+            threads.add(threading.get_ident())
+            return [[float(len(text))] for text in batch]
+
+        result = _map_batches(embed, ["a", "bb", "ccc"], batch_size=1, max_concurrency=1)
+
+        assert result == [[1.0], [2.0], [3.0]]
+        assert threads == {threading.get_ident()}
+
+    def test_concurrent_keeps_order(self):
+        """Test that opting into concurrency keeps the input order"""
+        def embed(batch):
+            return [[float(len(text))] for text in batch]
+
+        result = _map_batches(embed, ["a", "bb", "ccc", "dddd"], batch_size=1, max_concurrency=4)
+
+        assert result == [[1.0], [2.0], [3.0], [4.0]]
+
+
+class TestDefaultEmbeddingFunction:
+    """Test suite for the all-zeros DefaultEmbeddingFunction"""
+
+    def test_zero_vectors_are_independent(self):
+        """Test that each text gets its own zero vector"""
+        fn = DefaultEmbeddingFunction(dimension=3)
+
+        result = fn(["a", "b"])
+        result[0][0] = 1.0
+
+        assert result[1] == [0.0, 0.0, 0.0]
+        assert fn(["c"]) == [[0.0, 0.0, 0.0]]
+
+
+class TestHuggingFacePrecision:
+    """Test suite for the HuggingFaceEmbeddingFunction output precision"""
+
+    @pytest.fixture
+    def make_fn(self, monkeypatch):
+        """Build the function around a fake model returning fixed float32 rows"""
+        monkeypatch.setattr(embedding_functions, "_require", lambda *args: None)
+        rows = np.array([[0.5, -1.0, 0.25], [2.0, 0.0, -0.5]], dtype=np.float32)
+
+        def make(precision):
+            fn = HuggingFaceEmbeddingFunction(precision=precision, cache_size=0)
+            monkeypatch.setattr(fn, "_encode_raw", lambda texts: rows[:len(texts)])
+            return fn
+
+        return make
+
+    @pytest.mark.parametrize("precision", ["float32", "float16", "int8"])
+    def test_encode_matrix_dtype(self, make_fn, precision):
+        """Test that encode_matrix returns arrays in the requested dtype"""
+        fn = make_fn(precision)
+
+        assert fn.encode_matrix(["a", "b"]).dtype == np.dtype(precision)
+        assert fn.encode_matrix([]).dtype == np.dtype(precision)
+
+    @pytest.mark.parametrize("precision", ["float16", "int8"])
+    def test_lists_keep_model_values(self, make_fn, precision):
+        """Test that list results are not rounded through the output precision"""
+        fn = make_fn(precision)
+
+        assert fn(["a"]) == [[0.5, -1.0, 0.25]]
+
+
+class TestCosineSimilarity:
+    """Test suite for the scalar cosine similarity"""
+
+    @pytest.mark.parametrize("scale", [1e-30, 1.0, 1e30, 1e200])
+    def test_extreme_magnitudes(self, scale):
+        """Test that tiny and huge vectors neither underflow nor overflow"""
+        result = cosine_similarity([scale, scale], [scale, 0.0])
+
+        assert result == pytest.approx(2 ** -0.5)
+
+    def test_float32_extreme_magnitudes(self):
+        """Test float32 inputs whose squared norms would leave the float32 range"""
+        tiny = np.array([1e-30, 1e-30], dtype=np.float32)
+        huge = np.array([1e30, 0.0], dtype=np.float32)
+
+        assert cosine_similarity(tiny, huge) == pytest.approx(2 ** -0.5, rel=1e-6)
+
+    def test_large_integers(self):
+        """Test that integers above 2**24 are not collapsed by a float32 cast"""
+        result = cosine_similarity([16777217, -16777216], [16777216, -16777217])
+
+        assert result < 1.0
+
+    def test_zero_vector(self):
+        """Test that a zero vector scores 0"""
+        assert cosine_similarity([0, 0], [1, 2]) == 0.0
+
+
+class TestCosineSimilarityBatch:
+    """Test suite for the batched cosine similarity"""
+
+    def test_matches_scalar(self):
+        """Test the batch kernel against the scalar function"""
+        rng = np.random.default_rng(2)
+        a = rng.normal(size=(3, 8))
+        b = rng.normal(size=(4, 8))
+
+        expected = [[cosine_similarity(x, y) for y in b] for x in a]
+        np.testing.assert_allclose(cosine_similarity_batch(a, b), expected, rtol=1e-12)
+
+    def test_zero_and_extreme_rows(self):
+        """Test that zero rows score 0 and tiny or huge rows stay finite"""
+        a = np.array([[0.0, 0.0], [1e-30, 1e-30], [1e200, 1e200]])
+        b = np.array([[1.0, 0.0], [0.0, 0.0]])
+
+        result = cosine_similarity_batch(a, b)
+
+        np.testing.assert_allclose(result, [[0.0, 0.0], [2 ** -0.5, 0.0], [2 ** -0.5, 0.0]])
+
+    def test_float32_rows(self):
+        """Test float32 rows whose squared norms would overflow in float32"""
+        a = np.full((2, 3), 1e30, dtype=np.float32)
+        b = np.ones((1, 3), dtype=np.float32)
+
+        result = cosine_similarity_batch(a, b)
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, 1.0, rtol=1e-6)
+
+
+class TestEuclideanDistance:
+    """Test suite for the Euclidean distance kernels"""
+
+    def test_batch_matches_pairwise(self):
+        """Test the batch kernel against a direct pairwise computation"""
+        rng = np.random.default_rng(0)
+        a = rng.random((5, 16))
+        b = rng.random((7, 16))
+
+        expected = np.linalg.norm(a[:, None, :] - b[None, :, :], axis=2)
+        np.testing.assert_allclose(euclidean_distance_batch(a, b), expected, rtol=1e-12)
+
+    def test_batch_close_vectors(self):
+        """Test that nearby vectors keep their small distance instead of cancelling to 0"""
+        rng = np.random.default_rng(1)
+        a = rng.random((4, 384)).astype(np.float32)
+        b = a.copy()
+        b[:, 0] += np.float32(0.001)
+
+        distances = euclidean_distance_batch(a, b)
+
+        np.testing.assert_allclose(np.diag(distances), 0.001, rtol=1e-3)
+
+    def test_batch_dtype_follows_inputs(self):
+        """Test that only float32 inputs give a float32 result"""
+        a32 = np.ones((2, 3), dtype=np.float32)
+
+        assert euclidean_distance_batch(a32, a32).dtype == np.float32
+        assert euclidean_distance_batch([[1, 2, 3]], a32).dtype == np.float64
+
+    def test_scalar_large_integers(self):
+        """Test that integers beyond float32 precision are still distinguished"""
+        assert euclidean_distance([16777217, 0], [16777216, 0]) == pytest.approx(1.0)
@@ -0,0 +1,33 @@
+"""
+Unit tests for the formatting utilities.
+"""
+
+import time
+
+import pytest
+
+from chromalens.utils.formatters import format_timestamp
+
+
+class TestFormatTimestamp:
+    """Test suite for format_timestamp"""
+
+    @pytest.mark.parametrize("scale", [1, 1000, 1000000, 1000000000])
+    def test_units_detected_by_magnitude(self, scale):
+        """Test that seconds, ms, µs and ns give the same date"""
+        seconds = 1700000000
+        expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+        assert format_timestamp(seconds * scale) == expected
+
+    def test_fractional_seconds(self):
+        """Test that fractions of a second are dropped"""
+        assert format_timestamp(1700000000.9) == format_timestamp(1700000000)
+
+    def test_alternating_timestamps(self):
+        """Test that interleaved calls each format their own timestamp"""
+        first = format_timestamp(1700000000)
+        second = format_timestamp(1700003600)
+
+        assert first != second
+        assert format_timestamp(1700000000) == first
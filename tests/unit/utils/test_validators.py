@@ -0,0 +1,129 @@
+"""
+Unit tests for the validation utilities.
+"""
+
+import enum
+
+import numpy as np
+import pytest
+
+from chromalens.utils.validators import (
+    make_schema_validator,
+    validate_add_payload,
+    validate_ids,
+    validate_not_empty,
+)
+
+
+class _Color(str, enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class TestValidateIds:
+    """Test suite for validate_ids"""
+
+    def test_plain_strings(self):
+        """Test that unique strings pass"""
+        ids = ["a", "b"]
+
+        assert validate_ids(ids) is ids
+
+    def test_str_subclasses(self):
+        """Test that str subclasses such as numpy.str_ and str enums pass"""
+        validate_ids([np.str_("a"), np.str_("b")])
+        validate_ids([_Color.RED, _Color.BLUE])
+
+    def test_non_string(self):
+        """Test that a non-string ID is reported with its index"""
+        with pytest.raises(ValueError, match="found int at index 1"):
+            validate_ids(["a", 1])
+
+    def test_duplicate(self):
+        """Test that a repeated ID is reported with its index"""
+        with pytest.raises(ValueError, match="duplicate 'a' at index 2"):
+            validate_ids(["a", "b", "a"])
+
+
+class TestValidateNotEmpty:
+    """Test suite for validate_not_empty"""
+
+    @pytest.mark.parametrize("value", ["", [], {}, set(), ()])
+    def test_empty_containers(self, value):
+        """Test that empty strings and containers are rejected"""
+        with pytest.raises(ValueError, match="x cannot be empty"):
+            validate_not_empty(value, "x")
+
+    def test_none(self):
+        """Test that None is rejected"""
+        with pytest.raises(ValueError, match="x cannot be None"):
+            validate_not_empty(None, "x")
+
+    @pytest.mark.parametrize("value", ["a", [0], 0, b"", bytearray()])
+    def test_other_values_pass(self, value):
+        """Test that non-empty values and types outside the checked set pass"""
+        assert validate_not_empty(value, "x") is value
+
+
+class TestValidateAddPayload:
+    """Test suite for validate_add_payload"""
+
+    def test_valid_payload(self):
+        """Test that matching lists pass"""
+        validate_add_payload(
+            ["a", "b"],
+            embeddings=[[1.0, 2.0], [3.0, 4.0]],
+            documents=["x", "y"],
+            metadatas=[{"k": 1}, {}],
+            dimension=2,
+        )
+
+    @pytest.mark.parametrize("kwargs, message", [
+        ({"documents": ["x"]}, "length"),
+        ({"documents": ["x", 1]}, "documents"),
+        ({"metadatas": [{}, []]}, r"metadatas\[1\] must be a dictionary"),
+        ({"embeddings": [[1.0], [2.0]], "dimension": 2}, "dimension"),
+    ])
+    def test_invalid_payload(self, kwargs, message):
+        """Test that bad lengths, documents, metadatas and dimensions are reported"""
+        with pytest.raises(ValueError, match=message):
+            validate_add_payload(["a", "b"], **kwargs)
+
+
+class TestMakeSchemaValidator:
+    """Test suite for the generated per-schema validators"""
+
+    def test_valid_payload(self):
+        """Test that lists and arrays matching the schema pass"""
+        validator = make_schema_validator(2, ("source",))
+
+        validator(["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+        validator(["a"], np.ones((1, 2), dtype=np.float32), [{"source": "x", "extra": 1}])
+
+    def test_cached_per_schema(self):
+        """Test that one validator is built per schema"""
+        assert make_schema_validator(3) is make_schema_validator(3)
+        assert make_schema_validator(3) is not make_schema_validator(3, ("k",))
+
+    @pytest.mark.parametrize("ids, embeddings, metadatas, message", [
+        ([], [], None, "ids cannot be empty"),
+        (["a"], [[1.0, 2.0], [3.0, 4.0]], None, "embeddings has length 2"),
+        (["a", "a"], [[1.0, 2.0], [3.0, 4.0]], None, "duplicate"),
+        (["a"], [[1.0, 2.0, 3.0]], None, "dimension"),
+        (["a"], [[1.0, 2.0]], [{}, {}], "metadatas has length 2"),
+        (["a"], [[1.0, 2.0]], [[]], r"metadatas\[0\] must be a dictionary"),
+        (["a"], [[1.0, 2.0]], [{"other": 1}], "missing required key 'source'"),
+        (["a"], [[1.0, 2.0]], [{"source": 1, 2: 3}], "must be strings"),
+    ])
+    def test_invalid_payload(self, ids, embeddings, metadatas, message):
+        """Test that each kind of invalid payload is reported"""
+        validator = make_schema_validator(2, ("source",))
+
+        with pytest.raises(ValueError, match=message):
+            validator(ids, embeddings, metadatas)
+
+    @pytest.mark.parametrize("dimension, meta_keys", [(0, None), (2.0, None), (2, (1,))])
+    def test_invalid_schema(self, dimension, meta_keys):
+        """Test that bad dimensions and metadata keys are rejected up front"""
+        with pytest.raises(ValueError):
+            make_schema_validator(dimension, meta_keys)